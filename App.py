@@ -17,9 +17,10 @@ from VDU import (
 )
 
 from VNF import VNF
-import yaml
+from Descriptor import read_vnfd, write_vnfd
+from DescriptorCache import DescriptorCache
+import Profiling
 import webbrowser
-from nested_lookup import nested_lookup
 
 from paramiko import SSHClient, AutoAddPolicy
 
@@ -27,6 +28,8 @@ root = ttk.Window(themename="sandstone", title="OSM VNF Descriptor Generator")
 root.resizable(width=False, height=False)
 
 vnf = VNF()
+# descriptors opened before are unpickled instead of parsed again.
+descriptor_cache = DescriptorCache(Path.home() / ".cache" / "py-osmgs" / "vnfd")
 cloud_init_files = list()
 cloud_init_files_names = list()
 
@@ -139,11 +142,9 @@ def to_modification():
 
 
 def load_vnf():
+    global vnf
     try:
-        description_file = open(vnfd_file_path.get(), "r")
-        vnf_description = yaml.load(description_file, yaml.Loader)
-        description = nested_lookup(key="vnfd", document=vnf_description)[0]
-        vnf.load(description)
+        vnf = read_vnfd(vnfd_file_path.get(), cache=descriptor_cache)
         vnf.visualization()
         file_path = Path(os.path.abspath(f"./{vnf.id}.html"))
         webbrowser.open(url=file_path.as_uri(), new=0)
@@ -340,11 +341,9 @@ def add_scaling_aspect():
     try:
         telemtry = scaling_telemetry_selections.get(scaling_telemetry_selections.curselection())
         vdu_to_scale = None
-        for vdu in vnf.vdus:
-            for metric in vdu.telemetries:
-                if metric.id == telemtry:
-                    vdu_to_scale = vdu.id
-                    break
+        vdu = vnf.get_telemetry_VDU(telemtry)
+        if vdu is not None:
+            vdu_to_scale = vdu.id
         vnf.addScalingAspect(
             id=aspect_id.get(),
             max_scale_level=int(max_scale_level.get()),
@@ -405,8 +404,7 @@ def to_final():
         page_3.pack_forget()
         page_4.pack(fill=BOTH, expand=True)
         os.makedirs(Path().resolve() / f"{vnf.id}",exist_ok=True)
-        with open(Path().resolve() / f"{vnf.id}/{vnf.id}_vnfd.yaml", "w+") as yaml_file:
-            yaml.dump(data=vnf.yaml_repr(),stream=yaml_file)
+        write_vnfd(vnf, Path().resolve() / f"{vnf.id}/{vnf.id}_vnfd.yaml")
         with open(Path().resolve() / f"{vnf.id}/{vnf.id}_vnfd.yaml", "r") as yaml_file:
             vnfd.delete("1.0",END)
             vnfd.insert(END,yaml_file.read())
@@ -942,4 +940,12 @@ ttk.Button(
     master=page_4, text="<Back", style=INFO, command=to_scaling_aspect, width=10
 ).pack(side=RIGHT, padx=5, pady=5, anchor=NW)
 
+# OSMGS_PROFILE=report.json profiles the session, the Chrome trace goes to report.trace.json.
+profile_path = os.environ.get("OSMGS_PROFILE")
+if profile_path:
+    Profiling.enable(trace=True)
 root.mainloop()
+if profile_path:
+    profiler = Profiling.disable()
+    profiler.write_json(profile_path)
+    profiler.write_chrome_trace(Path(profile_path).with_suffix(".trace.json"))
@@ -0,0 +1,53 @@
+"""Cost of an AddressPool update against the number of free ranges.
+
+Fragments a /8 pool into a given number of free ranges, every other address
+allocated, then times releasing and allocating again an address in the middle
+of the pool, which merges three ranges into one and splits it back:
+
+    python benchmarks/address_pool_benchmark.py --ranges 10 1000 100000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src" / "py-osmgs"
+
+
+def fragmented_pool(num_ranges: int):
+    """Build a pool of 10.0.0.0/8 with num_ranges free ranges, get it with an allocated middle address."""
+    from Addressing import AddressPool
+
+    pool = AddressPool("10.0.0.0/8")
+    addresses = pool.allocate_many(2 * num_ranges)
+    # the odd addresses are freed one by one, the last range is the rest of the network.
+    for address in addresses[1::2]:
+        pool.release(address)
+    return pool, addresses[2 * (num_ranges // 2)]
+
+
+def measure(num_ranges: int, repeat: int) -> float:
+    """Get the mean seconds of one release or allocate of a middle address."""
+    pool, address = fragmented_pool(num_ranges)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pool.release(address)
+        pool.allocate(address)
+    return (time.perf_counter() - start) / (2 * repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--src", default=str(SRC), help="directory holding Addressing.py")
+    parser.add_argument("--ranges", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.src)
+    for num_ranges in args.ranges:
+        per_update = measure(num_ranges, args.repeat)
+        print(f"{num_ranges:>8} free ranges: {per_update * 1e6:8.1f} us per update")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""Time and peak memory of the VNF load, mutate and serialize paths.
+
+Builds synthetic VNFs of several sizes and runs every case on a fresh copy:
+loading the description, a batch of add_VDU, add_ExternalConnectionPoint,
+assign_IP_vdu_interface, addScalingAspect and remove_VDU calls, yaml_repr
+with the dump, and the visualization. Mutating cases run a fixed number of
+calls, so their time shows how one call scales with the VNF size.
+
+Every run is compared with benchmarks/baseline.json, or the file given with
+--baseline; a case slower or bigger than the baseline by more than the
+threshold is a regression and makes the run exit with status 1. The baseline
+records the Python version and the machine it was measured on, timings of
+another machine are only indicative. Save a new one on the reference machine
+after an intended change:
+
+    python benchmarks/benchmark_suite.py --save benchmarks/baseline.json
+    python benchmarks/benchmark_suite.py --threshold 0.2
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from ipaddress import ip_address
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from memory_benchmark import SRC, synthetic_description
+
+# calls made by every mutating case
+BATCH = 100
+
+# network of the internal virtual link, large enough for 3 interfaces of 5000 VDUs.
+NETWORK = "10.0.0.0/16"
+
+# baseline committed with the suite
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def benchmark_description(num_vdus: int) -> dict:
+    """Build a synthetic VNF description whose internal virtual link has an address plan."""
+    description = synthetic_description(num_vdus)
+    description["df"][0]["virtual-link-profile"] = [
+        {
+            "flavour": {
+                "id": "internal",
+                "virtual-link-protocol-data": {
+                    "l3-protocol-data": {
+                        "cidr": NETWORK,
+                        "dhcp-enabled": True,
+                        "gateway-ip": "10.0.0.1",
+                        "ip-version": "ipv4",
+                    }
+                },
+            }
+        }
+    ]
+    return description
+
+
+def load(description: dict):
+    from VNF import VNF
+
+    vnf = VNF()
+    vnf.load(description)
+    return vnf
+
+
+def case_load(description: dict) -> Tuple[Callable, Callable]:
+    return (lambda: None), (lambda _: load(description))
+
+
+def case_add_vdu(description: dict) -> Tuple[Callable, Callable]:
+    def run(vnf):
+        for i in range(BATCH):
+            vnf.add_VDU(
+                id=f"added-{i}",
+                num_vcpu=2,
+                size_memory=4.0,
+                size_storage=[10],
+                image=["ubuntu20.04"],
+                int_cps=["internal"],
+            )
+
+    return (lambda: load(description)), run
+
+
+def case_add_ext_cp(description: dict) -> Tuple[Callable, Callable]:
+    num_vdus = len(description["vdu"])
+
+    def run(vnf):
+        for i in range(BATCH):
+            vdu_id = f"vdu-{i % num_vdus}"
+            vnf.add_ExternalConnectionPoint(
+                id=f"ext-{i}", vdu_id=vdu_id, vdu_cp=f"{vdu_id}-eth{1 + i // num_vdus % 2}-int"
+            )
+
+    return (lambda: load(description)), run
+
+
+def case_assign_ip(description: dict) -> Tuple[Callable, Callable]:
+    num_vdus = len(description["vdu"])
+    first = ip_address("10.0.0.10")
+
+    def run(vnf):
+        for i in range(BATCH):
+            vdu_id = f"vdu-{i % num_vdus}"
+            vnf.assign_IP_vdu_interface(vdu_id, f"{vdu_id}-eth{i // num_vdus % 3}-int", first + i)
+
+    return (lambda: load(description)), run
+
+
+def case_add_scaling_aspect(description: dict) -> Tuple[Callable, Callable]:
+    num_vdus = len(description["vdu"])
+
+    def run(vnf):
+        for i in range(BATCH):
+            vdu_id = f"vdu-{i % num_vdus}"
+            vnf.addScalingAspect(
+                id=f"aspect-{i}",
+                max_scale_level=3,
+                vdu_to_scale=vdu_id,
+                selected_telemetry=f"{vdu_id}_cpu_utilization",
+                scale_in_threshold=20,
+                scale_out_threshold=80,
+                cooldown_time=60,
+                threshold_time=10,
+                scale=1,
+            )
+
+    return (lambda: load(description)), run
+
+
+def case_remove_vdu(description: dict) -> Tuple[Callable, Callable]:
+    # the VDU of the management connection point stays.
+    num_removed = min(BATCH, len(description["vdu"]) - 1)
+
+    def run(vnf):
+        for i in range(num_removed):
+            vnf.remove_VDU(f"vdu-{i + 1}")
+
+    return (lambda: load(description)), run
+
+
+def case_yaml_dump(description: dict) -> Tuple[Callable, Callable]:
+    from Descriptor import yaml_dump
+
+    return (lambda: load(description)), (lambda vnf: yaml_dump({"vnfd": vnf.yaml_repr()}))
+
+
+def case_visualization(description: dict) -> Tuple[Callable, Callable]:
+    return (lambda: load(description)), (lambda vnf: vnf.visualization())
+
+
+CASES: Dict[str, Callable] = {
+    "load": case_load,
+    "add_VDU": case_add_vdu,
+    "add_ExternalConnectionPoint": case_add_ext_cp,
+    "assign_IP_vdu_interface": case_assign_ip,
+    "addScalingAspect": case_add_scaling_aspect,
+    "remove_VDU": case_remove_vdu,
+    "yaml_repr+dump": case_yaml_dump,
+    "visualization": case_visualization,
+}
+
+
+def measure(setup: Callable, run: Callable, repeat: int) -> Dict[str, float]:
+    """Return the best time over several runs and the peak memory allocated by one run."""
+    best = None
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del state
+
+    # traced apart, tracemalloc slows the run down.
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    run(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Return a line for every case over the baseline by more than the threshold."""
+    regressions = list()
+    for name, sizes in results["cases"].items():
+        for size, result in sizes.items():
+            reference = baseline["cases"].get(name, dict()).get(size)
+            if reference is None:
+                continue
+            for metric in ("seconds", "peak_bytes"):
+                if reference[metric] > 0 and result[metric] > reference[metric] * (1 + threshold):
+                    regressions.append(
+                        f"{name} with {size} VDUs: {metric} {result[metric]:.6g} "
+                        f"vs {reference[metric]:.6g} ({result[metric] / reference[metric] - 1:+.0%})"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--src", default=str(SRC), help="directory holding VDU.py and VNF.py")
+    parser.add_argument("--vdus", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best one is kept")
+    parser.add_argument("--save", help="write the results as a baseline JSON file")
+    parser.add_argument("--baseline", default=str(BASELINE), help="baseline JSON file to compare with, none to skip")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown or growth")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.src)
+    # imported ahead, the first load is not timed with the imports.
+    import Descriptor  # noqa: F401
+
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "cases": {name: dict() for name in args.cases},
+    }
+    # the visualization writes its html page in the working directory.
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            for num_vdus in args.vdus:
+                description = benchmark_description(num_vdus)
+                for name in args.cases:
+                    setup, run = CASES[name](description)
+                    result = measure(setup, run, args.repeat)
+                    results["cases"][name][str(num_vdus)] = result
+                    print(
+                        f"{name:<28} {num_vdus:>6} VDUs: {result['seconds'] * 1e3:10.2f} ms "
+                        f"{result['peak_bytes'] / 1024:10.1f} KiB peak"
+                    )
+        finally:
+            os.chdir(cwd)
+
+    if args.save is not None:
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline != "none":
+        baseline = json.loads(Path(args.baseline).read_text())
+        for key in ("python", "machine", "processor"):
+            if baseline.get(key) != results[key]:
+                print(f"The baseline was measured with {key} {baseline.get(key)}, not {results[key]}.")
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if len(regressions) != 0:
+            sys.exit(1)
+        print(f"No regression over {args.threshold:.0%} against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Memory used by loaded VNF descriptors.
+
+Loads a synthetic descriptor several times and reports the bytes retained per
+loaded VNF. Pass --src to measure another checkout, e.g. to compare before and
+after a model change:
+
+    python benchmarks/memory_benchmark.py --src /path/to/old/src/py-osmgs
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src" / "py-osmgs"
+
+
+def synthetic_description(num_vdus: int, num_interfaces: int = 3) -> dict:
+    """Build a VNF description with extra pass-through keys on every entity."""
+    vdus = list()
+    vdu_profiles = list()
+    vcds = list()
+    vsds = list()
+    for i in range(num_vdus):
+        vdu_id = f"vdu-{i}"
+        vdus.append(
+            {
+                "id": vdu_id,
+                "name": vdu_id,
+                "description": f"synthetic VDU {i}",
+                "sw-image-desc": "ubuntu20.04",
+                "virtual-compute-desc": f"{vdu_id}-compute",
+                "virtual-storage-desc": [f"{vdu_id}-storage"],
+                "int-cpd": [
+                    {
+                        "id": f"{vdu_id}-eth{j}-int",
+                        "int-virtual-link-desc": "internal",
+                        "virtual-network-interface-requirement": [
+                            {
+                                "name": f"{vdu_id}-eth{j}",
+                                "position": j,
+                                "virtual-interface": {"type": "PARAVIRT"},
+                            }
+                        ],
+                    }
+                    for j in range(num_interfaces)
+                ],
+                "monitoring-parameter": [
+                    {
+                        "id": f"{vdu_id}_cpu_utilization",
+                        "name": f"{vdu_id}_cpu_utilization",
+                        "performance-metric": "cpu_utilization",
+                    }
+                ],
+            }
+        )
+        vdu_profiles.append({"id": vdu_id, "min-number-of-instances": 1})
+        vcds.append(
+            {
+                "id": f"{vdu_id}-compute",
+                "virtual-cpu": {"num-virtual-cpu": 2},
+                "virtual-memory": {"size": 4.0},
+            }
+        )
+        vsds.append({"id": f"{vdu_id}-storage", "size-of-storage": 10})
+
+    return {
+        "id": "memory-benchmark",
+        "product-name": "memory-benchmark",
+        "version": 1.0,
+        "mgmt-cp": "mgmt",
+        "provider": "benchmark",
+        "df": [{"id": "default-df", "vdu-profile": vdu_profiles}],
+        "ext-cpd": [{"id": "mgmt", "int-cpd": {"cpd": "vdu-0-eth0-int", "vdu-id": "vdu-0"}}],
+        "int-virtual-link-desc": [{"id": "internal"}],
+        "sw-image-desc": [{"id": "ubuntu20.04", "name": "ubuntu20.04", "image": "ubuntu20.04"}],
+        "vdu": vdus,
+        "virtual-compute-desc": vcds,
+        "virtual-storage-desc": vsds,
+    }
+
+
+def measure(num_vdus: int, copies: int) -> float:
+    """Return the bytes retained per loaded VNF."""
+    from VNF import VNF
+
+    description = synthetic_description(num_vdus)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    loaded = list()
+    for _ in range(copies):
+        vnf = VNF()
+        vnf.load(description)
+        loaded.append(vnf)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--src", default=str(SRC), help="directory holding VDU.py and VNF.py")
+    parser.add_argument("--vdus", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--copies", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.src)
+    for num_vdus in args.vdus:
+        per_vnf = measure(num_vdus, args.copies)
+        print(
+            f"{num_vdus:>6} VDUs: {per_vnf / 1024:10.1f} KiB per VNF, "
+            f"{per_vnf / num_vdus:8.0f} B per VDU"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,653 @@
+from math import ceil
+from typing import Dict, List, Mapping, Sequence, Union
+
+import numpy as np
+
+from VNF import VNF, ScalingAspect, ScalingCriteria, ScalingPolicy
+
+# scaling directions
+SCALE_OUT = "scale_out"
+SCALE_IN = "scale_in"
+
+# relational operations of the scaling criteria
+RELATIONAL_OPERATIONS = {
+    "GT": np.greater,
+    "GE": np.greater_equal,
+    "LT": np.less,
+    "LE": np.less_equal,
+    "EQ": np.equal,
+    "NE": np.not_equal,
+}
+
+
+class ScalingEvent:
+    """A scaling operation applied by the autoscaling replay."""
+
+    def __init__(
+        self,
+        sample: int,
+        time: float,
+        aspect_id: str,
+        policy: str,
+        direction: str,
+        scale_level: int,
+        instances: Dict[str, int],
+    ) -> None:
+        self._sample: int = sample
+        self._time: float = time
+        self._aspect_id: str = aspect_id
+        self._policy: str = policy
+        self._direction: str = direction
+        self._scale_level: int = scale_level
+        self._instances: Dict[str, int] = instances
+
+    @property
+    def sample(self):
+        """Get index of the trace sample the operation happened at."""
+        return self._sample
+
+    @property
+    def time(self):
+        """Get time of the operation in seconds."""
+        return self._time
+
+    @property
+    def aspect_id(self):
+        """Get id of the scaling aspect."""
+        return self._aspect_id
+
+    @property
+    def policy(self):
+        """Get name of the scaling policy that triggered the operation."""
+        return self._policy
+
+    @property
+    def direction(self):
+        """Get direction, "scale_out" or "scale_in"."""
+        return self._direction
+
+    @property
+    def scale_level(self):
+        """Get scale level of the aspect after the operation."""
+        return self._scale_level
+
+    @property
+    def instances(self):
+        """Get number of instances of every VDU after the operation."""
+        return self._instances
+
+    def __repr__(self) -> str:
+        return (
+            f"ScalingEvent(time={self.time}, aspect_id={self.aspect_id!r}, "
+            f"direction={self.direction!r}, scale_level={self.scale_level})"
+        )
+
+
+class ScalingTimeline:
+    """Instance count timeline produced by an autoscaling replay."""
+
+    def __init__(
+        self,
+        interval: float,
+        num_samples: int,
+        initial: Dict[str, int],
+        events: List[ScalingEvent],
+    ) -> None:
+        self._interval: float = interval
+        self._num_samples: int = num_samples
+        self._initial: Dict[str, int] = initial
+        self._events: List[ScalingEvent] = events
+
+    @property
+    def interval(self):
+        """Get time between two trace samples in seconds."""
+        return self._interval
+
+    @property
+    def num_samples(self):
+        """Get number of trace samples."""
+        return self._num_samples
+
+    @property
+    def times(self):
+        """Get the time of every sample in seconds."""
+        return np.arange(self._num_samples) * self._interval
+
+    @property
+    def events(self):
+        """Get the scaling operations in time order."""
+        return self._events
+
+    @property
+    def initial_instances(self):
+        """Get number of instances of every VDU at the start."""
+        return self._initial
+
+    @property
+    def final_instances(self):
+        """Get number of instances of every VDU at the end."""
+        if len(self._events) == 0:
+            return dict(self._initial)
+        return dict(self._events[-1].instances)
+
+    def instances(self, vdu_id: str) -> np.ndarray:
+        """Get the number of instances of a VDU at every sample.
+
+        Args:
+            vdu_id (str): VDU id.
+
+        Raises:
+            RuntimeError: raise if the VDU has no profile in the VNF.
+
+        Returns:
+            np.ndarray: instance count per sample.
+        """
+        if vdu_id not in self._initial:
+            raise RuntimeError(f"The VDU {vdu_id} is not part of the timeline.")
+        starts = [0] + [event.sample for event in self._events] + [self._num_samples]
+        counts = [self._initial[vdu_id]] + [event.instances[vdu_id] for event in self._events]
+        return np.repeat(np.asarray(counts), np.diff(starts))
+
+
+def _breaches(
+    values: np.ndarray, operation: str, threshold: float
+) -> np.ndarray:
+    if operation not in RELATIONAL_OPERATIONS:
+        raise RuntimeError(f"Unknown relational operation {operation}.")
+    return RELATIONAL_OPERATIONS[operation](values, threshold)
+
+
+def _sustained(breach: np.ndarray, samples: int) -> np.ndarray:
+    """Mark the samples that close a run of at least ``samples`` breaching samples."""
+    if samples <= 1:
+        return breach
+    run = np.cumsum(breach, dtype=np.int64)
+    window = run.copy()
+    window[samples:] -= run[:-samples]
+    return window == samples
+
+
+def _combine(breaches: List[np.ndarray], operation_type: str, num_samples: int) -> np.ndarray:
+    if len(breaches) == 0:
+        return np.zeros(num_samples, dtype=bool)
+    if operation_type is not None and operation_type.upper() == "AND":
+        return np.logical_and.reduce(breaches)
+    return np.logical_or.reduce(breaches)
+
+
+class _PolicyTrack:
+    """Scaling candidates of one policy, located with binary searches."""
+
+    __slots__ = ("aspect", "policy", "out_samples", "in_samples", "cooldown", "ready")
+
+    def __init__(
+        self,
+        aspect: ScalingAspect,
+        policy: ScalingPolicy,
+        traces: Mapping[str, np.ndarray],
+        interval: float,
+        num_samples: int,
+    ) -> None:
+        self.aspect: ScalingAspect = aspect
+        self.policy: ScalingPolicy = policy
+
+        out_breaches = list()
+        in_breaches = list()
+        for criteria in policy.scaling_criteria:
+            values = self._trace(criteria, traces)
+            if criteria.scale_out_relational_operation is not None:
+                out_breaches.append(
+                    _breaches(
+                        values,
+                        criteria.scale_out_relational_operation,
+                        criteria.scale_out_threshold,
+                    )
+                )
+            if criteria.scale_in_relational_operation is not None:
+                in_breaches.append(
+                    _breaches(
+                        values,
+                        criteria.scale_in_relational_operation,
+                        criteria.scale_in_threshold,
+                    )
+                )
+
+        threshold_samples = max(1, ceil((policy.threshold_time or 0) / interval))
+        self.out_samples = np.flatnonzero(
+            _sustained(
+                _combine(out_breaches, policy.scale_out_operation_type, num_samples),
+                threshold_samples,
+            )
+        )
+        self.in_samples = np.flatnonzero(
+            _sustained(
+                _combine(in_breaches, policy.scale_in_operation_type, num_samples),
+                threshold_samples,
+            )
+        )
+        self.cooldown: int = max(1, ceil((policy.cooldown_time or 0) / interval))
+        self.ready: int = 0
+
+    @staticmethod
+    def _trace(criteria: ScalingCriteria, traces: Mapping[str, np.ndarray]) -> np.ndarray:
+        if criteria.vnf_monitoring_param_ref not in traces:
+            raise RuntimeError(
+                f"No trace for the monitoring parameter {criteria.vnf_monitoring_param_ref}."
+            )
+        return traces[criteria.vnf_monitoring_param_ref]
+
+    @staticmethod
+    def _next(samples: np.ndarray, start: int):
+        index = np.searchsorted(samples, start)
+        if index == len(samples):
+            return None
+        return int(samples[index])
+
+    def next_out(self, start: int):
+        """Get the first scale out candidate at or after a sample."""
+        return self._next(self.out_samples, max(start, self.ready))
+
+    def next_in(self, start: int):
+        """Get the first scale in candidate at or after a sample."""
+        return self._next(self.in_samples, max(start, self.ready))
+
+
+def replay_autoscaling(
+    vnf: VNF,
+    traces: Mapping[str, Union[Sequence[float], np.ndarray]],
+    interval: float = 1.0,
+) -> ScalingTimeline:
+    """Replay the automatic scaling policies of a VNF against telemetry traces.
+
+    A criteria breaches when its monitoring parameter compares to the
+    threshold with the relational operation, criteria of a policy are combined
+    with its scale-out/scale-in-operation-type (OR by default). A policy fires
+    once the breach held for threshold-time, then stays quiet for
+    cooldown-time. Each operation applies the aspect delta details once and
+    moves the scale level by one. Operations beyond max-scale-level, below
+    level 0 or outside a VDU profile's min/max number of instances are refused.
+
+    Breaches, threshold windows and candidates are computed with whole-array
+    operations, only the operations themselves are stepped through, so the
+    cost follows the number of scaling operations rather than the trace length.
+
+    Args:
+        vnf (VNF): the VNF.
+        traces (Mapping[str, Union[Sequence[float], np.ndarray]]): trace per monitoring parameter id, sampled every interval.
+        interval (float, optional): time between two samples in seconds. Defaults to 1.0.
+
+    Raises:
+        RuntimeError: raise if a trace is missing or the traces differ in length.
+
+    Returns:
+        ScalingTimeline: the scaling operations and instance counts over time.
+    """
+    traces = {key: np.asarray(value, dtype=float) for key, value in traces.items()}
+    lengths = {len(trace) for trace in traces.values()}
+    if len(lengths) > 1:
+        raise RuntimeError("All traces must have the same number of samples.")
+    num_samples = lengths.pop() if len(lengths) != 0 else 0
+
+    df = vnf.df[0]
+    minimum = dict()
+    maximum = dict()
+    instances = dict()
+    for vdu_profile in df.vdu_profile:
+        minimum[vdu_profile.id] = vdu_profile.min_number_instances or 0
+        maximum[vdu_profile.id] = vdu_profile.max_number_instances
+        instances[vdu_profile.id] = minimum[vdu_profile.id]
+    initial = dict(instances)
+
+    tracks = list()
+    levels = dict()
+    for aspect in df.scaling_aspects:
+        levels[aspect.id] = 0
+        for policy in aspect.scaling_policy:
+            if policy.scaling_type is not None and policy.scaling_type != "automatic":
+                continue
+            tracks.append(_PolicyTrack(aspect, policy, traces, interval, num_samples))
+
+    events = list()
+    # directions refused by a VDU profile stay refused until another operation changes the counts.
+    blocked = set()
+    sample = 0
+    while True:
+        best = None
+        for index, track in enumerate(tracks):
+            aspect = track.aspect
+            max_level = aspect.max_scale_level
+            if (max_level is None or levels[aspect.id] < max_level) and (index, SCALE_OUT) not in blocked:
+                candidate = track.next_out(sample)
+                if candidate is not None and (best is None or candidate < best[0]):
+                    best = (candidate, index, SCALE_OUT)
+            if levels[aspect.id] > 0 and (index, SCALE_IN) not in blocked:
+                candidate = track.next_in(sample)
+                if candidate is not None and (best is None or candidate < best[0]):
+                    best = (candidate, index, SCALE_IN)
+        if best is None:
+            break
+
+        sample, index, direction = best
+        track = tracks[index]
+        sign = 1 if direction == SCALE_OUT else -1
+        scaled = dict()
+        for deltas in track.aspect.aspect_delta_details:
+            for vdu_id, number_of_instances in deltas.vdu_delta:
+                scaled[vdu_id] = scaled.get(vdu_id, instances.get(vdu_id, 0)) + sign * number_of_instances
+        refused = any(
+            count < minimum.get(vdu_id, 0)
+            or (maximum.get(vdu_id) is not None and count > maximum[vdu_id])
+            for vdu_id, count in scaled.items()
+        )
+        if refused:
+            blocked.add((index, direction))
+            continue
+
+        instances.update(scaled)
+        levels[track.aspect.id] += sign
+        track.ready = sample + track.cooldown
+        blocked.clear()
+        events.append(
+            ScalingEvent(
+                sample=sample,
+                time=sample * interval,
+                aspect_id=track.aspect.id,
+                policy=track.policy.name,
+                direction=direction,
+                scale_level=levels[track.aspect.id],
+                instances=dict(instances),
+            )
+        )
+
+    return ScalingTimeline(interval, num_samples, initial, events)
+
+
+class ThresholdSweep:
+    """Summary statistics of a threshold sweep, one column per parameter combination.
+
+    Statistics are arrays of shape (number of traces, number of combinations).
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        num_samples: int,
+        parameters: Dict[str, np.ndarray],
+        statistics: Dict[str, np.ndarray],
+    ) -> None:
+        self._interval: float = interval
+        self._num_samples: int = num_samples
+        self._parameters: Dict[str, np.ndarray] = parameters
+        self._statistics: Dict[str, np.ndarray] = statistics
+
+    @property
+    def interval(self):
+        """Get time between two trace samples in seconds."""
+        return self._interval
+
+    @property
+    def num_samples(self):
+        """Get number of samples per trace."""
+        return self._num_samples
+
+    @property
+    def num_traces(self):
+        """Get number of traces."""
+        return self._statistics["scale_outs"].shape[0]
+
+    @property
+    def scale_in_threshold(self):
+        """Get scale in threshold of every combination."""
+        return self._parameters["scale_in_threshold"]
+
+    @property
+    def scale_out_threshold(self):
+        """Get scale out threshold of every combination."""
+        return self._parameters["scale_out_threshold"]
+
+    @property
+    def threshold_time(self):
+        """Get threshold time of every combination in seconds."""
+        return self._parameters["threshold_time"]
+
+    @property
+    def cooldown_time(self):
+        """Get cooldown time of every combination in seconds."""
+        return self._parameters["cooldown_time"]
+
+    @property
+    def scale_outs(self):
+        """Get number of scale out operations."""
+        return self._statistics["scale_outs"]
+
+    @property
+    def scale_ins(self):
+        """Get number of scale in operations."""
+        return self._statistics["scale_ins"]
+
+    @property
+    def time_over_threshold(self):
+        """Get time the metric spent above the scale out threshold in seconds."""
+        return self._statistics["time_over_threshold"]
+
+    @property
+    def instance_hours(self):
+        """Get instance hours of the scaled VDU."""
+        return self._statistics["instance_hours"]
+
+    @property
+    def peak_instances(self):
+        """Get highest number of instances of the scaled VDU."""
+        return self._statistics["peak_instances"]
+
+    def rows(self):
+        """Iterate over the results as one dictionary per trace and combination.
+
+        Yields:
+            dict: parameters and statistics.
+        """
+        for trace in range(self.num_traces):
+            for combination in range(len(self)):
+                row = {"trace": trace}
+                for key, values in self._parameters.items():
+                    row[key] = values[combination].item()
+                for key, values in self._statistics.items():
+                    row[key] = values[trace, combination].item()
+                yield row
+
+    def __len__(self) -> int:
+        return len(self._parameters["scale_in_threshold"])
+
+
+class _RunTable:
+    """Sustained breach runs of many (trace, threshold, threshold time) keys.
+
+    Runs of key k are stored shifted by k * num_samples, so the concatenation
+    stays sorted and a single searchsorted answers the next candidate of every
+    combination at once.
+    """
+
+    def __init__(self, num_samples: int) -> None:
+        self._num_samples: int = num_samples
+        self._keys: Dict[tuple, int] = dict()
+        self._starts: List[np.ndarray] = list()
+        self._ends: List[np.ndarray] = list()
+
+    def find(self, key: tuple):
+        return self._keys.get(key)
+
+    def add(self, key: tuple, starts: np.ndarray, ends: np.ndarray) -> int:
+        index = len(self._keys)
+        self._keys[key] = index
+        offset = index * self._num_samples
+        self._starts.append(starts + offset)
+        self._ends.append(ends + offset)
+        return index
+
+    def freeze(self):
+        self.starts = np.concatenate(self._starts) if self._starts else np.zeros(0, dtype=np.int64)
+        self.ends = np.concatenate(self._ends) if self._ends else np.zeros(0, dtype=np.int64)
+        self.limit = np.cumsum([len(ends) for ends in self._ends], dtype=np.int64)
+
+    def next(self, keys: np.ndarray, samples: np.ndarray) -> np.ndarray:
+        """Get the first sustained sample at or after each sample, num_samples if none."""
+        num_samples = self._num_samples
+        offsets = keys * num_samples
+        if len(self.ends) == 0:
+            return np.full(len(keys), num_samples, dtype=np.int64)
+        index = np.searchsorted(self.ends, offsets + samples, side="left")
+        valid = (samples < num_samples) & (index < self.limit[keys])
+        index = np.minimum(index, len(self.ends) - 1)
+        candidates = np.maximum(self.starts[index], offsets + samples) - offsets
+        return np.where(valid, candidates, num_samples)
+
+
+def _runs(breach: np.ndarray):
+    """Get the first and last sample of every run of breaching samples."""
+    edges = np.diff(breach.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+
+def sweep_scaling_thresholds(
+    traces: Union[Sequence[float], np.ndarray],
+    scale_in_thresholds: Sequence[float],
+    scale_out_thresholds: Sequence[float],
+    threshold_times: Sequence[float],
+    cooldown_times: Sequence[float],
+    interval: float = 1.0,
+    max_scale_level: int = 1,
+    scale: int = 1,
+    min_instances: int = 1,
+    max_instances: int = None,
+) -> ThresholdSweep:
+    """Evaluate a grid of scaling aspects, as made by VNF.addScalingAspect, against metric traces.
+
+    Every combination of the threshold, threshold time and cooldown lists is
+    replayed against every trace with the same semantics as replay_autoscaling
+    for a single criteria aspect: scale out when the metric is greater than the
+    scale out threshold, scale in when it is less than the scale in threshold.
+    Combinations whose scale in threshold is not below the scale out threshold
+    are left out, like ScalingCriteria.configure refuses them.
+
+    Breach runs are computed once per distinct threshold, then all
+    combinations are stepped together, one scaling operation per step, each
+    step being a few whole-array operations.
+
+    Args:
+        traces (Union[Sequence[float], np.ndarray]): a metric trace, or a matrix with one trace per row.
+        scale_in_thresholds (Sequence[float]): scale in thresholds to try.
+        scale_out_thresholds (Sequence[float]): scale out thresholds to try.
+        threshold_times (Sequence[float]): threshold times to try, in seconds.
+        cooldown_times (Sequence[float]): cooldown times to try, in seconds.
+        interval (float, optional): time between two samples in seconds. Defaults to 1.0.
+        max_scale_level (int, optional): max scale level of the aspect. Defaults to 1.
+        scale (int, optional): instances added per scale level. Defaults to 1.
+        min_instances (int, optional): min number of instances of the VDU. Defaults to 1.
+        max_instances (int, optional): max number of instances of the VDU. Defaults to no limit.
+
+    Returns:
+        ThresholdSweep: statistics of every trace and combination.
+    """
+    traces = np.asarray(traces, dtype=float)
+    if traces.ndim == 1:
+        traces = traces[np.newaxis, :]
+    num_traces, num_samples = traces.shape
+
+    grid = [
+        (scale_in, scale_out, threshold_time, cooldown_time)
+        for scale_in in scale_in_thresholds
+        for scale_out in scale_out_thresholds
+        if scale_in < scale_out
+        for threshold_time in threshold_times
+        for cooldown_time in cooldown_times
+    ]
+    parameters = {
+        "scale_in_threshold": np.asarray([combination[0] for combination in grid], dtype=float),
+        "scale_out_threshold": np.asarray([combination[1] for combination in grid], dtype=float),
+        "threshold_time": np.asarray([combination[2] for combination in grid], dtype=float),
+        "cooldown_time": np.asarray([combination[3] for combination in grid], dtype=float),
+    }
+    num_combinations = len(grid)
+
+    # the VDU profile bound becomes a lower max scale level, so no operation is ever refused.
+    top_level = max_scale_level
+    if max_instances is not None:
+        top_level = min(top_level, max(0, (max_instances - min_instances) // scale))
+
+    out_table = _RunTable(num_samples)
+    in_table = _RunTable(num_samples)
+    out_keys = np.empty((num_traces, num_combinations), dtype=np.int64)
+    in_keys = np.empty((num_traces, num_combinations), dtype=np.int64)
+    over_threshold = np.empty((num_traces, num_combinations), dtype=np.int64)
+    for trace_index, trace in enumerate(traces):
+        out_runs = dict()
+        in_runs = dict()
+        for column, (scale_in, scale_out, threshold_time, cooldown_time) in enumerate(grid):
+            if scale_out not in out_runs:
+                out_runs[scale_out] = _runs(trace > scale_out)
+            if scale_in not in in_runs:
+                in_runs[scale_in] = _runs(trace < scale_in)
+            samples = max(1, ceil(threshold_time / interval))
+            for table, keys, runs, threshold in (
+                (out_table, out_keys, out_runs, scale_out),
+                (in_table, in_keys, in_runs, scale_in),
+            ):
+                key = (trace_index, threshold, samples)
+                index = table.find(key)
+                if index is None:
+                    starts, ends = runs[threshold]
+                    starts = starts + samples - 1
+                    keep = starts <= ends
+                    index = table.add(key, starts[keep], ends[keep])
+                keys[trace_index, column] = index
+            starts, ends = out_runs[scale_out]
+            over_threshold[trace_index, column] = int(np.sum(ends - starts + 1))
+    out_table.freeze()
+    in_table.freeze()
+
+    out_keys = out_keys.ravel()
+    in_keys = in_keys.ravel()
+    cooldown = np.tile(
+        np.maximum(1, np.ceil(parameters["cooldown_time"] / interval)).astype(np.int64),
+        num_traces,
+    )
+    size = num_traces * num_combinations
+    sample = np.zeros(size, dtype=np.int64)
+    level = np.zeros(size, dtype=np.int64)
+    peak = np.zeros(size, dtype=np.int64)
+    last = np.zeros(size, dtype=np.int64)
+    instance_samples = np.zeros(size, dtype=np.int64)
+    scale_outs = np.zeros(size, dtype=np.int64)
+    scale_ins = np.zeros(size, dtype=np.int64)
+    active = np.arange(size)
+    while len(active) != 0:
+        current = sample[active]
+        next_out = out_table.next(out_keys[active], current)
+        next_out[level[active] >= top_level] = num_samples
+        next_in = in_table.next(in_keys[active], current)
+        next_in[level[active] <= 0] = num_samples
+        at = np.minimum(next_out, next_in)
+
+        going = at < num_samples
+        active = active[going]
+        at = at[going]
+        out = next_out[going] <= next_in[going]
+
+        instance_samples[active] += (min_instances + level[active] * scale) * (at - last[active])
+        last[active] = at
+        level[active] += np.where(out, 1, -1)
+        peak[active] = np.maximum(peak[active], level[active])
+        scale_outs[active] += out
+        scale_ins[active] += ~out
+        sample[active] = at + cooldown[active]
+    instance_samples += (min_instances + level * scale) * (num_samples - last)
+
+    shape = (num_traces, num_combinations)
+    statistics = {
+        "scale_outs": scale_outs.reshape(shape),
+        "scale_ins": scale_ins.reshape(shape),
+        "time_over_threshold": over_threshold * interval,
+        "instance_hours": instance_samples.reshape(shape) * interval / 3600,
+        "peak_instances": (min_instances + peak * scale).reshape(shape),
+    }
+    return ThresholdSweep(interval, num_samples, parameters, statistics)
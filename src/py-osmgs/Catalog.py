@@ -0,0 +1,208 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+from Descriptor import read_vnfd
+from DescriptorCache import DescriptorCache
+from VNF import VNF
+
+
+class CatalogResult:
+    """Result of loading one descriptor file of a catalog."""
+
+    def __init__(self, path: str, vnf: VNF = None, error: str = None) -> None:
+        self._path: str = path
+        self._vnf: VNF = vnf
+        self._error: str = error
+
+    @property
+    def path(self):
+        """Get descriptor file path."""
+        return self._path
+
+    @property
+    def vnf(self):
+        """Get loaded VNF, None if loading failed."""
+        return self._vnf
+
+    @property
+    def error(self):
+        """Get error message, None if loading succeeded."""
+        return self._error
+
+    @property
+    def ok(self):
+        """Check if the descriptor was loaded."""
+        return self._error is None
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"CatalogResult({self.path!r}, vnf={self.vnf.id!r})"
+        return f"CatalogResult({self.path!r}, error={self.error!r})"
+
+
+class CatalogReport:
+    """Throughput report of a catalog load, updated while results are yielded."""
+
+    def __init__(self) -> None:
+        self._loaded: int = 0
+        self._failed: int = 0
+        self._bytes: int = 0
+        self._start: float = None
+        self._end: float = None
+
+    def _begin(self):
+        self._start = time.perf_counter()
+        self._end = None
+
+    def _record(self, result: CatalogResult, size: int):
+        if result.ok:
+            self._loaded += 1
+        else:
+            self._failed += 1
+        self._bytes += size
+
+    def _finish(self):
+        self._end = time.perf_counter()
+
+    @property
+    def loaded(self):
+        """Get number of loaded descriptors."""
+        return self._loaded
+
+    @property
+    def failed(self):
+        """Get number of descriptors that failed to load."""
+        return self._failed
+
+    @property
+    def total(self):
+        """Get number of processed descriptors."""
+        return self._loaded + self._failed
+
+    @property
+    def bytes_read(self):
+        """Get total size of processed descriptor files in bytes."""
+        return self._bytes
+
+    @property
+    def elapsed(self):
+        """Get elapsed wall time in seconds."""
+        if self._start is None:
+            return 0.0
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    @property
+    def descriptors_per_second(self):
+        """Get throughput in descriptors per second."""
+        elapsed = self.elapsed
+        if elapsed == 0:
+            return 0.0
+        return self.total / elapsed
+
+    def __str__(self) -> str:
+        return (
+            f"{self.total} descriptors ({self.loaded} loaded, {self.failed} failed, "
+            f"{self.bytes_read / 1e6:.1f} MB) in {self.elapsed:.2f}s, "
+            f"{self.descriptors_per_second:.1f} descriptors/s"
+        )
+
+
+def _load_descriptor(path: str, cache: DescriptorCache = None):
+    """Load a single VNF descriptor file, run inside a worker process.
+
+    Args:
+        path (str): descriptor file path.
+        cache (DescriptorCache, optional): cache of loaded descriptors. Defaults to None.
+
+    Returns:
+        Tuple[str, VNF, str, int, Tuple[int, int, int]]: (path, vnf, error, file size, cache counts of this load).
+    """
+    size = 0
+    # a worker counts on its own cache instance, the counts of the load go back with the result.
+    before = cache.counts if cache is not None else None
+    try:
+        size = os.path.getsize(path)
+        if cache is None:
+            vnf = read_vnfd(path)
+        else:
+            vnf = cache.load(path)
+        error = None
+    except Exception as e:
+        vnf, error = None, f"{type(e).__name__}: {e}"
+    counts = None
+    if cache is not None:
+        counts = tuple(after - prior for after, prior in zip(cache.counts, before))
+    return path, vnf, error, size, counts
+
+
+def load_catalog(
+    paths: Iterable[Union[str, Path]],
+    workers: int = None,
+    report: CatalogReport = None,
+    cache: DescriptorCache = None,
+) -> Iterator[CatalogResult]:
+    """Load many VNF descriptor files in a process pool.
+
+    Results are yielded in completion order, a file that fails to load yields a
+    result carrying the error instead of stopping the whole catalog. At most a
+    few files per worker are in flight, so ``paths`` can be a lazy iterable.
+
+    Args:
+        paths (Iterable[Union[str, Path]]): descriptor file paths.
+        workers (int, optional): number of worker processes, 1 loads in this process. Defaults to the number of CPUs.
+        report (CatalogReport, optional): report to update with throughput. Defaults to None.
+        cache (DescriptorCache, optional): cache of loaded descriptors, unchanged files are not parsed again. Defaults to None.
+
+    Yields:
+        CatalogResult: one result per descriptor file.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise RuntimeError("The number of workers must be at least 1.")
+    if report is None:
+        report = CatalogReport()
+
+    report._begin()
+    try:
+        if workers == 1:
+            for path in paths:
+                path, vnf, error, size, _ = _load_descriptor(str(path), cache)
+                result = CatalogResult(path, vnf, error)
+                report._record(result, size)
+                yield result
+            return
+
+        max_in_flight = workers * 4
+        paths = iter(paths)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = dict()
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        path = str(next(paths))
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[executor.submit(_load_descriptor, path, cache)] = path
+                if len(pending) == 0:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        path, vnf, error, size, counts = future.result()
+                    except Exception as e:
+                        vnf, error, size, counts = None, f"{type(e).__name__}: {e}", 0, None
+                    if counts is not None:
+                        cache._add_counts(counts)
+                    result = CatalogResult(path, vnf, error)
+                    report._record(result, size)
+                    yield result
+    finally:
+        report._finish()
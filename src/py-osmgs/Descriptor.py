@@ -0,0 +1,288 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, IO, Iterable, Iterator, List, Union
+
+import yaml
+from yaml.events import (
+    DocumentEndEvent,
+    DocumentStartEvent,
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+    StreamStartEvent,
+)
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from VDU import uncached
+from VNF import VNF
+
+if TYPE_CHECKING:
+    # DescriptorCache imports this module.
+    from DescriptorCache import DescriptorCache
+
+# use the libyaml bindings when PyYAML was built with them, they are several times faster.
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+    LIBYAML = False
+
+
+def yaml_load(stream: Union[str, IO]) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream (Union[str, IO]): YAML text or a file object.
+
+    Returns:
+        Any: the parsed document.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def yaml_dump(data: Any, stream: IO = None):
+    """Dump a document as YAML with the fastest available safe dumper.
+
+    Args:
+        data (Any): the document.
+        stream (IO, optional): file object to write to. Defaults to None.
+
+    Returns:
+        str: the YAML text if no stream is given.
+    """
+    return yaml.dump(data, stream=stream, Dumper=SafeDumper, default_flow_style=False)
+
+
+# descriptor roots are at most wrapped twice, e.g. "nsd: {nsd: [...]}" or "vnfd-catalog: {vnfd: [...]}".
+ROOT_SEARCH_DEPTH = 2
+
+
+def _is_root_key(key: Any, name: str) -> bool:
+    """Check if a mapping key names a descriptor root, with or without a YANG module prefix."""
+    if not isinstance(key, str):
+        return False
+    return key == name or key.endswith(f":{name}")
+
+
+def find_descriptor_root(document: Any, name: str) -> Dict:
+    """Locate a descriptor root such as "vnfd" or "nsd" in a parsed document.
+
+    Only mapping keys in the first few levels are inspected, so large descriptors
+    are not walked. Both the OSM "vnfd:" form and the SOL006 "etsi-nfv-vnfd:vnfd"
+    form are accepted, a root holding a list of descriptors yields the first one.
+
+    Args:
+        document (Any): the parsed YAML document.
+        name (str): root key, e.g. "vnfd" or "nsd".
+
+    Raises:
+        RuntimeError: raise if no descriptor root can be found.
+
+    Returns:
+        Dict: the descriptor.
+    """
+    level = [document]
+    for _ in range(ROOT_SEARCH_DEPTH + 1):
+        next_level = list()
+        for node in level:
+            if not isinstance(node, dict):
+                continue
+            for key, value in node.items():
+                if _is_root_key(key, name):
+                    # unwrap "nsd: {nsd: [...]}" style containers.
+                    while isinstance(value, dict) and len(value) == 1:
+                        inner_key, inner_value = next(iter(value.items()))
+                        if not _is_root_key(inner_key, name):
+                            break
+                        value = inner_value
+                    if isinstance(value, list):
+                        value = value[0] if len(value) != 0 else None
+                    if isinstance(value, dict):
+                        return value
+                elif isinstance(value, dict):
+                    next_level.append(value)
+        level = next_level
+    raise RuntimeError(f"No {name} descriptor can be found.")
+
+
+def find_vnfd_root(document: Any) -> Dict:
+    """Locate the VNF descriptor in a parsed document.
+
+    Args:
+        document (Any): the parsed YAML document.
+
+    Returns:
+        Dict: the VNF description.
+    """
+    return find_descriptor_root(document, "vnfd")
+
+
+def find_nsd_root(document: Any) -> Dict:
+    """Locate the NS descriptor in a parsed document.
+
+    Args:
+        document (Any): the parsed YAML document.
+
+    Returns:
+        Dict: the NS description.
+    """
+    return find_descriptor_root(document, "nsd")
+
+
+def read_vnfd_description(path: Union[str, Path]) -> Dict:
+    """Read the VNF description from a descriptor file.
+
+    Args:
+        path (Union[str, Path]): descriptor file path.
+
+    Raises:
+        RuntimeError: raise if the file does not contain a VNF descriptor.
+
+    Returns:
+        Dict: the VNF description.
+    """
+    with open(path, "r") as description_file:
+        vnf_description = yaml_load(description_file)
+    try:
+        return find_vnfd_root(vnf_description)
+    except RuntimeError:
+        raise RuntimeError(f"No VNF descriptor found in {path}.")
+
+
+def read_vnfd(path: Union[str, Path], vnf: VNF = None, cache: "DescriptorCache" = None) -> VNF:
+    """Load a VNF from a descriptor file.
+
+    Args:
+        path (Union[str, Path]): descriptor file path.
+        vnf (VNF, optional): VNF to load into. Defaults to a new VNF.
+        cache (DescriptorCache, optional): cache of loaded descriptors, a content loaded before is not parsed again. Defaults to None.
+
+    Raises:
+        RuntimeError: raise if both a VNF to load into and a cache are given, a cached VNF is always a new one.
+
+    Returns:
+        VNF: the loaded VNF.
+    """
+    if cache is not None:
+        if vnf is not None:
+            raise RuntimeError("A descriptor loaded through the cache is always loaded into a new VNF.")
+        return cache.load(path)
+    if vnf is None:
+        vnf = VNF()
+    vnf.load(read_vnfd_description(path))
+    return vnf
+
+
+class _LazySequence:
+    """A sequence whose items are produced only while it is being emitted."""
+
+    def __init__(self, items: Callable[[], Iterable]) -> None:
+        self._items = items
+
+    def __iter__(self):
+        return iter(self._items())
+
+
+def _lazy_map(function: Callable, entities: List) -> _LazySequence:
+    return _LazySequence(lambda: map(function, entities))
+
+
+def _node_events(dumper: SafeDumper, node: Node) -> Iterator[Event]:
+    """Serialize a representation node into events, like yaml.Serializer without anchors."""
+    if isinstance(node, ScalarNode):
+        detected_tag = dumper.resolve(ScalarNode, node.value, (True, False))
+        default_tag = dumper.resolve(ScalarNode, node.value, (False, True))
+        implicit = (node.tag == detected_tag), (node.tag == default_tag)
+        yield ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+    elif isinstance(node, SequenceNode):
+        implicit = node.tag == dumper.resolve(SequenceNode, node.value, True)
+        yield SequenceStartEvent(None, node.tag, implicit, flow_style=node.flow_style)
+        for item in node.value:
+            yield from _node_events(dumper, item)
+        yield SequenceEndEvent()
+    elif isinstance(node, MappingNode):
+        implicit = node.tag == dumper.resolve(MappingNode, node.value, True)
+        yield MappingStartEvent(None, node.tag, implicit, flow_style=node.flow_style)
+        for key, value in node.value:
+            yield from _node_events(dumper, key)
+            yield from _node_events(dumper, value)
+        yield MappingEndEvent()
+
+
+def _is_lazy(data: Any) -> bool:
+    if isinstance(data, _LazySequence):
+        return True
+    if isinstance(data, dict):
+        return any(_is_lazy(value) for value in data.values())
+    if isinstance(data, list):
+        return any(_is_lazy(item) for item in data)
+    return False
+
+
+def _data_events(dumper: SafeDumper, data: Any) -> Iterator[Event]:
+    """Produce events for data that may contain lazy sequences.
+
+    Plain subtrees go through the dumper's representer one chunk at a time, so
+    only the chunk being written is held in memory.
+    """
+    if not _is_lazy(data):
+        node = dumper.represent_data(data)
+        dumper.represented_objects = {}
+        dumper.object_keeper = []
+        dumper.alias_key = None
+        yield from _node_events(dumper, node)
+    elif isinstance(data, dict):
+        yield MappingStartEvent(None, None, True, flow_style=False)
+        for key in sorted(data):
+            yield from _data_events(dumper, key)
+            yield from _data_events(dumper, data[key])
+        yield MappingEndEvent()
+    else:
+        yield SequenceStartEvent(None, None, True, flow_style=False)
+        for item in data:
+            yield from _data_events(dumper, item)
+        yield SequenceEndEvent()
+
+
+def stream_vnfd(vnf: VNF, stream: IO):
+    """Write a VNF descriptor to a file object entity by entity.
+
+    The output is the same as dumping VNF.yaml_repr(), but the full dictionary
+    tree is never built: each VDU, connection point and profile is represented
+    and emitted on its own, keeping memory flat regardless of the VNF size.
+    Nothing is left in the entity caches of yaml_repr either.
+
+    Args:
+        vnf (VNF): the VNF.
+        stream (IO): file object to write to.
+    """
+    dumper = SafeDumper(stream, default_flow_style=False)
+    try:
+        dumper.emit(StreamStartEvent())
+        dumper.emit(DocumentStartEvent(explicit=False))
+        # the entities are represented on the way, without filling their caches.
+        with uncached():
+            for event in _data_events(dumper, vnf.yaml_layout(_lazy_map)):
+                dumper.emit(event)
+        dumper.emit(DocumentEndEvent(explicit=False))
+        dumper.emit(StreamEndEvent())
+    finally:
+        dumper.dispose()
+
+
+def write_vnfd(vnf: VNF, path: Union[str, Path]):
+    """Write a VNF to a descriptor file.
+
+    Args:
+        vnf (VNF): the VNF.
+        path (Union[str, Path]): descriptor file path.
+    """
+    with open(path, "w") as yaml_file:
+        stream_vnfd(vnf, yaml_file)
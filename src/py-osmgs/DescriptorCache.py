@@ -0,0 +1,279 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from Descriptor import find_vnfd_root, yaml_load
+from VNF import VNF
+
+CACHE_MAGIC = b"OSMGSVNF"
+CACHE_VERSION = 1
+
+# pickle protocol of the cache entries, protocol 5 is the fastest to load, it
+# needs Python 3.8 and 4 is used before.
+CACHE_PROTOCOL = min(5, pickle.HIGHEST_PROTOCOL)
+
+# default bound of the cache directory size in bytes
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# eviction frees space down to this fraction of the bound, so that it does
+# not run again on the next store.
+LOW_WATER = 0.9
+
+# modules whose classes are pickled in the cache entries, and the one that
+# parses the descriptor files into them.
+MODEL_MODULES = ("Addressing", "Descriptor", "VDU", "VNF")
+
+_fingerprint: bytes = None
+
+# caches unpickled in this process by directory and size bound
+_shared: Dict[Tuple[str, int], "DescriptorCache"] = dict()
+
+
+def model_fingerprint() -> bytes:
+    """Get the digest of the VNF model sources, entries of another model version never hit.
+
+    Returns:
+        bytes: the digest.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(f"{CACHE_VERSION}/{CACHE_PROTOCOL}".encode())
+        for name in MODEL_MODULES:
+            digest.update(Path(sys.modules[name].__file__).read_bytes())
+        _fingerprint = digest.digest()
+    return _fingerprint
+
+
+def _unlink(path: Path):
+    """Remove a file, already removed by another process is fine."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _shared_cache(directory: str, max_bytes: int) -> "DescriptorCache":
+    """Get the cache of a directory in this process, a worker process keeps one per directory."""
+    cache = _shared.get((directory, max_bytes))
+    if cache is None:
+        cache = _shared[(directory, max_bytes)] = DescriptorCache(directory, max_bytes)
+    return cache
+
+
+class DescriptorCache:
+    """On-disk cache of loaded VNF descriptors, keyed on the content of the descriptor file.
+
+    A descriptor file is parsed and loaded once, the loaded VNF is then kept
+    as a pickle under the cache directory and every later load of the same
+    content, at any path, unpickles it instead. Entries are evicted least
+    recently used first when the directory grows over its size bound. The
+    directory can be shared by several processes, the bound is then kept by
+    each of them on its own view of the directory.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Open a cache directory, created if missing.
+
+        Args:
+            directory (Union[str, Path]): cache directory.
+            max_bytes (int, optional): size bound of the cache in bytes. Defaults to DEFAULT_MAX_BYTES.
+
+        Raises:
+            RuntimeError: raise if the size bound is not positive.
+        """
+        if max_bytes <= 0:
+            raise RuntimeError("The size bound of the descriptor cache must be positive.")
+        self._directory: Path = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes: int = max_bytes
+        # size of the entries, scanned on the first store.
+        self._size: int = None
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @property
+    def directory(self):
+        """Get cache directory."""
+        return self._directory
+
+    @property
+    def max_bytes(self):
+        """Get size bound of the cache in bytes."""
+        return self._max_bytes
+
+    @property
+    def hits(self):
+        """Get number of loads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Get number of loads that parsed the descriptor file."""
+        return self._misses
+
+    @property
+    def evictions(self):
+        """Get number of entries evicted."""
+        return self._evictions
+
+    @property
+    def size(self):
+        """Get size of the entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def key(self, data: bytes) -> str:
+        """Get the cache key of a descriptor file content.
+
+        Args:
+            data (bytes): content of the descriptor file.
+
+        Returns:
+            str: the key.
+        """
+        digest = hashlib.sha256(model_fingerprint())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self._directory / key[:2] / f"{key}.vnf"
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """Get the (last use, size, path) of every entry."""
+        entries = list()
+        for subdirectory in self._directory.iterdir():
+            if not subdirectory.is_dir():
+                continue
+            for entry in os.scandir(subdirectory):
+                if not entry.name.endswith(".vnf"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # evicted by another process meanwhile
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        return entries
+
+    def _read(self, key: str) -> VNF:
+        """Get the VNF of an entry, None if there is no valid entry."""
+        entry_path = self._entry_path(key)
+        try:
+            data = entry_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            if not data.startswith(CACHE_MAGIC):
+                raise RuntimeError(f"The file {entry_path} is not a descriptor cache entry.")
+            vnf = pickle.loads(memoryview(data)[len(CACHE_MAGIC) :])
+        except Exception:
+            # a truncated or foreign entry is dropped and loaded again.
+            _unlink(entry_path)
+            return None
+        # the modification time marks the last use for the eviction.
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        return vnf
+
+    def _write(self, key: str, vnf: VNF):
+        """Store the VNF of an entry and evict the least recently used entries if needed."""
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(exist_ok=True)
+        data = CACHE_MAGIC + pickle.dumps(vnf, protocol=CACHE_PROTOCOL)
+        # written aside and renamed, readers never see a partial entry.
+        descriptor, temporary = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as entry_file:
+                entry_file.write(data)
+            os.replace(temporary, entry_path)
+        except BaseException:
+            _unlink(Path(temporary))
+            raise
+        if self._size is None:
+            self._size = self.size
+        else:
+            self._size += len(data)
+        if self._size > self._max_bytes:
+            self.evict()
+
+    def evict(self, max_bytes: int = None):
+        """Remove the least recently used entries until the cache is under a size.
+
+        Args:
+            max_bytes (int, optional): size to get under in bytes. Defaults to LOW_WATER of the size bound.
+        """
+        if max_bytes is None:
+            max_bytes = int(self._max_bytes * LOW_WATER)
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry_path in entries:
+            if size <= max_bytes:
+                break
+            _unlink(entry_path)
+            size -= entry_size
+            self._evictions += 1
+        self._size = size
+
+    def clear(self):
+        """Remove every entry."""
+        self.evict(0)
+
+    def load(self, path: Union[str, Path]) -> VNF:
+        """Load a VNF from a descriptor file, from the cache if the content was loaded before.
+
+        Every call returns a VNF of its own, changing it does not change the cache.
+
+        Args:
+            path (Union[str, Path]): descriptor file path.
+
+        Raises:
+            RuntimeError: raise if the file does not contain a VNF descriptor.
+
+        Returns:
+            VNF: the loaded VNF.
+        """
+        data = Path(path).read_bytes()
+        key = self.key(data)
+        vnf = self._read(key)
+        if vnf is not None:
+            self._hits += 1
+            return vnf
+
+        self._misses += 1
+        try:
+            vnf_description = find_vnfd_root(yaml_load(data))
+        except RuntimeError:
+            raise RuntimeError(f"No VNF descriptor found in {path}.")
+        vnf = VNF()
+        vnf.load(vnf_description)
+        self._write(key, vnf)
+        return vnf
+
+    @property
+    def counts(self) -> Tuple[int, int, int]:
+        """Get (hits, misses, evictions)."""
+        return self._hits, self._misses, self._evictions
+
+    def _add_counts(self, counts: Tuple[int, int, int]):
+        """Add the counts of loads done through another instance, such as the one of a worker process."""
+        hits, misses, evictions = counts
+        self._hits += hits
+        self._misses += misses
+        self._evictions += evictions
+
+    def __reduce__(self):
+        # sent to a worker process, the cache maps to the one of the worker, whose
+        # view of the directory size lasts across tasks.
+        return _shared_cache, (str(self._directory), self._max_bytes)
+
+    def __repr__(self) -> str:
+        return (
+            f"DescriptorCache({str(self._directory)!r}, hits={self.hits}, "
+            f"misses={self.misses}, evictions={self.evictions})"
+        )
@@ -0,0 +1,269 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from ipaddress import IPv4Network
+from pathlib import Path
+from random import Random
+from typing import Iterator, Tuple, Union
+
+from Descriptor import write_vnfd
+from VDU import CPU_UTIL, MEM_UTIL_AVE, Telemetries
+from VNF import VNF
+
+# image every synthetic VDU boots from
+SYNTHETIC_IMAGE = "ubuntu20.04"
+
+# first network of the addressed internal virtual links, one /24 per link.
+SYNTHETIC_NETWORK = IPv4Network("10.0.0.0/8")
+
+
+class SyntheticSpec:
+    """Shape of the synthetic VNF descriptors to generate."""
+
+    def __init__(
+        self,
+        num_vdus: int = 10,
+        num_links: int = 2,
+        num_interfaces: int = 2,
+        metrics: Tuple[str, ...] = (CPU_UTIL, MEM_UTIL_AVE),
+        num_scaling_aspects: int = 1,
+        vcpus: Tuple[int, ...] = (1, 2, 4, 8),
+        memory: Tuple[float, ...] = (1.0, 2.0, 4.0, 8.0, 16.0),
+        storage: Tuple[float, ...] = (10.0, 20.0, 40.0, 80.0),
+        max_scale_level: int = 3,
+        addressed: bool = True,
+    ) -> None:
+        """Describe the synthetic descriptors.
+
+        Args:
+            num_vdus (int, optional): VDUs per VNF. Defaults to 10.
+            num_links (int, optional): internal virtual links per VNF. Defaults to 2.
+            num_interfaces (int, optional): interfaces per VDU, each on an internal virtual link. Defaults to 2.
+            metrics (Tuple[str, ...], optional): telemetry metrics of every VDU. Defaults to (CPU_UTIL, MEM_UTIL_AVE).
+            num_scaling_aspects (int, optional): scaling aspects per VNF, each on a VDU metric. Defaults to 1.
+            vcpus (Tuple[int, ...], optional): number of virtual cpus a VDU is drawn from. Defaults to (1, 2, 4, 8).
+            memory (Tuple[float, ...], optional): memory sizes in GiB a VDU is drawn from. Defaults to (1.0, 2.0, 4.0, 8.0, 16.0).
+            storage (Tuple[float, ...], optional): storage sizes in GiB a VDU is drawn from. Defaults to (10.0, 20.0, 40.0, 80.0).
+            max_scale_level (int, optional): maximum scale level of the scaling aspects. Defaults to 3.
+            addressed (bool, optional): give every internal virtual link a /24 address plan. Defaults to True.
+
+        Raises:
+            RuntimeError: raise if the shape cannot be generated.
+        """
+        if num_vdus < 1:
+            raise RuntimeError("A synthetic VNF needs at least one VDU.")
+        if num_links < 1 or num_interfaces < 1:
+            raise RuntimeError("Every synthetic VDU needs an interface on an internal virtual link.")
+        if addressed and num_links > 2 ** (24 - SYNTHETIC_NETWORK.prefixlen):
+            raise RuntimeError(f"{num_links} addressed links do not fit in {SYNTHETIC_NETWORK}.")
+        unknown = [metric for metric in metrics if metric not in Telemetries]
+        if len(unknown) != 0:
+            raise RuntimeError(f"The metrics {unknown} are not available.")
+        if num_scaling_aspects > 0 and len(metrics) == 0:
+            raise RuntimeError("Scaling aspects need at least one telemetry metric.")
+        if len(vcpus) == 0 or len(memory) == 0 or len(storage) == 0:
+            raise RuntimeError("The vcpus, memory and storage choices cannot be empty.")
+        self._num_vdus: int = num_vdus
+        self._num_links: int = num_links
+        self._num_interfaces: int = num_interfaces
+        self._metrics: Tuple[str, ...] = tuple(metrics)
+        self._num_scaling_aspects: int = num_scaling_aspects
+        self._vcpus: Tuple[int, ...] = tuple(vcpus)
+        self._memory: Tuple[float, ...] = tuple(memory)
+        self._storage: Tuple[float, ...] = tuple(storage)
+        self._max_scale_level: int = max_scale_level
+        self._addressed: bool = addressed
+
+    @property
+    def num_vdus(self):
+        """Get number of VDUs per VNF."""
+        return self._num_vdus
+
+    @property
+    def num_links(self):
+        """Get number of internal virtual links per VNF."""
+        return self._num_links
+
+    @property
+    def num_interfaces(self):
+        """Get number of interfaces per VDU."""
+        return self._num_interfaces
+
+    @property
+    def metrics(self):
+        """Get telemetry metrics of every VDU."""
+        return self._metrics
+
+    @property
+    def num_scaling_aspects(self):
+        """Get number of scaling aspects per VNF."""
+        return self._num_scaling_aspects
+
+    @property
+    def vcpus(self):
+        """Get number of virtual cpus choices."""
+        return self._vcpus
+
+    @property
+    def memory(self):
+        """Get memory size choices in GiB."""
+        return self._memory
+
+    @property
+    def storage(self):
+        """Get storage size choices in GiB."""
+        return self._storage
+
+    @property
+    def max_scale_level(self):
+        """Get maximum scale level of the scaling aspects."""
+        return self._max_scale_level
+
+    @property
+    def addressed(self):
+        """Check if the internal virtual links get an address plan."""
+        return self._addressed
+
+    def __repr__(self) -> str:
+        return (
+            f"SyntheticSpec(vdus={self.num_vdus}, links={self.num_links}, "
+            f"interfaces={self.num_interfaces}, metrics={len(self.metrics)}, "
+            f"scaling_aspects={self.num_scaling_aspects})"
+        )
+
+
+def _link_network(index: int) -> IPv4Network:
+    """Get the /24 network of the index-th addressed internal virtual link."""
+    return IPv4Network((int(SYNTHETIC_NETWORK.network_address) + (index << 8), 24))
+
+
+def generate_vnf(spec: SyntheticSpec, seed: Union[int, str] = None, id: str = "synthetic-vnf") -> VNF:
+    """Generate a synthetic VNF through the VNF creation API.
+
+    The same spec and seed always give the same VNF.
+
+    Args:
+        spec (SyntheticSpec): shape of the VNF.
+        seed (Union[int, str], optional): random seed. Defaults to None.
+        id (str, optional): VNF id. Defaults to "synthetic-vnf".
+
+    Returns:
+        VNF: the VNF.
+    """
+    random = Random(seed)
+    vnf = VNF()
+    vnf.create(id=id)
+    vnf.add_Image(id=SYNTHETIC_IMAGE, image_filepath=SYNTHETIC_IMAGE)
+
+    links = [f"vl-{index}" for index in range(spec.num_links)]
+    for index, link_id in enumerate(links):
+        if spec.addressed:
+            network = _link_network(index)
+            vnf.add_InternalConnectionPoint(
+                id=link_id, ip=str(network.network_address + 1), network=str(network)
+            )
+        else:
+            vnf.add_InternalConnectionPoint(id=link_id)
+
+    for index in range(spec.num_vdus):
+        vdu_id = f"vdu-{index}"
+        # every link gets a VDU before the other interfaces pick theirs.
+        int_cps = [links[index % spec.num_links]]
+        int_cps.extend(random.choice(links) for _ in range(spec.num_interfaces - 1))
+        vnf.add_VDU(
+            id=vdu_id,
+            num_vcpu=random.choice(spec.vcpus),
+            size_memory=random.choice(spec.memory),
+            size_storage=[random.choice(spec.storage)],
+            image=[SYNTHETIC_IMAGE],
+            ext_cps=[vnf.mgmt_cp] if index == 0 else None,
+            int_cps=int_cps,
+        )
+        if len(spec.metrics) != 0:
+            vnf.add_vdu_telemetry(vdu_id, list(spec.metrics))
+
+    for index in range(spec.num_scaling_aspects):
+        vdu_id = f"vdu-{random.randrange(spec.num_vdus)}"
+        vnf.addScalingAspect(
+            id=f"aspect-{index}",
+            max_scale_level=spec.max_scale_level,
+            vdu_to_scale=vdu_id,
+            selected_telemetry=f"{vdu_id}_{random.choice(spec.metrics)}",
+            scale_in_threshold=random.randint(10, 40),
+            scale_out_threshold=random.randint(60, 90),
+            cooldown_time=random.choice((60, 120, 180, 300)),
+            threshold_time=random.choice((10, 30, 60)),
+            scale=1,
+        )
+    return vnf
+
+
+def _write_synthetic(spec: SyntheticSpec, seed: int, index: int, directory: str, prefix: str) -> str:
+    """Generate and write one synthetic descriptor, run inside a worker process.
+
+    Returns:
+        str: descriptor file path.
+    """
+    vnf_id = f"{prefix}-{index:06d}"
+    package = Path(directory) / vnf_id
+    package.mkdir(parents=True, exist_ok=True)
+    path = package / f"{vnf_id}_vnfd.yaml"
+    # every descriptor has its own random stream, the output does not depend on the workers.
+    write_vnfd(generate_vnf(spec, f"{seed}/{index}", vnf_id), path)
+    return str(path)
+
+
+def generate_catalog(
+    spec: SyntheticSpec,
+    count: int,
+    directory: Union[str, Path],
+    seed: int = 0,
+    prefix: str = "synthetic",
+    workers: int = 1,
+) -> Iterator[str]:
+    """Write synthetic VNF descriptors as a directory tree, one package directory per descriptor.
+
+    Descriptors are streamed to disk entity by entity and yielded as soon as
+    they are written, so the output can be fed straight to load_catalog(). At
+    most a few descriptors per worker are in flight.
+
+    Args:
+        spec (SyntheticSpec): shape of the descriptors.
+        count (int): number of descriptors.
+        directory (Union[str, Path]): root directory, created if missing.
+        seed (int, optional): random seed of the catalog. Defaults to 0.
+        prefix (str, optional): prefix of the VNF ids, numbered from 0. Defaults to "synthetic".
+        workers (int, optional): number of worker processes, None for the number of CPUs. Defaults to 1.
+
+    Raises:
+        RuntimeError: raise if the number of workers is less than 1.
+
+    Yields:
+        str: descriptor file path, in completion order.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise RuntimeError("The number of workers must be at least 1.")
+    directory = str(directory)
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
+    if workers == 1:
+        for index in range(count):
+            yield _write_synthetic(spec, seed, index, directory, prefix)
+        return
+
+    max_in_flight = workers * 4
+    indexes = iter(range(count))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        while True:
+            for index in indexes:
+                pending.add(executor.submit(_write_synthetic, spec, seed, index, directory, prefix))
+                if len(pending) >= max_in_flight:
+                    break
+            if len(pending) == 0:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
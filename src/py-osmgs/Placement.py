@@ -0,0 +1,639 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from Autoscaling import ScalingTimeline
+from VNF import VNF
+
+# placement strategies
+FIRST_FIT_DECREASING = "first-fit-decreasing"
+BEST_FIT = "best-fit"
+SPREAD = "spread"
+STRATEGIES = (FIRST_FIT_DECREASING, BEST_FIT, SPREAD)
+
+# host resources, in the column order of the capacity arrays.
+RESOURCES = ("cpu", "memory", "storage")
+
+# rounding allowed when an instance is compared with the free capacity, relative
+# to the largest host capacity: 0.3 + 0.6 + 0.1 GiB must fit in 1 GiB.
+FIT_TOLERANCE = 1e-9
+
+
+class Host:
+    """NFVI compute node."""
+
+    def __init__(self, id: str, cpu: float, memory: float, storage: float) -> None:
+        """Create a host.
+
+        Args:
+            id (str): id.
+            cpu (float): number of virtual cpus.
+            memory (float): memory in GiB.
+            storage (float): storage in GiB.
+        """
+        self._id: str = id
+        self._cpu: float = cpu
+        self._memory: float = memory
+        self._storage: float = storage
+
+    @property
+    def id(self):
+        """Get id."""
+        return self._id
+
+    @property
+    def cpu(self):
+        """Get number of virtual cpus."""
+        return self._cpu
+
+    @property
+    def memory(self):
+        """Get memory in GiB."""
+        return self._memory
+
+    @property
+    def storage(self):
+        """Get storage in GiB."""
+        return self._storage
+
+    def __repr__(self) -> str:
+        return f"Host({self.id!r}, cpu={self.cpu}, memory={self.memory}, storage={self.storage})"
+
+
+class VduInstance:
+    """Resources an instance of a VDU needs on a host."""
+
+    def __init__(
+        self,
+        vnf_id: str,
+        vdu_id: str,
+        index: int,
+        cpu: float,
+        memory: float,
+        storage: float,
+    ) -> None:
+        self._vnf_id: str = vnf_id
+        self._vdu_id: str = vdu_id
+        self._index: int = index
+        self._cpu: float = cpu
+        self._memory: float = memory
+        self._storage: float = storage
+
+    @property
+    def key(self):
+        """Get (VNF id, VDU id, index), unique in a placement."""
+        return (self._vnf_id, self._vdu_id, self._index)
+
+    @property
+    def vnf_id(self):
+        """Get VNF id."""
+        return self._vnf_id
+
+    @property
+    def vdu_id(self):
+        """Get VDU id."""
+        return self._vdu_id
+
+    @property
+    def index(self):
+        """Get index of the instance in its VDU."""
+        return self._index
+
+    @property
+    def cpu(self):
+        """Get number of virtual cpus."""
+        return self._cpu
+
+    @property
+    def memory(self):
+        """Get memory in GiB."""
+        return self._memory
+
+    @property
+    def storage(self):
+        """Get storage in GiB, all the disks of the VDU."""
+        return self._storage
+
+    def __repr__(self) -> str:
+        return f"VduInstance({self.vnf_id!r}, {self.vdu_id!r}, {self.index})"
+
+
+class PlacementReport:
+    """Host usage after a placement, arrays have one row per host and one column per resource."""
+
+    def __init__(
+        self,
+        hosts_id: List[str],
+        capacity: np.ndarray,
+        used: np.ndarray,
+        assignments: Dict[Tuple[str, str, int], str],
+        rejected: List[VduInstance],
+    ) -> None:
+        self._hosts_id: List[str] = hosts_id
+        self._capacity: np.ndarray = capacity
+        self._used: np.ndarray = used
+        self._assignments: Dict[Tuple[str, str, int], str] = assignments
+        self._rejected: List[VduInstance] = rejected
+
+    @property
+    def hosts_id(self):
+        """Get the host ids, in row order."""
+        return self._hosts_id
+
+    @property
+    def capacity(self):
+        """Get the capacity of every host."""
+        return self._capacity
+
+    @property
+    def used(self):
+        """Get the resources in use on every host."""
+        return self._used
+
+    @property
+    def assignments(self):
+        """Get the host id of every placed instance by instance key."""
+        return self._assignments
+
+    @property
+    def rejected(self):
+        """Get the instances that fit on no host."""
+        return self._rejected
+
+    @property
+    def utilization(self):
+        """Get the fraction of every resource in use on every host."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self._capacity > 0, self._used / self._capacity, 0.0)
+
+    @property
+    def active_hosts(self):
+        """Get number of hosts running at least one instance."""
+        return int(np.count_nonzero(self._used.any(axis=1)))
+
+    @property
+    def pool_utilization(self):
+        """Get the fraction of every resource in use over the pool."""
+        capacity = self._capacity.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(capacity > 0, self._used.sum(axis=0) / capacity, 0.0)
+
+    @property
+    def fragmentation(self):
+        """Get the fragmentation of every resource, 1 - largest free block / total free.
+
+        0 means all the free capacity is on one host, values close to 1 mean it
+        is scattered in pieces too small for a large instance.
+        """
+        free = self._capacity - self._used
+        total = free.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(total > 0, 1.0 - free.max(axis=0, initial=0.0) / total, 0.0)
+
+    def host(self, host_id: str) -> List[Tuple[str, str, int]]:
+        """Get the instances placed on a host.
+
+        Args:
+            host_id (str): host id.
+
+        Returns:
+            List[Tuple[str, str, int]]: the instance keys.
+        """
+        return [key for key, placed in self._assignments.items() if placed == host_id]
+
+    def __str__(self) -> str:
+        utilization = self.utilization
+        lines = [f"{'host':<24}{'cpu':>8}{'memory':>8}{'storage':>9}{'instances':>11}"]
+        counts = dict()
+        for host_id in self._assignments.values():
+            counts[host_id] = counts.get(host_id, 0) + 1
+        for row, host_id in enumerate(self._hosts_id):
+            lines.append(
+                f"{host_id:<24}{utilization[row, 0]:>8.1%}{utilization[row, 1]:>8.1%}"
+                f"{utilization[row, 2]:>9.1%}{counts.get(host_id, 0):>11}"
+            )
+        fragmentation = self.fragmentation
+        lines.append(
+            f"{'fragmentation':<24}{fragmentation[0]:>8.1%}{fragmentation[1]:>8.1%}{fragmentation[2]:>9.1%}"
+        )
+        lines.append(f"{self.active_hosts} active hosts, {len(self._rejected)} rejected instances")
+        return "\n".join(lines)
+
+
+class Placement:
+    """Placement of VDU instances on a pool of hosts.
+
+    Free capacity is kept as a (hosts, resources) array, every candidate host
+    of an instance is found with one vectorized comparison, within
+    FIT_TOLERANCE of the rounding of the float updates. A host whose last
+    instance is removed gets its exact capacity back, so the rounding does
+    not build up over a long timeline. Requirements are compared after
+    normalizing each resource by the largest host capacity, so that vcpus,
+    GiB of memory and GiB of storage weigh the same.
+
+    Strategies:
+        first-fit-decreasing: the largest instances of a batch first, each on the first host it fits on.
+        best-fit: each instance on the host it leaves with the least free capacity.
+        spread: each instance on the host with the most free capacity.
+    """
+
+    def __init__(self, hosts: Sequence[Host], strategy: str = FIRST_FIT_DECREASING) -> None:
+        """Create an empty placement.
+
+        Args:
+            hosts (Sequence[Host]): the host pool.
+            strategy (str, optional): one of STRATEGIES. Defaults to FIRST_FIT_DECREASING.
+
+        Raises:
+            RuntimeError: raise if the strategy is unknown or two hosts share an id.
+        """
+        if strategy not in STRATEGIES:
+            raise RuntimeError(f"Unknown placement strategy {strategy}, expected one of {STRATEGIES}.")
+        self._strategy: str = strategy
+        self._hosts: List[Host] = list(hosts)
+        self._host_index: Dict[str, int] = dict()
+        for row, host in enumerate(self._hosts):
+            if host.id in self._host_index:
+                raise RuntimeError(f"The host {host.id} is in the pool twice.")
+            self._host_index[host.id] = row
+        self._capacity = np.array(
+            [[host.cpu, host.memory, host.storage] for host in self._hosts], dtype=float
+        ).reshape(len(self._hosts), len(RESOURCES))
+        self._free = self._capacity.copy()
+        # number of instances on every host
+        self._placed = np.zeros(len(self._hosts), dtype=int)
+        largest = self._capacity.max(axis=0, initial=0.0)
+        self._scale = np.where(largest > 0, largest, 1.0)
+        self._assignments: Dict[Tuple[str, str, int], int] = dict()
+        self._instances: Dict[Tuple[str, str, int], VduInstance] = dict()
+        self._rejected: List[VduInstance] = list()
+
+    @property
+    def strategy(self):
+        """Get placement strategy."""
+        return self._strategy
+
+    @property
+    def hosts(self):
+        """Get the host pool."""
+        return self._hosts
+
+    @property
+    def rejected(self):
+        """Get the instances that fit on no host so far."""
+        return self._rejected
+
+    def _demand(self, instance: VduInstance) -> np.ndarray:
+        return np.array([instance.cpu, instance.memory, instance.storage], dtype=float)
+
+    def _choose(self, demand: np.ndarray):
+        """Get the row of the host an instance goes to, None if it fits nowhere."""
+        fits = np.flatnonzero((self._free >= demand - FIT_TOLERANCE * self._scale).all(axis=1))
+        if len(fits) == 0:
+            return None
+        if self._strategy == FIRST_FIT_DECREASING:
+            return int(fits[0])
+        left = ((self._free[fits] - demand) / self._scale).sum(axis=1)
+        if self._strategy == BEST_FIT:
+            return int(fits[np.argmin(left)])
+        return int(fits[np.argmax(left)])
+
+    def place(self, instance: VduInstance):
+        """Place one instance.
+
+        Args:
+            instance (VduInstance): the instance.
+
+        Raises:
+            RuntimeError: raise if the instance is already placed.
+
+        Returns:
+            str: id of the host it went to, None if it was rejected.
+        """
+        if instance.key in self._assignments:
+            raise RuntimeError(f"The instance {instance.key} is already placed.")
+        demand = self._demand(instance)
+        row = self._choose(demand)
+        if row is None:
+            self._rejected.append(instance)
+            return None
+        # an exact fit may leave a rounding error below 0.
+        self._free[row] = np.maximum(self._free[row] - demand, 0.0)
+        self._placed[row] += 1
+        self._assignments[instance.key] = row
+        self._instances[instance.key] = instance
+        return self._hosts[row].id
+
+    def place_many(self, instances: Sequence[VduInstance]) -> List[str]:
+        """Place a batch of instances, the largest first with first-fit-decreasing.
+
+        Args:
+            instances (Sequence[VduInstance]): the instances.
+
+        Returns:
+            List[str]: id of the host of every instance, in the given order, None for the rejected ones.
+        """
+        order = range(len(instances))
+        if self._strategy == FIRST_FIT_DECREASING and len(instances) != 0:
+            sizes = np.array([self._demand(instance) for instance in instances]) / self._scale
+            # largest dominant share first, stable so equal instances keep their order.
+            order = np.argsort(-sizes.max(axis=1), kind="stable")
+        placed = [None] * len(instances)
+        for position in order:
+            placed[position] = self.place(instances[position])
+        return placed
+
+    def remove(self, key: Tuple[str, str, int]):
+        """Remove a placed instance and free its resources.
+
+        Args:
+            key (Tuple[str, str, int]): the instance key.
+
+        Raises:
+            RuntimeError: raise if the instance is not placed.
+        """
+        if key not in self._assignments:
+            raise RuntimeError(f"The instance {key} is not placed.")
+        row = self._assignments.pop(key)
+        demand = self._demand(self._instances.pop(key))
+        self._placed[row] -= 1
+        if self._placed[row] == 0:
+            self._free[row] = self._capacity[row]
+        else:
+            self._free[row] = np.minimum(self._free[row] + demand, self._capacity[row])
+
+    def report(self) -> PlacementReport:
+        """Get the host usage of the current placement.
+
+        Returns:
+            PlacementReport: the report.
+        """
+        return PlacementReport(
+            hosts_id=[host.id for host in self._hosts],
+            capacity=self._capacity.copy(),
+            used=self._capacity - self._free,
+            assignments={key: self._hosts[row].id for key, row in self._assignments.items()},
+            rejected=list(self._rejected),
+        )
+
+
+def vnf_instances(
+    vnf: VNF, instances: Dict[str, int] = None, vnf_id: str = None
+) -> List[VduInstance]:
+    """Get the instances of the VDUs of a VNF with their resource requirements.
+
+    Args:
+        vnf (VNF): the VNF.
+        instances (Dict[str, int], optional): number of instances by VDU id. Defaults to the VDU profiles' min-number-of-instances, 1 without.
+        vnf_id (str, optional): VNF id of the instances, to tell apart several deployments of a VNF. Defaults to the VNF id.
+
+    Raises:
+        RuntimeError: raise if a VDU lacks its descriptions.
+
+    Returns:
+        List[VduInstance]: the instances.
+    """
+    if instances is None:
+        instances = dict()
+        if len(vnf.df) != 0:
+            for vdu_profile in vnf.df[0].vdu_profile:
+                if vdu_profile.min_number_instances is not None:
+                    instances[vdu_profile.id] = vdu_profile.min_number_instances
+        instances = {vdu.id: instances.get(vdu.id, 1) for vdu in vnf.vdus}
+
+    if vnf_id is None:
+        vnf_id = vnf.id
+    vcds = {vcd.id: vcd for vcd in vnf.virtual_compute_descriptions}
+    vsds = {vsd.id: vsd for vsd in vnf.virtual_storage_descriptions}
+    result = list()
+    for vdu in vnf.vdus:
+        count = instances.get(vdu.id, 0)
+        if count == 0:
+            continue
+        if vdu.vcd not in vcds:
+            raise RuntimeError(
+                f"The virtual compute description {vdu.vcd} of VDU {vdu.id} cannot be found."
+            )
+        missing = [vsd for vsd in vdu.vsd if vsd not in vsds]
+        if len(missing) != 0:
+            raise RuntimeError(
+                f"The virtual storage descriptions {missing} of VDU {vdu.id} cannot be found."
+            )
+        vcd = vcds[vdu.vcd]
+        storage = sum(vsds[vsd].storage_gib for vsd in vdu.vsd)
+        for index in range(count):
+            result.append(
+                VduInstance(
+                    vnf_id=vnf_id,
+                    vdu_id=vdu.id,
+                    index=index,
+                    cpu=vcd.number_virtual_cpu or 0,
+                    memory=vcd.memory_gib,
+                    storage=storage,
+                )
+            )
+    return result
+
+
+def _portfolio_instances(vnfs: Sequence[VNF]) -> List[VduInstance]:
+    """Get the initial instances of a VNF portfolio, the n-th deployment of a VNF id is named "<id>#<n>" from the second on."""
+    deployments = dict()
+    instances = list()
+    for vnf in vnfs:
+        count = deployments.get(vnf.id, 0)
+        deployments[vnf.id] = count + 1
+        vnf_id = vnf.id if count == 0 else f"{vnf.id}#{count}"
+        instances.extend(vnf_instances(vnf, vnf_id=vnf_id))
+    return instances
+
+
+def place_vnfs(
+    vnfs: Sequence[VNF], hosts: Sequence[Host], strategy: str = FIRST_FIT_DECREASING
+) -> PlacementReport:
+    """Place the initial instances of a VNF portfolio on a host pool.
+
+    Args:
+        vnfs (Sequence[VNF]): the VNFs.
+        hosts (Sequence[Host]): the host pool.
+        strategy (str, optional): one of STRATEGIES. Defaults to FIRST_FIT_DECREASING.
+
+    Returns:
+        PlacementReport: host usage, fragmentation and rejected instances.
+    """
+    placement = Placement(hosts, strategy)
+    placement.place_many(_portfolio_instances(vnfs))
+    return placement.report()
+
+
+def hosts_needed(
+    vnfs: Sequence[VNF],
+    cpu: float,
+    memory: float,
+    storage: float,
+    strategy: str = FIRST_FIT_DECREASING,
+) -> Tuple[int, PlacementReport]:
+    """Get the number of identical hosts a VNF portfolio needs.
+
+    Args:
+        vnfs (Sequence[VNF]): the VNFs.
+        cpu (float): number of virtual cpus of a host.
+        memory (float): memory of a host in GiB.
+        storage (float): storage of a host in GiB.
+        strategy (str, optional): one of STRATEGIES. Defaults to FIRST_FIT_DECREASING.
+
+    Raises:
+        RuntimeError: raise if an instance is larger than a host.
+
+    Returns:
+        Tuple[int, PlacementReport]: the number of hosts and the placement on them.
+    """
+    instances = _portfolio_instances(vnfs)
+    for instance in instances:
+        if instance.cpu > cpu or instance.memory > memory or instance.storage > storage:
+            raise RuntimeError(f"The instance {instance.key} is larger than a host.")
+    # one host per instance always suffices, the smallest count without rejection is searched.
+    low, high = 1, max(1, len(instances))
+    best = None
+    while low <= high:
+        count = (low + high) // 2
+        placement = Placement(
+            [Host(f"host-{index}", cpu, memory, storage) for index in range(count)], strategy
+        )
+        placement.place_many(instances)
+        if len(placement.rejected) == 0:
+            best = (count, placement.report())
+            high = count - 1
+        else:
+            low = count + 1
+    return best
+
+
+class PlacementTimeline:
+    """Host usage of a pool while an autoscaling timeline is replayed."""
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        active_hosts: np.ndarray,
+        rejected: np.ndarray,
+        pool_utilization: np.ndarray,
+        fragmentation: np.ndarray,
+        report: PlacementReport,
+    ) -> None:
+        self._times: np.ndarray = times
+        self._active_hosts: np.ndarray = active_hosts
+        self._rejected: np.ndarray = rejected
+        self._pool_utilization: np.ndarray = pool_utilization
+        self._fragmentation: np.ndarray = fragmentation
+        self._report: PlacementReport = report
+
+    @property
+    def times(self):
+        """Get the time of the start and of every scaling operation in seconds."""
+        return self._times
+
+    @property
+    def active_hosts(self):
+        """Get number of active hosts after every operation."""
+        return self._active_hosts
+
+    @property
+    def rejected(self):
+        """Get number of rejected instances so far after every operation."""
+        return self._rejected
+
+    @property
+    def pool_utilization(self):
+        """Get the pool utilization of every resource after every operation, one row per operation."""
+        return self._pool_utilization
+
+    @property
+    def fragmentation(self):
+        """Get the fragmentation of every resource after every operation, one row per operation."""
+        return self._fragmentation
+
+    @property
+    def report(self):
+        """Get the placement at the end of the timeline."""
+        return self._report
+
+
+def replay_placement(
+    vnf: VNF,
+    timeline: ScalingTimeline,
+    hosts: Sequence[Host],
+    strategy: str = FIRST_FIT_DECREASING,
+) -> PlacementTimeline:
+    """Follow the instances of an autoscaling timeline on a host pool.
+
+    The initial instances are placed as a batch, every scale out then places
+    its new instances one by one and every scale in removes the newest
+    instances of its VDUs, the rejected ones first. A rejected instance is
+    not retried.
+
+    Args:
+        vnf (VNF): the VNF.
+        timeline (ScalingTimeline): the scaling operations, from replay_autoscaling.
+        hosts (Sequence[Host]): the host pool.
+        strategy (str, optional): one of STRATEGIES. Defaults to FIRST_FIT_DECREASING.
+
+    Returns:
+        PlacementTimeline: host usage after every operation.
+    """
+    placement = Placement(hosts, strategy)
+    counts = dict(timeline.initial_instances)
+    requirements = {instance.vdu_id: instance for instance in vnf_instances(vnf, {vdu.id: 1 for vdu in vnf.vdus})}
+    placed: Dict[str, List[Tuple[str, str, int]]] = {vdu_id: list() for vdu_id in requirements}
+    next_index = {vdu_id: 0 for vdu_id in requirements}
+    unplaced = {vdu_id: 0 for vdu_id in requirements}
+
+    def add(vdu_id: str) -> VduInstance:
+        template = requirements[vdu_id]
+        instance = VduInstance(
+            template.vnf_id,
+            vdu_id,
+            next_index[vdu_id],
+            template.cpu,
+            template.memory,
+            template.storage,
+        )
+        next_index[vdu_id] += 1
+        return instance
+
+    batch = [add(vdu_id) for vdu_id, count in counts.items() if vdu_id in requirements for _ in range(count)]
+    for instance, host_id in zip(batch, placement.place_many(batch)):
+        if host_id is not None:
+            placed[instance.vdu_id].append(instance.key)
+        else:
+            unplaced[instance.vdu_id] += 1
+
+    times = [0.0]
+    reports = [placement.report()]
+    for event in timeline.events:
+        for vdu_id, count in event.instances.items():
+            if vdu_id not in requirements:
+                continue
+            change = count - counts.get(vdu_id, 0)
+            for _ in range(change):
+                instance = add(vdu_id)
+                if placement.place(instance) is not None:
+                    placed[vdu_id].append(instance.key)
+                else:
+                    unplaced[vdu_id] += 1
+            for _ in range(-change):
+                if unplaced[vdu_id] > 0:
+                    unplaced[vdu_id] -= 1
+                elif len(placed[vdu_id]) != 0:
+                    placement.remove(placed[vdu_id].pop())
+            counts[vdu_id] = count
+        times.append(event.time)
+        reports.append(placement.report())
+
+    return PlacementTimeline(
+        times=np.asarray(times),
+        active_hosts=np.array([report.active_hosts for report in reports]),
+        rejected=np.array([len(report.rejected) for report in reports]),
+        pool_utilization=np.array([report.pool_utilization for report in reports]),
+        fragmentation=np.array([report.fragmentation for report in reports]),
+        report=reports[-1],
+    )
@@ -0,0 +1,377 @@
+import json
+import os
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isfunction
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+# categories of the instrumented operations
+LOAD = "load"
+MUTATE = "mutate"
+SERIALIZE = "serialize"
+RENDER = "render"
+IO = "io"
+
+# mutators of the VNF and VDU classes
+MUTATOR = re.compile(r"^(add|remove|assign|unassign|allocate)", re.IGNORECASE)
+
+# file I/O functions of the Descriptor module
+IO_FUNCTIONS = (
+    "yaml_load",
+    "yaml_dump",
+    "read_vnfd_description",
+    "read_vnfd",
+    "stream_vnfd",
+    "write_vnfd",
+)
+
+# trace events kept at most, the timers keep counting past it.
+DEFAULT_MAX_EVENTS = 1_000_000
+
+
+class Profiler:
+    """Call counts and timings of the instrumented operations while profiling is enabled.
+
+    Every operation gets a timer with its number of calls, its cumulative
+    time, its self time (without the instrumented operations it calls) and
+    its longest call, all in nanoseconds. With objects, the descriptor
+    entities created are counted by class; with trace, every call is kept as
+    a Chrome trace event.
+    """
+
+    def __init__(self, trace: bool = False, objects: bool = True, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self._trace: bool = trace
+        self._objects: bool = objects
+        self._max_events: int = max_events
+        # name to [category, calls, total ns, self ns, max ns]
+        self._timers: Dict[str, list] = dict()
+        self._counts: Dict[str, int] = dict()
+        # (name, category, start ns, duration ns, thread id)
+        self._events: List[Tuple[str, str, int, int, int]] = list()
+        self._dropped: int = 0
+        self._local = threading.local()
+        # the timers, counts and events are shared by the threads calling the operations.
+        self._lock = threading.Lock()
+        self._start: int = perf_counter_ns()
+        self._end: int = None
+
+    def _call(self, name: str, category: str, function: Callable, args: tuple, kwargs: dict):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = list()
+        stack.append(0)
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            duration = perf_counter_ns() - start
+            children = stack.pop()
+            if len(stack) != 0:
+                stack[-1] += duration
+            with self._lock:
+                timer = self._timers.get(name)
+                if timer is None:
+                    timer = self._timers[name] = [category, 0, 0, 0, 0]
+                timer[1] += 1
+                timer[2] += duration
+                timer[3] += duration - children
+                if duration > timer[4]:
+                    timer[4] = duration
+                if self._trace:
+                    if len(self._events) < self._max_events:
+                        self._events.append((name, category, start, duration, threading.get_ident()))
+                    else:
+                        self._dropped += 1
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    @property
+    def timers(self):
+        """Get timers by operation name, as (category, calls, total ns, self ns, max ns)."""
+        with self._lock:
+            return {name: tuple(timer) for name, timer in self._timers.items()}
+
+    @property
+    def objects(self):
+        """Get number of descriptor entities created by class name."""
+        with self._lock:
+            return dict(self._counts)
+
+    @property
+    def events(self):
+        """Get trace events, as (name, category, start ns, duration ns, thread id)."""
+        with self._lock:
+            return list(self._events)
+
+    @property
+    def elapsed(self):
+        """Get profiled wall time in nanoseconds."""
+        end = self._end if self._end is not None else perf_counter_ns()
+        return end - self._start
+
+    def report(self) -> dict:
+        """Get the timers and object counts.
+
+        Returns:
+            dict: JSON serializable report.
+        """
+        with self._lock:
+            timers = [(name, tuple(timer)) for name, timer in self._timers.items()]
+            counts = dict(self._counts)
+            num_events = len(self._events)
+            dropped = self._dropped
+        return {
+            "elapsed_ns": self.elapsed,
+            "timers": {
+                name: {
+                    "category": category,
+                    "calls": calls,
+                    "total_ns": total,
+                    "self_ns": own,
+                    "max_ns": longest,
+                    "mean_ns": total // calls,
+                }
+                for name, (category, calls, total, own, longest) in sorted(timers, key=lambda item: -item[1][2])
+            },
+            "objects": dict(sorted(counts.items())),
+            "events": num_events,
+            "dropped_events": dropped,
+        }
+
+    def write_json(self, path: Union[str, Path]):
+        """Write the report as a JSON file.
+
+        Args:
+            path (Union[str, Path]): file path.
+        """
+        with open(path, "w") as json_file:
+            json.dump(self.report(), json_file, indent=2)
+
+    def chrome_trace(self) -> dict:
+        """Get the trace events in the Chrome trace event format, for chrome://tracing or Perfetto.
+
+        Returns:
+            dict: JSON serializable trace.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._start) / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, category, start, duration, tid in self.events
+        ]
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ns",
+            "otherData": {"objects": self.objects, "dropped_events": self._dropped},
+        }
+
+    def write_chrome_trace(self, path: Union[str, Path]):
+        """Write the trace events as a Chrome trace event file.
+
+        Args:
+            path (Union[str, Path]): file path.
+        """
+        with open(path, "w") as json_file:
+            json.dump(self.chrome_trace(), json_file)
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'operation':<40} {'category':<10} {'calls':>8} {'total':>10} {'self':>10} {'mean':>10} {'max':>10}"
+        ]
+        for name, timer in self.report()["timers"].items():
+            lines.append(
+                f"{name:<40} {timer['category']:<10} {timer['calls']:>8} "
+                f"{timer['total_ns'] / 1e6:>8.2f}ms {timer['self_ns'] / 1e6:>8.2f}ms "
+                f"{timer['mean_ns'] / 1e6:>8.3f}ms {timer['max_ns'] / 1e6:>8.2f}ms"
+            )
+        if len(self._counts) != 0:
+            lines.append(
+                "objects: " + ", ".join(f"{name} {count}" for name, count in sorted(self._counts.items()))
+            )
+        return "\n".join(lines)
+
+
+def _targets() -> List[Tuple[object, str, str]]:
+    """Get the (owner, attribute, category) of every instrumented operation."""
+    import Descriptor
+    from pyvis.network import Network
+    from VDU import VDU
+    from VNF import VNF
+
+    targets = [
+        (VNF, "load", LOAD),
+        (VNF, "yaml_repr", SERIALIZE),
+        (VNF, "visualization", RENDER),
+    ]
+    for cls in (VNF, VDU):
+        for name, attribute in sorted(vars(cls).items()):
+            if MUTATOR.match(name) and isfunction(attribute):
+                targets.append((cls, name, MUTATE))
+    for name in IO_FUNCTIONS:
+        targets.append((Descriptor, name, IO))
+    targets.append((Network, "save_graph", IO))
+    return targets
+
+
+def _entity_classes() -> List[type]:
+    """Get every descriptor entity class."""
+    from VDU import OsmEntity
+
+    classes = list()
+    pending = [OsmEntity]
+    while len(pending) != 0:
+        cls = pending.pop()
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+def _timed(profiler: Profiler, name: str, category: str, function: Callable) -> Callable:
+    @wraps(function)
+    def timed(*args, **kwargs):
+        return profiler._call(name, category, function, args, kwargs)
+
+    return timed
+
+
+def _counted(profiler: Profiler, cls: type, init: Callable) -> Callable:
+    name = cls.__name__
+
+    @wraps(init)
+    def counted(self, *args, **kwargs):
+        # subclasses count themselves, super().__init__() calls are not counted again.
+        if type(self) is cls:
+            profiler._count(name)
+        init(self, *args, **kwargs)
+
+    return counted
+
+
+_profiler: Profiler = None
+# (owner, attribute, original, owned) of every patched attribute
+_patches: List[Tuple[object, str, Callable, bool]] = list()
+# held while the operations are patched or restored, reentrant for profiling() to disable its own session.
+_lock = threading.RLock()
+
+
+def _patch(owner: object, name: str, replacement: Callable):
+    _patches.append((owner, name, getattr(owner, name), name in vars(owner)))
+    setattr(owner, name, replacement)
+
+
+def enable(trace: bool = False, objects: bool = True, max_events: int = DEFAULT_MAX_EVENTS) -> Profiler:
+    """Start profiling the VNF operations.
+
+    The operations are wrapped with timers only while profiling is enabled,
+    nothing is wrapped otherwise, so profiling costs nothing until enabled.
+
+    Args:
+        trace (bool, optional): keep every call as a trace event. Defaults to False.
+        objects (bool, optional): count the descriptor entities created. Defaults to True.
+        max_events (int, optional): trace events kept at most. Defaults to DEFAULT_MAX_EVENTS.
+
+    Raises:
+        RuntimeError: raise if profiling is already enabled.
+
+    Returns:
+        Profiler: the profiler collecting the timings.
+    """
+    global _profiler
+    with _lock:
+        if _profiler is not None:
+            raise RuntimeError("Profiling is already enabled.")
+        profiler = Profiler(trace, objects, max_events)
+
+        try:
+            for owner, name, category in _targets():
+                original = getattr(owner, name)
+                label = f"{getattr(owner, '__name__', owner)}.{name}"
+                timed = _timed(profiler, label, category, original)
+                _patch(owner, name, timed)
+                if isinstance(owner, type):
+                    continue
+                # modules that imported the function by name call their own reference.
+                for module in list(sys.modules.values()):
+                    if module is not owner and getattr(module, name, None) is original:
+                        _patch(module, name, timed)
+
+            if objects:
+                for cls in _entity_classes():
+                    _patch(cls, "__init__", _counted(profiler, cls, cls.__init__))
+        except BaseException:
+            _restore()
+            raise
+
+        _profiler = profiler
+        return profiler
+
+
+def _restore():
+    """Restore every patched attribute."""
+    while len(_patches) != 0:
+        owner, name, original, owned = _patches.pop()
+        if owned:
+            setattr(owner, name, original)
+        else:
+            delattr(owner, name)
+
+
+def disable() -> Profiler:
+    """Stop profiling and restore the operations.
+
+    Returns:
+        Profiler: the profiler of the session, None if profiling was not enabled.
+    """
+    global _profiler
+    with _lock:
+        profiler = _profiler
+        _restore()
+        _profiler = None
+        if profiler is not None:
+            profiler._end = perf_counter_ns()
+        return profiler
+
+
+def active() -> Profiler:
+    """Get the profiler of the current session.
+
+    Returns:
+        Profiler: the profiler, None if profiling is not enabled.
+    """
+    return _profiler
+
+
+@contextmanager
+def profiling(trace: bool = False, objects: bool = True, max_events: int = DEFAULT_MAX_EVENTS) -> Iterator[Profiler]:
+    """Profile the VNF operations of a block.
+
+    Args:
+        trace (bool, optional): keep every call as a trace event. Defaults to False.
+        objects (bool, optional): count the descriptor entities created. Defaults to True.
+        max_events (int, optional): trace events kept at most. Defaults to DEFAULT_MAX_EVENTS.
+
+    Yields:
+        Profiler: the profiler collecting the timings.
+    """
+    profiler = enable(trace, objects, max_events)
+    try:
+        yield profiler
+    finally:
+        with _lock:
+            # a session disabled in the block, and maybe another one enabled since, is left alone.
+            if _profiler is profiler:
+                disable()
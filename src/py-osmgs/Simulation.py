@@ -0,0 +1,2841 @@
+import os
+import pickle
+import zlib
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from heapq import heappush
+from itertools import count
+from math import ceil, exp, floor, inf, log, sqrt
+from random import Random
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+import simpy
+from simpy import Container, Environment, Event
+from simpy.events import NORMAL
+
+from Autoscaling import RELATIONAL_OPERATIONS, SCALE_IN, SCALE_OUT, ScalingEvent
+from VDU import (
+    CPU_UTIL,
+    MEM_UTIL_AVE,
+    VDU,
+    VirtualComputeDesc,
+    VirtualCpu,
+    VirtualInterface,
+    VirtualLink,
+    VirtualMemory,
+    VirtualStorage,
+    VirtualStorageDesc,
+)
+from VNF import VNF, ScalingAspect, ScalingPolicy
+
+# bandwidth of an internal virtual link in bit/s, a 10G virtual switch port.
+DEFAULT_LINK_BANDWIDTH = 10e9
+
+# service time distributions
+EXPONENTIAL = "exponential"
+DETERMINISTIC = "deterministic"
+LOGNORMAL = "lognormal"
+GAMMA = "gamma"
+SERVICE_DISTRIBUTIONS = (EXPONENTIAL, DETERMINISTIC, LOGNORMAL, GAMMA)
+
+# latency percentiles kept in the reports
+LATENCY_PERCENTILES = (50, 95, 99)
+
+# instance lifecycle states
+BOOTING = "booting"
+RUNNING = "running"
+DRAINING = "draining"
+STOPPED = "stopped"
+
+# boot time of an image without its own, in seconds.
+DEFAULT_BOOT_TIME = 60.0
+
+# monitoring metrics the simulation measures, the other ones never breach.
+SIMULATED_METRICS = (CPU_UTIL, MEM_UTIL_AVE)
+
+# simulation checkpoint file header and format version
+CHECKPOINT_MAGIC = b"OSMGSSIM"
+CHECKPOINT_VERSION = 2
+
+# steps of a request through a VDU, as kept for a checkpoint
+_ARRIVED, _LINK, _INTERFACE, _LATENCY, _WAITING, _SERVICE = range(6)
+
+
+class RequestProfile:
+    """Request load offered to a VDU.
+
+    Requests arrive as a Poisson process, each one holds its cpu, memory and
+    storage demand for a service time drawn from the service distribution. A
+    request with a network payload first receives it over the VDU interface
+    and the internal virtual link behind it.
+    """
+
+    def __init__(
+        self,
+        arrival_rate: float,
+        service_time: float,
+        cpu: float = 1.0,
+        memory: float = 0.0,
+        storage: float = 0.0,
+        network: float = 0.0,
+        distribution: str = EXPONENTIAL,
+        cv: float = 1.0,
+    ) -> None:
+        """Create a request profile.
+
+        Args:
+            arrival_rate (float): mean number of requests per second.
+            service_time (float): mean service time of a request in seconds.
+            cpu (float, optional): virtual cpus held by a request. Defaults to 1.0.
+            memory (float, optional): memory held by a request in GiB. Defaults to 0.0.
+            storage (float, optional): storage held by a request in GiB, on the first disk. Defaults to 0.0.
+            network (float, optional): payload received by a request in bytes. Defaults to 0.0.
+            distribution (str, optional): service time distribution, one of SERVICE_DISTRIBUTIONS. Defaults to EXPONENTIAL.
+            cv (float, optional): coefficient of variation of the lognormal and gamma service times. Defaults to 1.0.
+
+        Raises:
+            RuntimeError: raise if a rate, time or cv is not positive or the distribution is unknown.
+        """
+        if arrival_rate <= 0 or service_time <= 0:
+            raise RuntimeError("The arrival rate and the service time must be positive.")
+        if distribution not in SERVICE_DISTRIBUTIONS:
+            raise RuntimeError(
+                f"Unknown service time distribution {distribution}, expected one of {SERVICE_DISTRIBUTIONS}."
+            )
+        if cv <= 0:
+            raise RuntimeError("The coefficient of variation must be positive.")
+        self._arrival_rate: float = arrival_rate
+        self._service_time: float = service_time
+        self._cpu: float = cpu
+        self._memory: float = memory
+        self._storage: float = storage
+        self._network: float = network
+        self._distribution: str = distribution
+        self._cv: float = cv
+
+    @property
+    def arrival_rate(self):
+        """Get mean number of requests per second."""
+        return self._arrival_rate
+
+    @property
+    def service_time(self):
+        """Get mean service time in seconds."""
+        return self._service_time
+
+    @property
+    def cpu(self):
+        """Get virtual cpus held by a request."""
+        return self._cpu
+
+    @property
+    def memory(self):
+        """Get memory held by a request in GiB."""
+        return self._memory
+
+    @property
+    def storage(self):
+        """Get storage held by a request in GiB."""
+        return self._storage
+
+    @property
+    def network(self):
+        """Get payload received by a request in bytes."""
+        return self._network
+
+    @property
+    def distribution(self):
+        """Get service time distribution."""
+        return self._distribution
+
+    @property
+    def cv(self):
+        """Get coefficient of variation of the lognormal and gamma service times."""
+        return self._cv
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestProfile(arrival_rate={self.arrival_rate}, service_time={self.service_time}, "
+            f"cpu={self.cpu}, memory={self.memory}, storage={self.storage}, network={self.network}, "
+            f"distribution={self.distribution!r})"
+        )
+
+
+class Chain:
+    """Request path across the VDUs of a VNF.
+
+    Requests arrive at an external connection point, or directly at the first
+    VDU, are served by every VDU in turn and cross the internal virtual link
+    between two consecutive VDUs.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        arrival_rate: float,
+        vdus: Sequence[str],
+        ext_cp: str = None,
+        demands: Dict[str, RequestProfile] = None,
+    ) -> None:
+        """Create a chain.
+
+        Args:
+            id (str): id.
+            arrival_rate (float): mean number of requests per second.
+            vdus (Sequence[str]): ids of the VDUs visited, in order.
+            ext_cp (str, optional): external connection point the requests enter by, on the first VDU. Defaults to None.
+            demands (Dict[str, RequestProfile], optional): demand of a request at a VDU, its arrival rate is ignored. Defaults to the workload profile of the VDU.
+
+        Raises:
+            RuntimeError: raise if the arrival rate is not positive or no VDU is visited.
+        """
+        if arrival_rate <= 0:
+            raise RuntimeError("The arrival rate must be positive.")
+        if len(vdus) == 0:
+            raise RuntimeError(f"The chain {id} visits no VDU.")
+        self._id: str = id
+        self._arrival_rate: float = arrival_rate
+        self._vdus: List[str] = list(vdus)
+        self._ext_cp: str = ext_cp
+        self._demands: Dict[str, RequestProfile] = dict(demands) if demands is not None else dict()
+
+    @property
+    def id(self):
+        """Get id."""
+        return self._id
+
+    @property
+    def arrival_rate(self):
+        """Get mean number of requests per second."""
+        return self._arrival_rate
+
+    @property
+    def vdus(self):
+        """Get ids of the VDUs visited, in order."""
+        return self._vdus
+
+    @property
+    def ext_cp(self):
+        """Get external connection point the requests enter by."""
+        return self._ext_cp
+
+    @property
+    def demands(self):
+        """Get the per-VDU demands."""
+        return self._demands
+
+    def __repr__(self) -> str:
+        return f"Chain({self.id!r}, arrival_rate={self.arrival_rate}, vdus={self.vdus}, ext_cp={self.ext_cp!r})"
+
+
+class Workload:
+    """Request load offered to the VDUs of a VNF."""
+
+    def __init__(self, default: RequestProfile = None) -> None:
+        """Create a workload.
+
+        Args:
+            default (RequestProfile, optional): profile of the VDUs without their own. Defaults to no load.
+        """
+        self._default: RequestProfile = default
+        self._profiles: Dict[str, RequestProfile] = dict()
+        self._chains: Dict[str, Chain] = dict()
+
+    def add(self, vdu_id: str, profile: RequestProfile):
+        """Set the request profile of a VDU.
+
+        Args:
+            vdu_id (str): VDU id.
+            profile (RequestProfile): the request profile.
+        """
+        self._profiles[vdu_id] = profile
+
+    def add_chain(self, chain: Chain):
+        """Add a request path across the VDUs.
+
+        Args:
+            chain (Chain): the chain.
+
+        Raises:
+            RuntimeError: raise if a chain with the same id exists.
+        """
+        if chain.id in self._chains:
+            raise RuntimeError(f"The chain {chain.id} already exists.")
+        self._chains[chain.id] = chain
+
+    def profile(self, vdu_id: str):
+        """Get the request profile of a VDU.
+
+        Args:
+            vdu_id (str): VDU id.
+
+        Returns:
+            RequestProfile: the profile, None if the VDU gets no load.
+        """
+        return self._profiles.get(vdu_id, self._default)
+
+    @property
+    def default(self):
+        """Get profile of the VDUs without their own."""
+        return self._default
+
+    @property
+    def profiles(self):
+        """Get the per-VDU profiles."""
+        return self._profiles
+
+    @property
+    def chains(self):
+        """Get the chains by id."""
+        return self._chains
+
+
+class NetworkModel:
+    """Bandwidth of the virtual links and interfaces of a simulated VNF."""
+
+    def __init__(
+        self,
+        link_bandwidth: float = DEFAULT_LINK_BANDWIDTH,
+        links: Dict[str, float] = None,
+        interface_bandwidth: Dict[str, float] = None,
+    ) -> None:
+        """Create a network model.
+
+        Args:
+            link_bandwidth (float, optional): bandwidth of the internal virtual links in bit/s. Defaults to 10 Gbit/s.
+            links (Dict[str, float], optional): bandwidth by internal connection point id, overriding link_bandwidth. Defaults to None.
+            interface_bandwidth (Dict[str, float], optional): bandwidth by interface type, overriding INTERFACE_BANDWIDTH. Defaults to None.
+        """
+        self._link_bandwidth: float = link_bandwidth
+        self._links: Dict[str, float] = dict(links) if links is not None else dict()
+        self._interface_bandwidth: Dict[str, float] = (
+            dict(interface_bandwidth) if interface_bandwidth is not None else dict()
+        )
+
+    def link_bandwidth(self, int_cp_id: str) -> float:
+        """Get the bandwidth of an internal virtual link.
+
+        Args:
+            int_cp_id (str): internal connection point id.
+
+        Returns:
+            float: bandwidth in bit/s.
+        """
+        return self._links.get(int_cp_id, self._link_bandwidth)
+
+    @property
+    def interface_bandwidth(self):
+        """Get the bandwidth overrides by interface type."""
+        return self._interface_bandwidth
+
+
+class ScalingModel:
+    """Instance lifecycle of the automatic scaling in a simulation.
+
+    The automatic scaling policies of the VNF are evaluated every monitoring
+    interval against the measured cpu and memory utilization of the VDUs. A
+    scale out starts the instances of the aspect deltas, each one reserves
+    its compute and storage on the host, boots and only then takes requests.
+    A scale in drains the newest instances, they take no new request and
+    release their resources once the requests in flight are done.
+    """
+
+    def __init__(
+        self,
+        boot_times: Dict[str, float] = None,
+        default_boot_time: float = DEFAULT_BOOT_TIME,
+        monitoring_interval: float = 1.0,
+        host_cpu: float = None,
+        host_memory: float = None,
+        host_storage: float = None,
+    ) -> None:
+        """Create a scaling model.
+
+        Args:
+            boot_times (Dict[str, float], optional): boot time in seconds by image description id. Defaults to None.
+            default_boot_time (float, optional): boot time of the other images in seconds. Defaults to DEFAULT_BOOT_TIME.
+            monitoring_interval (float, optional): time between two evaluations of the policies in seconds. Defaults to 1.0.
+            host_cpu (float, optional): virtual cpus of the host, None for unlimited. Defaults to None.
+            host_memory (float, optional): memory of the host in GiB, None for unlimited. Defaults to None.
+            host_storage (float, optional): storage of the host in GiB, None for unlimited. Defaults to None.
+
+        Raises:
+            RuntimeError: raise if the monitoring interval is not positive.
+        """
+        if monitoring_interval <= 0:
+            raise RuntimeError("The monitoring interval must be positive.")
+        self._boot_times: Dict[str, float] = dict(boot_times) if boot_times is not None else dict()
+        self._default_boot_time: float = default_boot_time
+        self._monitoring_interval: float = monitoring_interval
+        self._host_cpu: float = host_cpu
+        self._host_memory: float = host_memory
+        self._host_storage: float = host_storage
+
+    def boot_time(self, vdu: VDU) -> float:
+        """Get the boot time of a VDU instance, from its software image.
+
+        Args:
+            vdu (VDU): the VDU.
+
+        Returns:
+            float: boot time in seconds.
+        """
+        for image in vdu.image:
+            if image in self._boot_times:
+                return self._boot_times[image]
+        return self._default_boot_time
+
+    @property
+    def boot_times(self):
+        """Get the boot times by image description id."""
+        return self._boot_times
+
+    @property
+    def default_boot_time(self):
+        """Get boot time of the images without their own."""
+        return self._default_boot_time
+
+    @property
+    def monitoring_interval(self):
+        """Get time between two evaluations of the policies in seconds."""
+        return self._monitoring_interval
+
+    @property
+    def host_cpu(self):
+        """Get virtual cpus of the host, None for unlimited."""
+        return self._host_cpu
+
+    @property
+    def host_memory(self):
+        """Get memory of the host in GiB, None for unlimited."""
+        return self._host_memory
+
+    @property
+    def host_storage(self):
+        """Get storage of the host in GiB, None for unlimited."""
+        return self._host_storage
+
+
+class InstanceLifecycle:
+    """Lifecycle of a simulated VDU instance, a time is None until the state is reached."""
+
+    def __init__(self, vdu_id: str, index: int, requested: float, breach: float = None) -> None:
+        self._vdu_id: str = vdu_id
+        self._index: int = index
+        self._breach: float = breach
+        self._requested: float = requested
+        self._running: float = None
+        self._draining: float = None
+        self._stopped: float = None
+
+    @property
+    def vdu_id(self):
+        """Get VDU id."""
+        return self._vdu_id
+
+    @property
+    def index(self):
+        """Get index of the instance in its VDU, 0 is the first instance."""
+        return self._index
+
+    @property
+    def breach(self):
+        """Get time the breach that scaled the instance out started, None for the initial instances."""
+        return self._breach
+
+    @property
+    def requested(self):
+        """Get time the instance was requested."""
+        return self._requested
+
+    @property
+    def running(self):
+        """Get time the instance booted and took its first request."""
+        return self._running
+
+    @property
+    def draining(self):
+        """Get time the instance was scaled in."""
+        return self._draining
+
+    @property
+    def stopped(self):
+        """Get time the instance released its resources."""
+        return self._stopped
+
+    @property
+    def state(self):
+        """Get state at the end of the simulation."""
+        if self._stopped is not None:
+            return STOPPED
+        if self._draining is not None:
+            return DRAINING
+        if self._running is not None:
+            return RUNNING
+        return BOOTING
+
+    def __repr__(self) -> str:
+        return f"InstanceLifecycle({self.vdu_id!r}, {self.index}, state={self.state!r})"
+
+
+class _ResourceMeter:
+    """Time integral of the amount of a resource in use and of its capacity."""
+
+    __slots__ = ("capacity", "in_use", "area", "last", "capacity_area", "capacity_last")
+
+    def __init__(self, capacity: float) -> None:
+        self.capacity: float = capacity
+        self.in_use: float = 0.0
+        self.area: float = 0.0
+        self.last: float = 0.0
+        self.capacity_area: float = 0.0
+        self.capacity_last: float = 0.0
+
+    def change(self, now: float, amount: float):
+        self.area += self.in_use * (now - self.last)
+        self.last = now
+        self.in_use += amount
+
+    def resize(self, now: float, amount: float):
+        self.capacity_area += self.capacity * (now - self.capacity_last)
+        self.capacity_last = now
+        self.capacity += amount
+
+    def totals(self, now: float) -> Tuple[float, float]:
+        """Get the time integrals of the amount in use and of the capacity up to now."""
+        return (
+            self.area + self.in_use * (now - self.last),
+            self.capacity_area + self.capacity * (now - self.capacity_last),
+        )
+
+    def utilization(self, now: float) -> float:
+        if self.capacity_area == 0:
+            if self.capacity == 0 or now == 0:
+                return 0.0
+            return self.mean(now) / self.capacity
+        area, capacity_area = self.totals(now)
+        return area / capacity_area
+
+    def mean(self, now: float) -> float:
+        if now == 0:
+            return 0.0
+        return (self.area + self.in_use * (now - self.last)) / now
+
+
+def _percent(totals: Tuple[float, float], last: Tuple[float, float]) -> float:
+    """Get the utilization in percent between two readings of a meter's totals."""
+    capacity = totals[1] - last[1]
+    if capacity <= 0:
+        return 0.0
+    return 100.0 * (totals[0] - last[0]) / capacity
+
+
+def _latency_percentiles(latencies: Sequence[float]) -> np.ndarray:
+    """Get the LATENCY_PERCENTILES of latency samples, zeros without samples."""
+    if len(latencies) == 0:
+        return np.zeros(len(LATENCY_PERCENTILES))
+    return np.percentile(np.frombuffer(latencies, dtype=np.float64), LATENCY_PERCENTILES)
+
+
+class VDUReport:
+    """Resource utilization and request statistics of a VDU."""
+
+    def __init__(
+        self,
+        vdu_id: str,
+        cpu_utilization: float,
+        memory_utilization: float,
+        storage_utilization: float,
+        arrived: int,
+        completed: int,
+        response_time: float,
+        network_utilization: float = 0.0,
+        throughput: float = 0.0,
+        latency: np.ndarray = None,
+        mean_queue_length: float = 0.0,
+        queue_length: np.ndarray = None,
+        scale_outs: int = 0,
+        scale_ins: int = 0,
+        mean_instances: float = 1.0,
+        scale_out_delay: float = 0.0,
+    ) -> None:
+        self._vdu_id: str = vdu_id
+        self._cpu_utilization: float = cpu_utilization
+        self._memory_utilization: float = memory_utilization
+        self._storage_utilization: float = storage_utilization
+        self._arrived: int = arrived
+        self._completed: int = completed
+        self._response_time: float = response_time
+        self._network_utilization: float = network_utilization
+        self._throughput: float = throughput
+        self._latency: np.ndarray = (
+            latency if latency is not None else np.zeros(len(LATENCY_PERCENTILES))
+        )
+        self._mean_queue_length: float = mean_queue_length
+        self._queue_length: np.ndarray = (
+            queue_length if queue_length is not None else np.zeros(0)
+        )
+        self._scale_outs: int = scale_outs
+        self._scale_ins: int = scale_ins
+        self._mean_instances: float = mean_instances
+        self._scale_out_delay: float = scale_out_delay
+
+    @property
+    def vdu_id(self):
+        """Get VDU id."""
+        return self._vdu_id
+
+    @property
+    def cpu_utilization(self):
+        """Get mean fraction of the virtual cpus in use."""
+        return self._cpu_utilization
+
+    @property
+    def memory_utilization(self):
+        """Get mean fraction of the virtual memory in use."""
+        return self._memory_utilization
+
+    @property
+    def storage_utilization(self):
+        """Get mean fraction of the first disk in use."""
+        return self._storage_utilization
+
+    @property
+    def network_utilization(self):
+        """Get fraction of the time the receiving interface was busy."""
+        return self._network_utilization
+
+    @property
+    def throughput(self):
+        """Get payload received per second in bytes."""
+        return self._throughput
+
+    @property
+    def arrived(self):
+        """Get number of requests that arrived."""
+        return self._arrived
+
+    @property
+    def completed(self):
+        """Get number of requests that completed."""
+        return self._completed
+
+    @property
+    def mean_response_time(self):
+        """Get mean time from arrival to completion of the completed requests, waiting included."""
+        if self._completed == 0:
+            return 0.0
+        return self._response_time / self._completed
+
+    @property
+    def latency(self):
+        """Get the LATENCY_PERCENTILES of the response time of the completed requests."""
+        return self._latency
+
+    @property
+    def latency_p50(self):
+        """Get median response time."""
+        return self._latency[0]
+
+    @property
+    def latency_p95(self):
+        """Get 95th percentile of the response time."""
+        return self._latency[1]
+
+    @property
+    def latency_p99(self):
+        """Get 99th percentile of the response time."""
+        return self._latency[2]
+
+    @property
+    def mean_queue_length(self):
+        """Get mean number of requests waiting for the VDU resources."""
+        return self._mean_queue_length
+
+    @property
+    def queue_length(self):
+        """Get number of requests waiting for the VDU resources, sampled every sample interval."""
+        return self._queue_length
+
+    @property
+    def scale_outs(self):
+        """Get number of scale out operations that added instances of the VDU."""
+        return self._scale_outs
+
+    @property
+    def scale_ins(self):
+        """Get number of scale in operations that removed instances of the VDU."""
+        return self._scale_ins
+
+    @property
+    def mean_instances(self):
+        """Get mean number of instances serving requests."""
+        return self._mean_instances
+
+    @property
+    def scale_out_delay(self):
+        """Get mean time from the start of a breach to the scaled out instance running, 0 without any."""
+        return self._scale_out_delay
+
+    def __repr__(self) -> str:
+        return (
+            f"VDUReport({self.vdu_id!r}, cpu={self.cpu_utilization:.3f}, "
+            f"memory={self.memory_utilization:.3f}, storage={self.storage_utilization:.3f}, "
+            f"network={self.network_utilization:.3f}, completed={self.completed}/{self.arrived})"
+        )
+
+
+class LinkReport:
+    """Utilization of an internal virtual link."""
+
+    def __init__(self, link_id: str, utilization: float, throughput: float) -> None:
+        self._link_id: str = link_id
+        self._utilization: float = utilization
+        self._throughput: float = throughput
+
+    @property
+    def link_id(self):
+        """Get internal connection point id."""
+        return self._link_id
+
+    @property
+    def utilization(self):
+        """Get fraction of the time the link was busy."""
+        return self._utilization
+
+    @property
+    def throughput(self):
+        """Get payload carried per second in bytes."""
+        return self._throughput
+
+    def __repr__(self) -> str:
+        return f"LinkReport({self.link_id!r}, utilization={self.utilization:.3f}, throughput={self.throughput:.0f})"
+
+
+class ChainReport:
+    """End-to-end request statistics of a chain."""
+
+    def __init__(
+        self,
+        chain_id: str,
+        arrived: int,
+        completed: int,
+        response_time: float,
+        latency: np.ndarray,
+    ) -> None:
+        self._chain_id: str = chain_id
+        self._arrived: int = arrived
+        self._completed: int = completed
+        self._response_time: float = response_time
+        self._latency: np.ndarray = latency
+
+    @property
+    def chain_id(self):
+        """Get chain id."""
+        return self._chain_id
+
+    @property
+    def arrived(self):
+        """Get number of requests that arrived."""
+        return self._arrived
+
+    @property
+    def completed(self):
+        """Get number of requests that left the last VDU."""
+        return self._completed
+
+    @property
+    def mean_response_time(self):
+        """Get mean end-to-end time of the completed requests."""
+        if self._completed == 0:
+            return 0.0
+        return self._response_time / self._completed
+
+    @property
+    def latency(self):
+        """Get the LATENCY_PERCENTILES of the end-to-end time of the completed requests."""
+        return self._latency
+
+    @property
+    def latency_p50(self):
+        """Get median end-to-end time."""
+        return self._latency[0]
+
+    @property
+    def latency_p95(self):
+        """Get 95th percentile of the end-to-end time."""
+        return self._latency[1]
+
+    @property
+    def latency_p99(self):
+        """Get 99th percentile of the end-to-end time."""
+        return self._latency[2]
+
+    def __repr__(self) -> str:
+        return (
+            f"ChainReport({self.chain_id!r}, p50={self.latency_p50:.4f}, p95={self.latency_p95:.4f}, "
+            f"p99={self.latency_p99:.4f}, completed={self.completed}/{self.arrived})"
+        )
+
+
+class SimulationReport:
+    """Per-VDU report of a simulation run."""
+
+    def __init__(
+        self,
+        until: float,
+        vdus: Dict[str, VDUReport],
+        seed: int = None,
+        links: Dict[str, LinkReport] = None,
+        chains: Dict[str, ChainReport] = None,
+        sample_interval: float = None,
+        scaling_events: List[ScalingEvent] = None,
+        instances: List[InstanceLifecycle] = None,
+    ) -> None:
+        self._until: float = until
+        self._vdus: Dict[str, VDUReport] = vdus
+        self._seed: int = seed
+        self._links: Dict[str, LinkReport] = links if links is not None else dict()
+        self._chains: Dict[str, ChainReport] = chains if chains is not None else dict()
+        self._sample_interval: float = sample_interval
+        self._scaling_events: List[ScalingEvent] = (
+            scaling_events if scaling_events is not None else list()
+        )
+        self._instances: List[InstanceLifecycle] = instances if instances is not None else list()
+
+    @property
+    def until(self):
+        """Get simulated time in seconds."""
+        return self._until
+
+    @property
+    def seed(self):
+        """Get random seed of the run, None if unseeded."""
+        return self._seed
+
+    @property
+    def vdus(self):
+        """Get the VDU reports by VDU id."""
+        return self._vdus
+
+    @property
+    def links(self):
+        """Get the internal virtual link reports by internal connection point id."""
+        return self._links
+
+    @property
+    def chains(self):
+        """Get the chain reports by chain id."""
+        return self._chains
+
+    @property
+    def sample_interval(self):
+        """Get interval between two queue length samples in seconds, None if not sampled."""
+        return self._sample_interval
+
+    @property
+    def scaling_events(self):
+        """Get the scaling operations in time order."""
+        return self._scaling_events
+
+    @property
+    def instances(self):
+        """Get the lifecycle of every VDU instance."""
+        return self._instances
+
+    def sample_times(self) -> np.ndarray:
+        """Get the simulated times the queue lengths were sampled at.
+
+        Returns:
+            np.ndarray: one time per sample.
+        """
+        if self._sample_interval is None or len(self._vdus) == 0:
+            return np.zeros(0)
+        num_samples = len(next(iter(self._vdus.values())).queue_length)
+        return np.arange(num_samples) * self._sample_interval
+
+    def vdu(self, vdu_id: str):
+        """Get the report of a VDU.
+
+        Args:
+            vdu_id (str): VDU id.
+
+        Returns:
+            VDUReport: the report, None if the VDU was not simulated.
+        """
+        return self._vdus.get(vdu_id)
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'VDU':<24}{'cpu':>8}{'memory':>8}{'storage':>9}{'network':>9}{'arrived':>9}{'completed':>11}"
+            f"{'response':>10}{'p95':>9}{'p99':>9}{'queue':>8}"
+        ]
+        for report in self._vdus.values():
+            lines.append(
+                f"{report.vdu_id:<24}{report.cpu_utilization:>8.1%}{report.memory_utilization:>8.1%}"
+                f"{report.storage_utilization:>9.1%}{report.network_utilization:>9.1%}{report.arrived:>9}"
+                f"{report.completed:>11}{report.mean_response_time:>9.3f}s{report.latency_p95:>8.3f}s"
+                f"{report.latency_p99:>8.3f}s{report.mean_queue_length:>8.2f}"
+            )
+        for report in self._links.values():
+            lines.append(
+                f"link {report.link_id:<19}{report.utilization:>8.1%}{report.throughput * 8 / 1e6:>12.1f} Mbit/s"
+            )
+        for report in self._chains.values():
+            lines.append(
+                f"chain {report.chain_id:<18}{report.arrived:>43}{report.completed:>11}"
+                f"{report.mean_response_time:>9.3f}s{report.latency_p95:>8.3f}s{report.latency_p99:>8.3f}s"
+            )
+        for event in self._scaling_events:
+            lines.append(
+                f"{event.time:>10.1f}s {event.direction:<10}{event.aspect_id:<16}level {event.scale_level}"
+            )
+        return "\n".join(lines)
+
+
+class _Instance:
+    """Resources of a simulated VDU instance."""
+
+    __slots__ = ("cpu", "memory", "storage", "state", "in_flight", "lifecycle", "reserved", "order", "until")
+
+    def __init__(
+        self,
+        cpu: VirtualCpu,
+        memory: VirtualMemory,
+        storage: List[VirtualStorage],
+        state: str,
+        lifecycle: InstanceLifecycle,
+    ) -> None:
+        self.cpu: VirtualCpu = cpu
+        # None for a VDU without virtual memory.
+        self.memory: VirtualMemory = memory
+        self.storage: List[VirtualStorage] = storage
+        self.state: str = state
+        self.in_flight: int = 0
+        self.lifecycle: InstanceLifecycle = lifecycle
+        # host reservations taken, order of the pending one and end of the boot.
+        self.reserved: int = 0
+        self.order: int = 0
+        self.until: float = None
+
+
+class _VDUState:
+    """Meters and counters of a simulated VDU."""
+
+    __slots__ = (
+        "vcd",
+        "vsd",
+        "instances",
+        "active",
+        "scale_outs",
+        "scale_ins",
+        "scale_out_delay",
+        "scaled_out",
+        "cpu",
+        "memory",
+        "storage",
+        "interface",
+        "link",
+        "network",
+        "received",
+        "arrived",
+        "completed",
+        "response_time",
+        "latencies",
+        "waiting",
+        "queue",
+    )
+
+    # meters and counters saved in a checkpoint
+    SAVED = (
+        "active",
+        "scale_outs",
+        "scale_ins",
+        "scale_out_delay",
+        "scaled_out",
+        "cpu",
+        "memory",
+        "storage",
+        "network",
+        "received",
+        "arrived",
+        "completed",
+        "response_time",
+        "latencies",
+        "waiting",
+        "queue",
+    )
+
+    def __init__(
+        self,
+        vdu: VDU,
+        links: Dict[str, "_LinkState"],
+        vcd: VirtualComputeDesc,
+        vsd: List[VirtualStorageDesc],
+    ) -> None:
+        self.vcd: VirtualComputeDesc = vcd
+        self.vsd: List[VirtualStorageDesc] = vsd
+        # the first instance serves with the resources of the VDU itself.
+        self.instances: List[_Instance] = [
+            _Instance(
+                vdu.virtual_cpu,
+                vdu.virtual_memory,
+                vdu.Virtual_storage,
+                RUNNING,
+                InstanceLifecycle(vdu.id, 0, 0.0),
+            )
+        ]
+        self.instances[0].lifecycle._running = 0.0
+        # instances serving requests, as a time integral.
+        self.active = _ResourceMeter(1.0)
+        self.active.change(0.0, 1)
+        self.scale_outs: int = 0
+        self.scale_ins: int = 0
+        self.scale_out_delay: float = 0.0
+        self.scaled_out: int = 0
+        self.cpu = _ResourceMeter(vdu.virtual_cpu.capacity)
+        self.memory = _ResourceMeter(vdu.virtual_memory.capacity if vdu.virtual_memory is not None else 0.0)
+        if len(vdu.Virtual_storage) != 0:
+            self.storage = _ResourceMeter(vdu.Virtual_storage[0].capacity)
+        else:
+            self.storage = _ResourceMeter(0.0)
+        # payloads come in through the first interface on an internal virtual link, or the first interface.
+        self.interface: VirtualInterface = None
+        self.link: _LinkState = None
+        for interface in vdu.interfaces:
+            if interface.vnf_internal_cp in links:
+                self.interface = vdu.virtual_interfaces[interface.id]
+                self.link = links[interface.vnf_internal_cp]
+                break
+        if self.interface is None and len(vdu.interfaces) != 0:
+            self.interface = vdu.virtual_interfaces[vdu.interfaces[0].id]
+        self.network = _ResourceMeter(1.0)
+        self.received: float = 0.0
+        self.arrived: int = 0
+        self.completed: int = 0
+        self.response_time: float = 0.0
+        self.latencies = array("d")
+        # requests waiting for the VDU resources, as a time integral and as samples.
+        self.waiting = _ResourceMeter(1.0)
+        self.queue = array("l")
+
+    def pick(self) -> _Instance:
+        """Get the running instance with the fewest requests in flight."""
+        best = None
+        for instance in self.instances:
+            if instance.state == RUNNING and (best is None or instance.in_flight < best.in_flight):
+                best = instance
+        return best
+
+    def count(self) -> int:
+        """Get number of instances booting or running."""
+        return sum(1 for instance in self.instances if instance.state in (BOOTING, RUNNING))
+
+
+class _LinkState:
+    """Simulated internal virtual link and its meter."""
+
+    __slots__ = ("link", "busy", "carried")
+
+    def __init__(self, link: VirtualLink) -> None:
+        self.link: VirtualLink = link
+        self.busy = _ResourceMeter(1.0)
+        self.carried: float = 0.0
+
+
+class _ChainState:
+    """Resolved hops and counters of a simulated chain."""
+
+    __slots__ = ("chain", "hops", "arrived", "completed", "response_time", "latencies")
+
+    def __init__(
+        self,
+        chain: Chain,
+        hops: List[Tuple[VDU, RequestProfile, _VDUState, VirtualInterface, _LinkState]],
+    ) -> None:
+        self.chain: Chain = chain
+        self.hops = hops
+        self.arrived: int = 0
+        self.completed: int = 0
+        self.response_time: float = 0.0
+        self.latencies = array("d")
+
+
+class _Request:
+    """Progress of a request through a VDU, or through the hops of a chain, enough to resume it."""
+
+    __slots__ = (
+        "vdu_id",
+        "profile",
+        "chain_id",
+        "hop",
+        "chain_arrival",
+        "arrival",
+        "phase",
+        "instance",
+        "held",
+        "until",
+        "order",
+    )
+
+    def __init__(
+        self, vdu_id: str, profile: RequestProfile, chain_id: str = None, chain_arrival: float = None
+    ) -> None:
+        self.vdu_id: str = vdu_id
+        self.profile: RequestProfile = profile
+        self.chain_id: str = chain_id
+        self.hop: int = 0
+        self.chain_arrival: float = chain_arrival
+        self.arrival: float = None
+        self.phase: int = _ARRIVED
+        # index of the instance serving it and number of cpu, memory and storage demands taken.
+        self.instance: int = None
+        self.held: int = 0
+        # end of the current transfer, latency or service, None when not started.
+        self.until: float = None
+        # order of the pending resource request, to queue it again in the same place.
+        self.order: int = 0
+
+    def next_hop(self, vdu_id: str, profile: RequestProfile):
+        """Move a chain request to its next VDU."""
+        self.hop += 1
+        self.vdu_id = vdu_id
+        self.profile = profile
+        self.arrival = None
+        self.phase = _ARRIVED
+        self.instance = None
+        self.held = 0
+        self.until = None
+
+
+# simpy has no public way to schedule an event at an absolute time nor to set the
+# level of a container, _Environment.timeout_at and _set_level use its internals.
+# They are checked against the simpy versions below, pinned in the dependencies of
+# pyproject.toml, and the checkpoint tests catch a change of those internals.
+SIMPY_VERSIONS = ((4, 0), (4, 2))
+
+
+def _check_simpy_version(version: str):
+    """Check that a simpy version is one the simulation internals work with.
+
+    Args:
+        version (str): the simpy version, as in simpy.__version__.
+    """
+    parts = tuple(int(part) for part in version.split(".")[:2] if part.isdigit())
+    if not SIMPY_VERSIONS[0] <= parts < SIMPY_VERSIONS[1]:
+        raise RuntimeError(f"simpy {version} is not supported, the simulation needs simpy>=4.0,<4.2.")
+
+
+_check_simpy_version(simpy.__version__)
+
+
+class _Environment(Environment):
+    """simpy environment that also schedules timeouts at an absolute time."""
+
+    def timeout_at(self, time: float) -> Event:
+        """Get an event that fires at a simulated time, the exact time a timeout saved in a checkpoint fires at."""
+        # env.timeout(time - env.now) could fire an ulp away from time and reorder simultaneous events.
+        event = Event(self)
+        event._ok = True
+        event._value = None
+        heappush(self._queue, (time, NORMAL, next(self._eid), event))
+        return event
+
+
+def _set_level(container: Container, level: float):
+    """Set the level of a container as saved, taking its complement out could round it."""
+    container._level = level
+
+
+def _instance_limits(vnf: VNF) -> Dict[str, Tuple[int, int]]:
+    """Get the (min, max) number of instances by VDU id, at least one instance, None for no maximum."""
+    limits = dict()
+    if len(vnf.df) != 0:
+        for vdu_profile in vnf.df[0].vdu_profile:
+            limits[vdu_profile.id] = (
+                max(1, vdu_profile.min_number_instances or 1),
+                vdu_profile.max_number_instances,
+            )
+    return limits
+
+
+def _policy_monitors(vnf: VNF, interval: float) -> List["_PolicyMonitor"]:
+    """Get a monitor for every automatic scaling policy of a VNF."""
+    monitors = list()
+    if len(vnf.df) == 0:
+        return monitors
+    # monitoring parameter id to the VDU and metric it measures.
+    parameters = dict()
+    for vdu in vnf.vdus:
+        for telemetry in vdu.telemetries:
+            if telemetry.performance_metric in SIMULATED_METRICS:
+                parameters[telemetry.id] = (vdu.id, telemetry.performance_metric)
+    for aspect in vnf.df[0].scaling_aspects:
+        for policy in aspect.scaling_policy:
+            if policy.scaling_type is not None and policy.scaling_type != "automatic":
+                continue
+            monitors.append(_PolicyMonitor(aspect, policy, parameters, interval))
+    return monitors
+
+
+class _PolicyMonitor:
+    """Online evaluation of an automatic scaling policy, one sample per monitoring interval."""
+
+    __slots__ = (
+        "aspect",
+        "policy",
+        "out_criteria",
+        "in_criteria",
+        "out_type",
+        "in_type",
+        "threshold_samples",
+        "cooldown_samples",
+        "out_run",
+        "in_run",
+        "out_since",
+        "in_since",
+        "ready",
+    )
+
+    def __init__(
+        self,
+        aspect: ScalingAspect,
+        policy: ScalingPolicy,
+        parameters: Dict[str, Tuple[str, str]],
+        interval: float,
+    ) -> None:
+        self.aspect: ScalingAspect = aspect
+        self.policy: ScalingPolicy = policy
+        self.out_criteria = list()
+        self.in_criteria = list()
+        for criteria in policy.scaling_criteria:
+            parameter = parameters.get(criteria.vnf_monitoring_param_ref)
+            if parameter is None:
+                continue
+            if criteria.scale_out_relational_operation is not None:
+                self.out_criteria.append(
+                    (
+                        parameter,
+                        RELATIONAL_OPERATIONS[criteria.scale_out_relational_operation],
+                        criteria.scale_out_threshold,
+                    )
+                )
+            if criteria.scale_in_relational_operation is not None:
+                self.in_criteria.append(
+                    (
+                        parameter,
+                        RELATIONAL_OPERATIONS[criteria.scale_in_relational_operation],
+                        criteria.scale_in_threshold,
+                    )
+                )
+        self.out_type: str = (policy.scale_out_operation_type or "OR").upper()
+        self.in_type: str = (policy.scale_in_operation_type or "OR").upper()
+        self.threshold_samples: int = max(1, ceil((policy.threshold_time or 0) / interval))
+        self.cooldown_samples: int = max(1, ceil((policy.cooldown_time or 0) / interval))
+        self.out_run: int = 0
+        self.in_run: int = 0
+        self.out_since: float = None
+        self.in_since: float = None
+        self.ready: int = 0
+
+    @staticmethod
+    def _breach(criteria: list, operation_type: str, values: Dict[Tuple[str, str], float]) -> bool:
+        if len(criteria) == 0:
+            return False
+        breaches = [bool(operation(values[parameter], threshold)) for parameter, operation, threshold in criteria]
+        if operation_type == "AND":
+            return all(breaches)
+        return any(breaches)
+
+    def update(self, sample: int, time: float, values: Dict[Tuple[str, str], float]):
+        """Account for a sample and get the direction the policy fires in, None if it does not."""
+        if self._breach(self.out_criteria, self.out_type, values):
+            if self.out_run == 0:
+                self.out_since = time
+            self.out_run += 1
+        else:
+            self.out_run = 0
+        if self._breach(self.in_criteria, self.in_type, values):
+            if self.in_run == 0:
+                self.in_since = time
+            self.in_run += 1
+        else:
+            self.in_run = 0
+
+        if sample < self.ready:
+            return None
+        if self.out_run >= self.threshold_samples:
+            return SCALE_OUT
+        if self.in_run >= self.threshold_samples:
+            return SCALE_IN
+        return None
+
+
+class Simulation:
+    """Discrete-event simulation of the request load on the VDUs of a VNF.
+
+    Every VDU gets its VirtualCpu, VirtualMemory and VirtualStorage containers
+    instantiated from its compute and storage descriptions, requests take
+    their demand out of the containers while being served and put it back
+    when done, so requests queue once a VDU is saturated.
+
+    Every internal virtual link is a VirtualLink shared by the interfaces
+    connected to it and every VDU interface a VirtualInterface whose
+    bandwidth and latency follow its type. Payloads cross the link, then
+    the interface, one transfer at a time on each.
+
+    Every VDU is a multi-server queue whose servers are the VirtualCpu units,
+    requests wait in FIFO order for their cpu, memory and storage. Chains of
+    the workload send requests through several VDUs, from an external
+    connection point over the VDU interfaces and the internal virtual links,
+    and their end-to-end latency is reported next to the per-VDU one.
+
+    With a ScalingModel, the automatic scaling policies add and remove VDU
+    instances while the simulation runs, requests are spread over the running
+    instances, so the latency shows the gap between a threshold breach and
+    the added capacity.
+
+    A simulation can be checkpointed to a file and restored later, as it was
+    or as a what-if branch with another workload or seed.
+    """
+
+    def __init__(
+        self,
+        vnf: VNF,
+        workload: Workload,
+        seed: int = None,
+        network: NetworkModel = None,
+        sample_interval: float = 1.0,
+        scaling: ScalingModel = None,
+        instances: Dict[str, int] = None,
+        scale_levels: Dict[str, int] = None,
+    ) -> None:
+        """Set up a simulation.
+
+        Args:
+            vnf (VNF): the VNF.
+            workload (Workload): the request load.
+            seed (int, optional): random seed. Defaults to None.
+            network (NetworkModel, optional): link and interface bandwidths. Defaults to NetworkModel().
+            sample_interval (float, optional): interval between two queue length samples in seconds, None to not sample. Defaults to 1.0.
+            scaling (ScalingModel, optional): instance lifecycle of the automatic scaling. Defaults to None, a single instance per VDU.
+            instances (Dict[str, int], optional): initial number of running instances by VDU id, with scaling. Defaults to the VDU profiles' min-number-of-instances.
+            scale_levels (Dict[str, int], optional): initial scale level by aspect id, with scaling. Defaults to 0.
+
+        Raises:
+            RuntimeError: raise if a VDU lacks its descriptions, a request needs more than a VDU has, a chain cannot be routed or the initial instances do not fit on the host.
+        """
+        # the VDUs are initialized on a copy, the VNF of the caller is not bound to the environment.
+        vnf = pickle.loads(pickle.dumps(vnf, protocol=pickle.HIGHEST_PROTOCOL))
+        self._setup(vnf, network, sample_interval, scaling, _Environment())
+        self._workload: Workload = workload
+        self._seed: int = seed
+        self._random = Random(seed)
+        self._instances: Dict[str, int] = dict(instances) if instances is not None else dict()
+        for aspect_id in self._levels:
+            self._levels[aspect_id] = (scale_levels or dict()).get(aspect_id, 0)
+        if scaling is not None:
+            for vdu in vnf.vdus:
+                self._reserve_initial(vdu, self._states[vdu.id])
+        self._start(workload)
+
+    def _setup(
+        self,
+        vnf: VNF,
+        network: NetworkModel,
+        sample_interval: float,
+        scaling: ScalingModel,
+        env: _Environment,
+    ):
+        """Instantiate the VDUs, links and host of a VNF in an environment, with nothing running yet."""
+        if sample_interval is not None and sample_interval <= 0:
+            raise RuntimeError("The sample interval must be positive.")
+        if network is None:
+            network = NetworkModel()
+        self._vnf: VNF = vnf
+        self._env: _Environment = env
+        self._network: NetworkModel = network
+        self._states: Dict[str, _VDUState] = dict()
+        self._chains: Dict[str, _ChainState] = dict()
+        self._sample_interval: float = sample_interval
+        self._scaling: ScalingModel = scaling
+        self._scaling_events: List[ScalingEvent] = list()
+        self._levels: Dict[str, int] = dict()
+        if len(vnf.df) != 0:
+            for aspect in vnf.df[0].scaling_aspects:
+                self._levels[aspect.id] = 0
+        self._host: Dict[str, Container] = dict()
+        if scaling is not None:
+            for name, capacity in (
+                ("cpu", scaling.host_cpu),
+                ("memory", scaling.host_memory),
+                ("storage", scaling.host_storage),
+            ):
+                if capacity is not None:
+                    self._host[name] = Container(env, capacity=capacity, init=capacity)
+        # links referenced by an interface but not declared in the descriptor are still simulated.
+        links_id = list(vnf.int_cps_id)
+        for vdu in vnf.vdus:
+            for interface in vdu.interfaces:
+                if interface.vnf_internal_cp is not None and interface.vnf_internal_cp not in links_id:
+                    links_id.append(interface.vnf_internal_cp)
+        self._links: Dict[str, _LinkState] = {
+            link_id: _LinkState(VirtualLink(env, network.link_bandwidth(link_id)))
+            for link_id in links_id
+        }
+
+        vcds = {vcd.id: vcd for vcd in vnf.virtual_compute_descriptions}
+        vsds = {vsd.id: vsd for vsd in vnf.virtual_storage_descriptions}
+        for vdu in vnf.vdus:
+            if vdu.vcd not in vcds:
+                raise RuntimeError(
+                    f"The virtual compute description {vdu.vcd} of VDU {vdu.id} cannot be found."
+                )
+            missing = [vsd for vsd in vdu.vsd if vsd not in vsds]
+            if len(missing) != 0:
+                raise RuntimeError(
+                    f"The virtual storage descriptions {missing} of VDU {vdu.id} cannot be found."
+                )
+            vdu.initialize(
+                env,
+                vcds[vdu.vcd],
+                [vsds[vsd] for vsd in vdu.vsd],
+                network.interface_bandwidth,
+            )
+            self._states[vdu.id] = _VDUState(
+                vdu, self._links, vcds[vdu.vcd], [vsds[vsd] for vsd in vdu.vsd]
+            )
+
+        # what a checkpoint needs besides the meters: the requests in flight, the
+        # order they queued in and when the pending timeout of every process fires.
+        self._in_flight: Set[_Request] = set()
+        self._order = count()
+        self._timers: Dict[object, float] = dict()
+        self._monitors: List[_PolicyMonitor] = list()
+        if scaling is not None:
+            self._monitors = _policy_monitors(vnf, scaling.monitoring_interval)
+        self._scaling_sample: int = 0
+        self._previous = {
+            vdu_id: (state.cpu.totals(0.0), state.memory.totals(0.0))
+            for vdu_id, state in self._states.items()
+        }
+
+    def _start(self, workload: Workload):
+        """Start the arrivals of a workload, the queue sampling and the automatic scaling."""
+        for vdu in self._vnf.vdus:
+            profile = workload.profile(vdu.id)
+            if profile is None:
+                continue
+            state = self._states[vdu.id]
+            self._check_fit(vdu, profile, state, state.interface)
+            self._env.process(self._arrivals(vdu, profile, state))
+
+        for chain in workload.chains.values():
+            hops = self._route(self._vnf, chain, workload)
+            if chain.id in self._chains:
+                # a restored chain keeps its counters.
+                self._chains[chain.id].chain = chain
+                self._chains[chain.id].hops = hops
+            else:
+                self._chains[chain.id] = _ChainState(chain, hops)
+            self._env.process(self._chain_arrivals(self._chains[chain.id]))
+
+        if self._sample_interval is not None:
+            self._env.process(self._sample_queues())
+
+        if len(self._monitors) != 0:
+            self._env.process(self._autoscale())
+
+    def _demand(self, state: _VDUState) -> Dict[str, float]:
+        """Get the host resources an instance of a VDU reserves."""
+        return {
+            "cpu": state.vcd.number_virtual_cpu,
+            "memory": state.vcd.memory_gib,
+            "storage": sum(vsd.storage_gib for vsd in state.vsd),
+        }
+
+    def _reserve_initial(self, vdu: VDU, state: _VDUState):
+        """Start the initial instances of a VDU and reserve them on the host."""
+        count = self._instances.get(vdu.id, _instance_limits(self._vnf).get(vdu.id, (1, None))[0])
+        if count < 1:
+            raise RuntimeError(f"The VDU {vdu.id} needs at least one instance.")
+        for index in range(1, count):
+            instance = self._new_instance(vdu, state, RUNNING, None)
+            instance.lifecycle._running = 0.0
+            self._resize(state, instance, 1)
+        demand = self._demand(state)
+        for name, container in self._host.items():
+            if demand[name] * count > container.level:
+                raise RuntimeError(
+                    f"The {count} initial instances of VDU {vdu.id} do not fit on the host {name}."
+                )
+            if demand[name] > 0:
+                container.get(demand[name] * count)
+
+    def _new_instance(self, vdu: VDU, state: _VDUState, status: str, breach: float) -> _Instance:
+        instance = _Instance(
+            VirtualCpu(self._env, state.vcd.number_virtual_cpu),
+            VirtualMemory(self._env, state.vcd.memory_gib) if state.vcd.memory_gib > 0 else None,
+            [VirtualStorage(self._env, vsd.storage_gib) for vsd in state.vsd if vsd.storage_gib > 0],
+            status,
+            InstanceLifecycle(vdu.id, len(state.instances), self._env.now, breach),
+        )
+        state.instances.append(instance)
+        return instance
+
+    def _resize(self, state: _VDUState, instance: _Instance, sign: int):
+        """Add or remove the capacity of an instance to the meters of its VDU."""
+        now = self._env.now
+        state.active.change(now, sign)
+        state.cpu.resize(now, sign * instance.cpu.capacity)
+        if instance.memory is not None:
+            state.memory.resize(now, sign * instance.memory.capacity)
+        if len(instance.storage) != 0:
+            state.storage.resize(now, sign * instance.storage[0].capacity)
+
+    def _boot(self, vdu: VDU, state: _VDUState, instance: _Instance):
+        demand = self._demand(state)
+        reservations = [
+            (container, demand[name]) for name, container in self._host.items() if demand[name] > 0
+        ]
+        for container, amount in reservations[instance.reserved :]:
+            instance.order = next(self._order)
+            yield container.get(amount)
+            instance.reserved += 1
+        if instance.until is None:
+            boot_time = self._scaling.boot_time(vdu)
+            instance.until = self._env.now + boot_time
+            yield self._env.timeout(boot_time)
+        else:
+            yield self._env.timeout_at(instance.until)
+        if instance.state == DRAINING:
+            # scaled in while booting, it never serves.
+            self._stop(state, instance)
+            return
+        instance.state = RUNNING
+        instance.lifecycle._running = self._env.now
+        self._resize(state, instance, 1)
+        state.scaled_out += 1
+        state.scale_out_delay += self._env.now - instance.lifecycle.breach
+
+    def _stop(self, state: _VDUState, instance: _Instance):
+        if instance.lifecycle.running is not None:
+            self._resize(state, instance, -1)
+        instance.state = STOPPED
+        instance.lifecycle._stopped = self._env.now
+        demand = self._demand(state)
+        for name, container in self._host.items():
+            if demand[name] > 0:
+                container.put(demand[name])
+
+    def _autoscale(self):
+        """Evaluate the automatic scaling policies every monitoring interval."""
+        interval = self._scaling.monitoring_interval
+        monitors = self._monitors
+        levels = self._levels
+        limits = _instance_limits(self._vnf)
+        vdus = {vdu.id: vdu for vdu in self._vnf.vdus}
+        previous = self._previous
+        resume = "autoscale" in self._timers
+        while True:
+            if resume:
+                resume = False
+                yield self._env.timeout_at(self._timers["autoscale"])
+            else:
+                self._timers["autoscale"] = self._env.now + interval
+                yield self._env.timeout(interval)
+            self._scaling_sample += 1
+            sample = self._scaling_sample
+            now = self._env.now
+            values = dict()
+            for vdu_id, state in self._states.items():
+                cpu, memory = state.cpu.totals(now), state.memory.totals(now)
+                last_cpu, last_memory = previous[vdu_id]
+                values[(vdu_id, CPU_UTIL)] = _percent(cpu, last_cpu)
+                values[(vdu_id, MEM_UTIL_AVE)] = _percent(memory, last_memory)
+                previous[vdu_id] = (cpu, memory)
+
+            for monitor in monitors:
+                direction = monitor.update(sample, now, values)
+                if direction is None:
+                    continue
+                aspect = monitor.aspect
+                if direction == SCALE_OUT:
+                    if aspect.max_scale_level is not None and levels[aspect.id] >= aspect.max_scale_level:
+                        continue
+                elif levels[aspect.id] <= 0:
+                    continue
+                sign = 1 if direction == SCALE_OUT else -1
+                scaled = dict()
+                for deltas in aspect.aspect_delta_details:
+                    for vdu_id, number_of_instances in deltas.vdu_delta:
+                        if vdu_id in self._states:
+                            scaled[vdu_id] = scaled.get(vdu_id, 0) + number_of_instances
+                refused = False
+                for vdu_id, number_of_instances in scaled.items():
+                    minimum, maximum = limits.get(vdu_id, (1, None))
+                    count = self._states[vdu_id].count() + sign * number_of_instances
+                    if count < minimum or (maximum is not None and count > maximum):
+                        refused = True
+                if refused:
+                    continue
+
+                breach = monitor.out_since if direction == SCALE_OUT else monitor.in_since
+                for vdu_id, number_of_instances in scaled.items():
+                    state = self._states[vdu_id]
+                    if direction == SCALE_OUT:
+                        state.scale_outs += 1
+                        for _ in range(number_of_instances):
+                            instance = self._new_instance(vdus[vdu_id], state, BOOTING, breach)
+                            self._env.process(self._boot(vdus[vdu_id], state, instance))
+                    else:
+                        state.scale_ins += 1
+                        self._drain(state, number_of_instances)
+                levels[aspect.id] += sign
+                monitor.ready = sample + monitor.cooldown_samples
+                self._scaling_events.append(
+                    ScalingEvent(
+                        sample=sample,
+                        time=now,
+                        aspect_id=aspect.id,
+                        policy=monitor.policy.name,
+                        direction=direction,
+                        scale_level=levels[aspect.id],
+                        instances={vdu_id: state.count() for vdu_id, state in self._states.items()},
+                    )
+                )
+
+    def _drain(self, state: _VDUState, number_of_instances: int):
+        """Drain the newest booting or running instances of a VDU."""
+        for instance in reversed(state.instances):
+            if number_of_instances == 0:
+                break
+            if instance.state not in (BOOTING, RUNNING):
+                continue
+            booting = instance.state == BOOTING
+            instance.state = DRAINING
+            instance.lifecycle._draining = self._env.now
+            number_of_instances -= 1
+            if not booting and instance.in_flight == 0:
+                self._stop(state, instance)
+
+    def _check_fit(
+        self, vdu: VDU, profile: RequestProfile, state: _VDUState, interface: VirtualInterface
+    ):
+        if (
+            profile.cpu > state.cpu.capacity
+            or profile.memory > state.memory.capacity
+            or profile.storage > state.storage.capacity
+        ):
+            raise RuntimeError(
+                f"A request of {profile} does not fit in VDU {vdu.id}."
+            )
+        if profile.network > 0 and interface is None:
+            raise RuntimeError(
+                f"The VDU {vdu.id} has no interface to receive request payloads."
+            )
+
+    def _route(
+        self, vnf: VNF, chain: Chain, workload: Workload
+    ) -> List[Tuple[VDU, RequestProfile, _VDUState, VirtualInterface, _LinkState]]:
+        """Resolve the VDUs, demands, interfaces and links of the hops of a chain."""
+        vdus = {vdu.id: vdu for vdu in vnf.vdus}
+        hops = list()
+        previous: VDU = None
+        for vdu_id in chain.vdus:
+            if vdu_id not in vdus:
+                raise RuntimeError(f"The VDU {vdu_id} of chain {chain.id} cannot be found.")
+            vdu = vdus[vdu_id]
+            state = self._states[vdu_id]
+            profile = chain.demands.get(vdu_id, workload.profile(vdu_id))
+            if profile is None:
+                raise RuntimeError(f"The chain {chain.id} has no demand for VDU {vdu_id}.")
+
+            interface, link = state.interface, state.link
+            if previous is None and chain.ext_cp is not None:
+                ext_cp = next((ext_cp for ext_cp in vnf.ext_cps if ext_cp.id == chain.ext_cp), None)
+                if ext_cp is None:
+                    raise RuntimeError(
+                        f"The external connection point {chain.ext_cp} of chain {chain.id} cannot be found."
+                    )
+                if ext_cp.vdu_id != vdu_id or ext_cp.vdu_interface not in vdu.virtual_interfaces:
+                    raise RuntimeError(
+                        f"The external connection point {chain.ext_cp} is not an interface of VDU {vdu_id}."
+                    )
+                interface, link = vdu.virtual_interfaces[ext_cp.vdu_interface], None
+            elif previous is not None:
+                previous_links = {
+                    prev_interface.vnf_internal_cp for prev_interface in previous.interfaces
+                }
+                shared = next(
+                    (
+                        vdu_interface
+                        for vdu_interface in vdu.interfaces
+                        if vdu_interface.vnf_internal_cp is not None
+                        and vdu_interface.vnf_internal_cp in previous_links
+                    ),
+                    None,
+                )
+                if shared is None:
+                    raise RuntimeError(
+                        f"The VDUs {previous.id} and {vdu_id} of chain {chain.id} share no internal virtual link."
+                    )
+                interface = vdu.virtual_interfaces[shared.id]
+                link = self._links[shared.vnf_internal_cp]
+
+            self._check_fit(vdu, profile, state, interface)
+            hops.append((vdu, profile, state, interface, link))
+            previous = vdu
+        return hops
+
+    @property
+    def env(self):
+        """Get the simpy environment."""
+        return self._env
+
+    @property
+    def now(self):
+        """Get current simulated time in seconds."""
+        return self._env.now
+
+    def _arrivals(self, vdu: VDU, profile: RequestProfile, state: _VDUState):
+        env = self._env
+        key = ("arrival", vdu.id)
+        resume = key in self._timers
+        while True:
+            if resume:
+                resume = False
+                yield env.timeout_at(self._timers[key])
+            else:
+                delay = self._random.expovariate(profile.arrival_rate)
+                self._timers[key] = env.now + delay
+                yield env.timeout(delay)
+            record = _Request(vdu.id, profile)
+            self._in_flight.add(record)
+            env.process(self._request(vdu, state, state.interface, state.link, record))
+
+    def _chain_arrivals(self, chain_state: _ChainState):
+        env = self._env
+        key = ("chain", chain_state.chain.id)
+        resume = key in self._timers
+        while True:
+            if resume:
+                resume = False
+                yield env.timeout_at(self._timers[key])
+            else:
+                delay = self._random.expovariate(chain_state.chain.arrival_rate)
+                self._timers[key] = env.now + delay
+                yield env.timeout(delay)
+            vdu, profile = chain_state.hops[0][:2]
+            record = _Request(vdu.id, profile, chain_state.chain.id, env.now)
+            chain_state.arrived += 1
+            self._in_flight.add(record)
+            env.process(self._chain_request(chain_state, chain_state.hops, record))
+
+    def _chain_request(
+        self,
+        chain_state: _ChainState,
+        hops: List[Tuple[VDU, RequestProfile, _VDUState, VirtualInterface, _LinkState]],
+        record: _Request,
+    ):
+        while True:
+            vdu, _, state, interface, link = hops[record.hop]
+            yield from self._request(vdu, state, interface, link, record)
+            if record.hop + 1 == len(hops):
+                break
+            vdu, profile = hops[record.hop + 1][:2]
+            record.next_hop(vdu.id, profile)
+        latency = self._env.now - record.chain_arrival
+        chain_state.completed += 1
+        chain_state.response_time += latency
+        chain_state.latencies.append(latency)
+        self._in_flight.discard(record)
+
+    def _sample_queues(self):
+        states = list(self._states.values())
+        if "sample" in self._timers:
+            yield self._env.timeout_at(self._timers["sample"])
+        while True:
+            for state in states:
+                state.queue.append(int(state.waiting.in_use))
+            self._timers["sample"] = self._env.now + self._sample_interval
+            yield self._env.timeout(self._sample_interval)
+
+    def _service_time(self, profile: RequestProfile) -> float:
+        """Draw a service time from the distribution of a profile."""
+        mean = profile.service_time
+        if profile.distribution == EXPONENTIAL:
+            return self._random.expovariate(1.0 / mean)
+        if profile.distribution == DETERMINISTIC:
+            return mean
+        if profile.distribution == LOGNORMAL:
+            sigma2 = log(1.0 + profile.cv**2)
+            return self._random.lognormvariate(log(mean) - sigma2 / 2, sqrt(sigma2))
+        shape = 1.0 / profile.cv**2
+        return self._random.gammavariate(shape, mean / shape)
+
+    def _timeout(self, record: _Request, delay: float) -> Event:
+        """Start a timed step of a request, or get back to the one it was in at the checkpoint."""
+        if record.until is None:
+            record.until = self._env.now + delay
+            return self._env.timeout(delay)
+        return self._env.timeout_at(record.until)
+
+    def _transfer(self, resource, meter: _ResourceMeter, duration: float, record: _Request):
+        """Send the payload of a request over a link or an interface, one transfer at a time."""
+        env = self._env
+        record.order = next(self._order)
+        with resource.request() as request:
+            yield request
+            # a restored transfer is already on the meter.
+            if record.until is None:
+                meter.change(env.now, 1)
+            yield self._timeout(record, duration)
+            record.until = None
+            meter.change(env.now, -1)
+
+    def _request(
+        self,
+        vdu: VDU,
+        state: _VDUState,
+        interface: VirtualInterface,
+        link: "_LinkState",
+        record: _Request,
+    ):
+        env = self._env
+        profile = record.profile
+        if record.phase == _ARRIVED:
+            record.arrival = env.now
+            state.arrived += 1
+            record.phase = _LINK
+
+        if profile.network > 0 and record.phase < _WAITING:
+            bits = profile.network * 8
+            if record.phase == _LINK:
+                if link is not None:
+                    yield from self._transfer(link.link, link.busy, bits / link.link.bandwidth, record)
+                    link.carried += profile.network
+                record.phase = _INTERFACE
+            if record.phase == _INTERFACE:
+                yield from self._transfer(interface, state.network, bits / interface.bandwidth, record)
+                record.phase = _LATENCY
+            yield self._timeout(record, interface.latency)
+            record.until = None
+            state.received += profile.network
+
+        if record.phase < _WAITING:
+            record.phase = _WAITING
+            state.waiting.change(env.now, 1)
+            instance = state.pick()
+            instance.in_flight += 1
+            record.instance = instance.lifecycle.index
+        instance = state.instances[record.instance]
+        if record.phase == _WAITING:
+            if record.held == 0:
+                if profile.cpu > 0:
+                    record.order = next(self._order)
+                    yield instance.cpu.get(profile.cpu)
+                    state.cpu.change(env.now, profile.cpu)
+                record.held = 1
+            if record.held == 1:
+                if profile.memory > 0:
+                    record.order = next(self._order)
+                    yield instance.memory.get(profile.memory)
+                    state.memory.change(env.now, profile.memory)
+                record.held = 2
+            if record.held == 2:
+                if profile.storage > 0:
+                    record.order = next(self._order)
+                    yield instance.storage[0].get(profile.storage)
+                    state.storage.change(env.now, profile.storage)
+                record.held = 3
+            state.waiting.change(env.now, -1)
+            record.phase = _SERVICE
+
+        if record.until is None:
+            yield self._timeout(record, self._service_time(profile))
+        else:
+            yield env.timeout_at(record.until)
+
+        if profile.storage > 0:
+            state.storage.change(env.now, -profile.storage)
+            yield instance.storage[0].put(profile.storage)
+        if profile.memory > 0:
+            state.memory.change(env.now, -profile.memory)
+            yield instance.memory.put(profile.memory)
+        if profile.cpu > 0:
+            state.cpu.change(env.now, -profile.cpu)
+            yield instance.cpu.put(profile.cpu)
+        instance.in_flight -= 1
+        if instance.state == DRAINING and instance.in_flight == 0:
+            self._stop(state, instance)
+
+        latency = env.now - record.arrival
+        state.completed += 1
+        state.response_time += latency
+        state.latencies.append(latency)
+        if record.chain_id is None:
+            self._in_flight.discard(record)
+
+    def latencies(self, vdu_id: str = None, chain_id: str = None) -> np.ndarray:
+        """Get the response time of every completed request of a VDU or of a chain.
+
+        Args:
+            vdu_id (str, optional): VDU id. Defaults to None.
+            chain_id (str, optional): chain id, used if no VDU id is given. Defaults to None.
+
+        Raises:
+            RuntimeError: raise if the VDU or the chain is not simulated.
+
+        Returns:
+            np.ndarray: the response times in completion order.
+        """
+        if vdu_id is not None:
+            if vdu_id not in self._states:
+                raise RuntimeError(f"The VDU {vdu_id} is not simulated.")
+            latencies = self._states[vdu_id].latencies
+        else:
+            if chain_id not in self._chains:
+                raise RuntimeError(f"The chain {chain_id} is not simulated.")
+            latencies = self._chains[chain_id].latencies
+        return np.array(latencies, dtype=np.float64)
+
+    @property
+    def scale_levels(self):
+        """Get the current scale level by aspect id."""
+        return dict(self._levels)
+
+    def instance_counts(self) -> Dict[str, int]:
+        """Get the number of booting or running instances of every VDU.
+
+        Returns:
+            Dict[str, int]: the counts by VDU id.
+        """
+        return {vdu_id: state.count() for vdu_id, state in self._states.items()}
+
+    def checkpoint(self, path: str):
+        """Save the state of the simulation to a file, to resume it or fork what-if runs from it.
+
+        The file holds the VNF, the workload, the simulated clock, the level of
+        every VirtualCpu, VirtualMemory and VirtualStorage container, the meters,
+        the scaling state, the requests in flight and the random generator state,
+        as a compressed pickle.
+
+        Args:
+            path (str): file to write.
+        """
+        vdus = dict()
+        for vdu_id, state in self._states.items():
+            saved = {name: getattr(state, name) for name in _VDUState.SAVED}
+            saved["instances"] = [
+                (
+                    instance.cpu.level,
+                    instance.memory.level if instance.memory is not None else None,
+                    [storage.level for storage in instance.storage],
+                    instance.state,
+                    instance.in_flight,
+                    instance.lifecycle,
+                    instance.reserved,
+                    instance.order,
+                    instance.until,
+                )
+                for instance in state.instances
+            ]
+            vdus[vdu_id] = saved
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "vnf": self._vnf,
+            "workload": self._workload,
+            "seed": self._seed,
+            "network": self._network,
+            "sample_interval": self._sample_interval,
+            "scaling": self._scaling,
+            "now": self._env.now,
+            "random": self._random.getstate(),
+            "order": next(self._order),
+            "timers": self._timers,
+            "levels": self._levels,
+            "scaling_events": self._scaling_events,
+            "scaling_sample": self._scaling_sample,
+            "previous": self._previous,
+            "monitors": [
+                (monitor.out_run, monitor.in_run, monitor.out_since, monitor.in_since, monitor.ready)
+                for monitor in self._monitors
+            ],
+            "host": {name: container.level for name, container in self._host.items()},
+            "vdus": vdus,
+            "links": {link_id: (link.busy, link.carried) for link_id, link in self._links.items()},
+            "chains": {
+                chain_id: (
+                    chain_state.arrived,
+                    chain_state.completed,
+                    chain_state.response_time,
+                    chain_state.latencies,
+                )
+                for chain_id, chain_state in self._chains.items()
+            },
+            "requests": sorted(self._in_flight, key=lambda record: record.order),
+        }
+        with open(path, "wb") as file:
+            file.write(CHECKPOINT_MAGIC)
+            file.write(zlib.compress(pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    @classmethod
+    def restore(cls, path: str, workload: Workload = None, seed: int = None) -> "Simulation":
+        """Resume a simulation from a checkpoint.
+
+        Restored without a workload or a seed, the simulation runs on exactly as
+        it would have without the checkpoint. A workload or a seed forks a
+        what-if branch: the arrivals restart from the checkpoint time with the
+        new workload, or the random draws with the new seed, while the requests
+        in flight finish as they started.
+
+        Args:
+            path (str): file written by checkpoint().
+            workload (Workload, optional): workload to go on with. Defaults to None, the one of the checkpoint.
+            seed (int, optional): new random seed. Defaults to None, the random state of the checkpoint.
+
+        Raises:
+            RuntimeError: raise if the file is not a checkpoint of this version or the workload cannot be simulated.
+
+        Returns:
+            Simulation: the simulation at the checkpoint time.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if not data.startswith(CHECKPOINT_MAGIC):
+            raise RuntimeError(f"The file {path} is not a simulation checkpoint.")
+        checkpoint = pickle.loads(zlib.decompress(data[len(CHECKPOINT_MAGIC) :]))
+        if checkpoint["version"] != CHECKPOINT_VERSION:
+            raise RuntimeError(
+                f"The checkpoint {path} has version {checkpoint['version']}, expected {CHECKPOINT_VERSION}."
+            )
+        simulation = cls.__new__(cls)
+        simulation._resume(checkpoint, workload, seed)
+        return simulation
+
+    def _resume(self, checkpoint: dict, workload: Workload, seed: int):
+        """Rebuild the state saved in a checkpoint and restart its processes."""
+        vnf: VNF = checkpoint["vnf"]
+        self._setup(
+            vnf,
+            checkpoint["network"],
+            checkpoint["sample_interval"],
+            checkpoint["scaling"],
+            _Environment(initial_time=checkpoint["now"]),
+        )
+        self._workload = workload if workload is not None else checkpoint["workload"]
+        self._seed = seed if seed is not None else checkpoint["seed"]
+        self._random = Random(seed)
+        if seed is None:
+            self._random.setstate(checkpoint["random"])
+        self._instances = dict()
+        self._order = count(checkpoint["order"])
+        self._timers = checkpoint["timers"]
+        if workload is not None:
+            # the arrivals of the new workload start over.
+            self._timers = {key: time for key, time in self._timers.items() if not isinstance(key, tuple)}
+        self._levels = checkpoint["levels"]
+        self._scaling_events = checkpoint["scaling_events"]
+        self._scaling_sample = checkpoint["scaling_sample"]
+        self._previous = checkpoint["previous"]
+        for monitor, saved in zip(self._monitors, checkpoint["monitors"]):
+            monitor.out_run, monitor.in_run, monitor.out_since, monitor.in_since, monitor.ready = saved
+        for name, level in checkpoint["host"].items():
+            _set_level(self._host[name], level)
+
+        vdus = {vdu.id: vdu for vdu in vnf.vdus}
+        resumed = list()
+        for vdu_id, saved in checkpoint["vdus"].items():
+            state = self._states[vdu_id]
+            for index, (cpu, memory, storage, status, in_flight, lifecycle, reserved, order, until) in enumerate(
+                saved["instances"]
+            ):
+                if index == 0:
+                    instance = state.instances[0]
+                else:
+                    instance = self._new_instance(vdus[vdu_id], state, status, None)
+                _set_level(instance.cpu, cpu)
+                if instance.memory is not None:
+                    _set_level(instance.memory, memory)
+                for container, level in zip(instance.storage, storage):
+                    _set_level(container, level)
+                instance.state = status
+                instance.in_flight = in_flight
+                instance.lifecycle = lifecycle
+                instance.reserved = reserved
+                instance.order = order
+                instance.until = until
+                if lifecycle.running is None and status in (BOOTING, DRAINING):
+                    resumed.append((order, self._boot(vdus[vdu_id], state, instance)))
+            for name in _VDUState.SAVED:
+                setattr(state, name, saved[name])
+        for link_id, (busy, carried) in checkpoint["links"].items():
+            self._links[link_id].busy = busy
+            self._links[link_id].carried = carried
+
+        # the chains keep their counters, in-flight requests their hops.
+        routes = dict()
+        for chain_id, (arrived, completed, response_time, latencies) in checkpoint["chains"].items():
+            chain = checkpoint["workload"].chains[chain_id]
+            routes[chain_id] = self._route(vnf, chain, checkpoint["workload"])
+            chain_state = _ChainState(chain, routes[chain_id])
+            chain_state.arrived = arrived
+            chain_state.completed = completed
+            chain_state.response_time = response_time
+            chain_state.latencies = latencies
+            self._chains[chain_id] = chain_state
+        for record in checkpoint["requests"]:
+            self._in_flight.add(record)
+            if record.chain_id is None:
+                state = self._states[record.vdu_id]
+                process = self._request(vdus[record.vdu_id], state, state.interface, state.link, record)
+            else:
+                process = self._chain_request(self._chains[record.chain_id], routes[record.chain_id], record)
+            resumed.append((record.order, process))
+
+        # requests queue again for the resources in the order they first did.
+        resumed.sort(key=lambda item: item[0])
+        for _, process in resumed:
+            self._env.process(process)
+        self._start(self._workload)
+
+    def run(self, until: float) -> SimulationReport:
+        """Run the simulation.
+
+        Args:
+            until (float): simulated time to stop at, in seconds.
+
+        Returns:
+            SimulationReport: utilization of every VDU up to that time.
+        """
+        self._env.run(until=until)
+        return self.report()
+
+    def report(self) -> SimulationReport:
+        """Get the report up to the current simulated time.
+
+        Returns:
+            SimulationReport: utilization of every VDU.
+        """
+        now = self._env.now
+        vdus = dict()
+        for vdu_id, state in self._states.items():
+            vdus[vdu_id] = VDUReport(
+                vdu_id=vdu_id,
+                cpu_utilization=state.cpu.utilization(now),
+                memory_utilization=state.memory.utilization(now),
+                storage_utilization=state.storage.utilization(now),
+                arrived=state.arrived,
+                completed=state.completed,
+                response_time=state.response_time,
+                network_utilization=state.network.utilization(now),
+                throughput=state.received / now if now > 0 else 0.0,
+                latency=_latency_percentiles(state.latencies),
+                mean_queue_length=state.waiting.mean(now),
+                queue_length=np.array(state.queue, dtype=np.int64),
+                scale_outs=state.scale_outs,
+                scale_ins=state.scale_ins,
+                mean_instances=state.active.mean(now) if now > 0 else state.active.in_use,
+                scale_out_delay=state.scale_out_delay / state.scaled_out if state.scaled_out > 0 else 0.0,
+            )
+        links = dict()
+        for link_id, link in self._links.items():
+            links[link_id] = LinkReport(
+                link_id=link_id,
+                utilization=link.busy.utilization(now),
+                throughput=link.carried / now if now > 0 else 0.0,
+            )
+        chains = dict()
+        for chain_id, chain_state in self._chains.items():
+            chains[chain_id] = ChainReport(
+                chain_id=chain_id,
+                arrived=chain_state.arrived,
+                completed=chain_state.completed,
+                response_time=chain_state.response_time,
+                latency=_latency_percentiles(chain_state.latencies),
+            )
+        return SimulationReport(
+            until=now,
+            vdus=vdus,
+            seed=self._seed,
+            links=links,
+            chains=chains,
+            sample_interval=self._sample_interval,
+            scaling_events=list(self._scaling_events),
+            instances=[
+                instance.lifecycle
+                for state in self._states.values()
+                for instance in state.instances
+            ],
+        )
+
+
+def simulate(
+    vnf: VNF,
+    workload: Workload,
+    until: float,
+    seed: int = None,
+    network: NetworkModel = None,
+    sample_interval: float = 1.0,
+    scaling: ScalingModel = None,
+) -> SimulationReport:
+    """Simulate a request load on a VNF and report the utilization of each VDU.
+
+    Args:
+        vnf (VNF): the VNF.
+        workload (Workload): the request load.
+        until (float): simulated time in seconds.
+        seed (int, optional): random seed. Defaults to None.
+        network (NetworkModel, optional): link and interface bandwidths. Defaults to NetworkModel().
+        sample_interval (float, optional): interval between two queue length samples in seconds, None to not sample. Defaults to 1.0.
+        scaling (ScalingModel, optional): instance lifecycle of the automatic scaling. Defaults to None, a single instance per VDU.
+
+    Returns:
+        SimulationReport: utilization and latency of every VDU, internal virtual link and chain.
+    """
+    return Simulation(vnf, workload, seed, network, sample_interval, scaling).run(until)
+
+
+# fast-forward modes of a segment
+ANALYTIC = "analytic"
+SIMULATED = "simulated"
+
+
+class Period:
+    """Stretch of time over which a workload is stationary."""
+
+    def __init__(self, duration: float, workload: Workload) -> None:
+        """Create a period.
+
+        Args:
+            duration (float): length in seconds.
+            workload (Workload): the request load during the period.
+
+        Raises:
+            RuntimeError: raise if the duration is not positive.
+        """
+        if duration <= 0:
+            raise RuntimeError("The duration of a period must be positive.")
+        self._duration: float = duration
+        self._workload: Workload = workload
+
+    @property
+    def duration(self):
+        """Get length in seconds."""
+        return self._duration
+
+    @property
+    def workload(self):
+        """Get the request load."""
+        return self._workload
+
+
+def _erlang_c(servers: int, offered: float) -> float:
+    """Get the probability that a request waits in an M/M/c queue, the offered load in erlangs is below servers."""
+    # Erlang B by its recurrence, numerically stable for many servers.
+    blocking = 1.0
+    for k in range(1, servers + 1):
+        blocking = offered * blocking / (k + offered * blocking)
+    occupancy = offered / servers
+    return blocking / (1.0 - occupancy * (1.0 - blocking))
+
+
+def _response_survival(
+    t: float, service_time: float, deterministic: bool, p_wait: float, decay: float
+) -> float:
+    """Get P(response time > t), the wait is 0 or exponential with rate decay, the service exponential or constant."""
+    if deterministic:
+        if t < service_time:
+            return 1.0
+        return p_wait * exp(-decay * (t - service_time))
+    mu = 1.0 / service_time
+    if p_wait == 0:
+        return exp(-mu * t)
+    if abs(decay - mu) < 1e-12 * mu:
+        waited = exp(-mu * t) * (1.0 + mu * t)
+    else:
+        waited = (decay * exp(-mu * t) - mu * exp(-decay * t)) / (decay - mu)
+    return (1.0 - p_wait) * exp(-mu * t) + p_wait * waited
+
+
+def _response_percentiles(
+    service_time: float, deterministic: bool, p_wait: float, decay: float
+) -> np.ndarray:
+    percentiles = list()
+    for q in LATENCY_PERCENTILES:
+        tail = 1.0 - q / 100.0
+        low, high = 0.0, service_time
+        while _response_survival(high, service_time, deterministic, p_wait, decay) > tail:
+            low, high = high, high * 2
+        for _ in range(60):
+            middle = (low + high) / 2
+            if _response_survival(middle, service_time, deterministic, p_wait, decay) > tail:
+                low = middle
+            else:
+                high = middle
+        percentiles.append(high)
+    return np.asarray(percentiles)
+
+
+def _steady_vdu(
+    vdu: VDU,
+    profile: RequestProfile,
+    vcd: VirtualComputeDesc,
+    vsd: List[VirtualStorageDesc],
+    count: int,
+    duration: float,
+) -> VDUReport:
+    """Get the steady state of the instances of a VDU, None if they are overloaded."""
+    if profile is None:
+        return VDUReport(vdu.id, 0.0, 0.0, 0.0, 0, 0, 0.0, mean_instances=count)
+    cpu = vcd.number_virtual_cpu or 0
+    memory = vcd.memory_gib
+    storage = vsd[0].storage_gib if len(vsd) != 0 else 0.0
+    servers = inf
+    for demand, capacity in ((profile.cpu, cpu), (profile.memory, memory), (profile.storage, storage)):
+        if demand > capacity:
+            raise RuntimeError(f"A request of {profile} does not fit in VDU {vdu.id}.")
+        if demand > 0:
+            servers = min(servers, floor(capacity / demand))
+
+    # requests are split evenly over the instances, each one an M/M/c queue.
+    arrival_rate = profile.arrival_rate / count
+    service_time = profile.service_time
+    offered = arrival_rate * service_time
+    if offered >= servers:
+        return None
+    if servers == inf:
+        p_wait, wait = 0.0, 0.0
+    else:
+        p_wait = _erlang_c(servers, offered)
+        wait = p_wait / (servers / service_time - arrival_rate)
+    # Allen-Cunneen correction for the service time variability, exact for exponential service times.
+    if profile.distribution == DETERMINISTIC:
+        wait *= 0.5
+    elif profile.distribution != EXPONENTIAL:
+        wait *= (1.0 + profile.cv**2) / 2
+    decay = p_wait / wait if wait > 0 else inf
+
+    completed = round(profile.arrival_rate * duration)
+    return VDUReport(
+        vdu_id=vdu.id,
+        cpu_utilization=offered * profile.cpu / cpu if cpu > 0 else 0.0,
+        memory_utilization=offered * profile.memory / memory if memory > 0 else 0.0,
+        storage_utilization=offered * profile.storage / storage if storage > 0 else 0.0,
+        arrived=completed,
+        completed=completed,
+        response_time=(wait + service_time) * completed,
+        latency=_response_percentiles(
+            service_time, profile.distribution == DETERMINISTIC, p_wait, decay
+        ),
+        mean_queue_length=count * arrival_rate * wait,
+        mean_instances=count,
+    )
+
+
+def _steady_report(
+    vnf: VNF, workload: Workload, instances: Dict[str, int], duration: float
+) -> SimulationReport:
+    """Get the steady state of every VDU, None if one of them is overloaded."""
+    if len(workload.chains) != 0:
+        raise RuntimeError("The steady state of chained requests is not supported.")
+    vcds = {vcd.id: vcd for vcd in vnf.virtual_compute_descriptions}
+    vsds = {vsd.id: vsd for vsd in vnf.virtual_storage_descriptions}
+    vdus = dict()
+    for vdu in vnf.vdus:
+        if vdu.vcd not in vcds:
+            raise RuntimeError(
+                f"The virtual compute description {vdu.vcd} of VDU {vdu.id} cannot be found."
+            )
+        missing = [vsd for vsd in vdu.vsd if vsd not in vsds]
+        if len(missing) != 0:
+            raise RuntimeError(
+                f"The virtual storage descriptions {missing} of VDU {vdu.id} cannot be found."
+            )
+        report = _steady_vdu(
+            vdu,
+            workload.profile(vdu.id),
+            vcds[vdu.vcd],
+            [vsds[vsd] for vsd in vdu.vsd],
+            instances.get(vdu.id, 1),
+            duration,
+        )
+        if report is None:
+            return None
+        vdus[vdu.id] = report
+    return SimulationReport(until=duration, vdus=vdus)
+
+
+def steady_state(
+    vnf: VNF, workload: Workload, instances: Dict[str, int] = None, duration: float = 1.0
+) -> SimulationReport:
+    """Get the steady state of the request load on a VNF in closed form.
+
+    Every instance of a VDU is an M/M/c queue whose servers are the requests
+    that fit in its virtual cpus, memory and first disk at once, requests are
+    split evenly over the instances. Waiting times of non exponential service
+    times use the Allen-Cunneen approximation. Network payloads and chains
+    are not part of the model.
+
+    Args:
+        vnf (VNF): the VNF.
+        workload (Workload): the request load.
+        instances (Dict[str, int], optional): number of instances by VDU id. Defaults to 1.
+        duration (float, optional): length of the period the request counts are given for, in seconds. Defaults to 1.0.
+
+    Raises:
+        RuntimeError: raise if a VDU is overloaded, lacks its descriptions or the workload has chains.
+
+    Returns:
+        SimulationReport: the expected utilization and latency of every VDU.
+    """
+    report = _steady_report(vnf, workload, instances or dict(), duration)
+    if report is None:
+        raise RuntimeError("A VDU is overloaded, its queue has no steady state.")
+    return report
+
+
+def _policy_fires(
+    vnf: VNF,
+    report: SimulationReport,
+    monitors: List[_PolicyMonitor],
+    instances: Dict[str, int],
+    levels: Dict[str, int],
+    duration: float,
+    interval: float,
+) -> bool:
+    """Check if a scaling policy would fire on the steady state of a period."""
+    values = dict()
+    for vdu_id, vdu_report in report.vdus.items():
+        values[(vdu_id, CPU_UTIL)] = 100.0 * vdu_report.cpu_utilization
+        values[(vdu_id, MEM_UTIL_AVE)] = 100.0 * vdu_report.memory_utilization
+    limits = _instance_limits(vnf)
+    for monitor in monitors:
+        if monitor.threshold_samples * interval > duration:
+            continue
+        aspect = monitor.aspect
+        for direction, criteria, operation_type in (
+            (SCALE_OUT, monitor.out_criteria, monitor.out_type),
+            (SCALE_IN, monitor.in_criteria, monitor.in_type),
+        ):
+            if not monitor._breach(criteria, operation_type, values):
+                continue
+            if direction == SCALE_OUT:
+                if aspect.max_scale_level is not None and levels[aspect.id] >= aspect.max_scale_level:
+                    continue
+                sign = 1
+            else:
+                if levels[aspect.id] <= 0:
+                    continue
+                sign = -1
+            allowed = True
+            for deltas in aspect.aspect_delta_details:
+                for vdu_id, number_of_instances in deltas.vdu_delta:
+                    minimum, maximum = limits.get(vdu_id, (1, None))
+                    count = instances.get(vdu_id, 1) + sign * number_of_instances
+                    if count < minimum or (maximum is not None and count > maximum):
+                        allowed = False
+            if allowed:
+                return True
+    return False
+
+
+class Segment:
+    """Stretch of a fast-forwarded run, evaluated in closed form or simulated."""
+
+    def __init__(
+        self,
+        start: float,
+        end: float,
+        mode: str,
+        report: SimulationReport,
+        instances: Dict[str, int],
+    ) -> None:
+        self._start: float = start
+        self._end: float = end
+        self._mode: str = mode
+        self._report: SimulationReport = report
+        self._instances: Dict[str, int] = instances
+
+    @property
+    def start(self):
+        """Get start time in seconds."""
+        return self._start
+
+    @property
+    def end(self):
+        """Get end time in seconds."""
+        return self._end
+
+    @property
+    def mode(self):
+        """Get mode, "analytic" or "simulated"."""
+        return self._mode
+
+    @property
+    def report(self):
+        """Get the report of the segment, its times are relative to the segment start."""
+        return self._report
+
+    @property
+    def instances(self):
+        """Get number of instances of every VDU at the segment start."""
+        return self._instances
+
+    def __repr__(self) -> str:
+        return f"Segment({self.start}, {self.end}, {self.mode!r})"
+
+
+class FastForwardReport:
+    """Segments of a fast-forwarded run, in time order."""
+
+    def __init__(self, segments: List[Segment]) -> None:
+        self._segments: List[Segment] = segments
+
+    @property
+    def segments(self):
+        """Get the segments in time order."""
+        return self._segments
+
+    @property
+    def until(self):
+        """Get end time in seconds."""
+        return self._segments[-1].end if len(self._segments) != 0 else 0.0
+
+    @property
+    def simulated_time(self):
+        """Get time covered by event-by-event simulation in seconds."""
+        return sum(segment.end - segment.start for segment in self._segments if segment.mode == SIMULATED)
+
+    @property
+    def analytic_time(self):
+        """Get time covered in closed form in seconds."""
+        return sum(segment.end - segment.start for segment in self._segments if segment.mode == ANALYTIC)
+
+    def series(self, vdu_id: str, metric: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get a VDUReport property of a VDU over the segments.
+
+        Args:
+            vdu_id (str): VDU id.
+            metric (str): a VDUReport property, e.g. "cpu_utilization".
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: segment starts, ends and values.
+        """
+        starts = np.array([segment.start for segment in self._segments])
+        ends = np.array([segment.end for segment in self._segments])
+        values = np.array([getattr(segment.report.vdu(vdu_id), metric) for segment in self._segments])
+        return starts, ends, values
+
+    def mean(self, vdu_id: str, metric: str) -> float:
+        """Get the time-weighted mean of a VDUReport property of a VDU.
+
+        Args:
+            vdu_id (str): VDU id.
+            metric (str): a VDUReport property, e.g. "cpu_utilization".
+
+        Returns:
+            float: the mean over the whole run.
+        """
+        starts, ends, values = self.series(vdu_id, metric)
+        if len(values) == 0 or ends[-1] == starts[0]:
+            return 0.0
+        return float(np.sum(values * (ends - starts)) / (ends[-1] - starts[0]))
+
+    def __str__(self) -> str:
+        lines = [
+            f"{len(self._segments)} segments, {self.analytic_time:.0f}s analytic, {self.simulated_time:.0f}s simulated",
+            f"{'VDU':<24}{'cpu':>8}{'memory':>8}{'instances':>11}{'response':>10}",
+        ]
+        if len(self._segments) == 0:
+            return lines[0]
+        for vdu_id in self._segments[0].report.vdus:
+            lines.append(
+                f"{vdu_id:<24}{self.mean(vdu_id, 'cpu_utilization'):>8.1%}"
+                f"{self.mean(vdu_id, 'memory_utilization'):>8.1%}"
+                f"{self.mean(vdu_id, 'mean_instances'):>11.2f}"
+                f"{self.mean(vdu_id, 'mean_response_time'):>9.3f}s"
+            )
+        return "\n".join(lines)
+
+
+def fast_forward(
+    vnf: VNF,
+    periods: Iterable[Period],
+    scaling: ScalingModel = None,
+    seed: int = None,
+    window: float = 600.0,
+    network: NetworkModel = None,
+) -> FastForwardReport:
+    """Evaluate a long piecewise stationary workload, jumping over the quiet periods.
+
+    A period whose VDUs all have a steady state on which no automatic scaling
+    policy breaches is covered at once in closed form, see steady_state.
+    Otherwise the period is simulated event by event, one window at a time,
+    starting from the current instance counts and scale levels, until the
+    rest of it is quiet again. Breaches are judged on the steady-state
+    utilization, queues start empty in every simulated window and instances
+    still booting at the end of a window are carried over as running.
+
+    Args:
+        vnf (VNF): the VNF.
+        periods (Iterable[Period]): the workload, one stationary period after the other.
+        scaling (ScalingModel, optional): instance lifecycle of the automatic scaling. Defaults to None, a single instance per VDU.
+        seed (int, optional): random seed of the first simulated window, the next ones use the following seeds. Defaults to None.
+        window (float, optional): length of a simulated window in seconds. Defaults to 600.0.
+        network (NetworkModel, optional): link and interface bandwidths of the simulated windows. Defaults to NetworkModel().
+
+    Raises:
+        RuntimeError: raise if the window is not positive, a VDU lacks its descriptions or a workload has chains.
+
+    Returns:
+        FastForwardReport: the analytic and simulated segments.
+    """
+    if window <= 0:
+        raise RuntimeError("The simulated window must be positive.")
+    if scaling is not None:
+        limits = _instance_limits(vnf)
+        instances = {vdu.id: limits.get(vdu.id, (1, None))[0] for vdu in vnf.vdus}
+        interval = scaling.monitoring_interval
+        monitors = _policy_monitors(vnf, interval)
+    else:
+        instances = {vdu.id: 1 for vdu in vnf.vdus}
+        interval = None
+        monitors = list()
+    levels = {aspect.id: 0 for aspect in vnf.df[0].scaling_aspects} if len(vnf.df) != 0 else dict()
+
+    segments = list()
+    start = 0.0
+    runs = 0
+    for period in periods:
+        remaining = period.duration
+        while remaining > 0:
+            report = _steady_report(vnf, period.workload, instances, remaining)
+            if report is not None and not _policy_fires(
+                vnf, report, monitors, instances, levels, remaining, interval
+            ):
+                segments.append(Segment(start, start + remaining, ANALYTIC, report, dict(instances)))
+                start += remaining
+                break
+
+            length = min(window, remaining)
+            simulation = Simulation(
+                vnf,
+                period.workload,
+                None if seed is None else seed + runs,
+                network,
+                None,
+                scaling,
+                instances=instances,
+                scale_levels=levels,
+            )
+            runs += 1
+            segments.append(
+                Segment(start, start + length, SIMULATED, simulation.run(length), dict(instances))
+            )
+            if scaling is not None:
+                instances = simulation.instance_counts()
+                levels = simulation.scale_levels
+            start += length
+            remaining -= length
+    return FastForwardReport(segments)
+
+
+class MonteCarloSummary:
+    """Distribution of the VDU statistics over many simulation runs, updated while results are yielded."""
+
+    # VDUReport properties that are collected per run.
+    METRICS = (
+        "cpu_utilization",
+        "memory_utilization",
+        "storage_utilization",
+        "network_utilization",
+        "mean_response_time",
+        "latency_p50",
+        "latency_p95",
+        "latency_p99",
+        "mean_queue_length",
+        "scale_outs",
+        "scale_ins",
+        "mean_instances",
+    )
+
+    def __init__(self) -> None:
+        self._seeds: List[int] = list()
+        self._values: Dict[str, Dict[str, List[float]]] = dict()
+
+    def _record(self, report: SimulationReport):
+        self._seeds.append(report.seed)
+        for vdu_id, vdu_report in report.vdus.items():
+            values = self._values.setdefault(
+                vdu_id, {metric: list() for metric in self.METRICS}
+            )
+            for metric in self.METRICS:
+                values[metric].append(getattr(vdu_report, metric))
+
+    @property
+    def runs(self):
+        """Get number of recorded runs."""
+        return len(self._seeds)
+
+    @property
+    def seeds(self):
+        """Get seeds of the recorded runs, in the order they were recorded."""
+        return self._seeds
+
+    @property
+    def vdus_id(self):
+        """Get ids of the simulated VDUs."""
+        return list(self._values)
+
+    def values(self, vdu_id: str, metric: str) -> np.ndarray:
+        """Get the value of a metric of a VDU in every run.
+
+        Args:
+            vdu_id (str): VDU id.
+            metric (str): one of METRICS.
+
+        Raises:
+            RuntimeError: raise if the VDU or the metric is unknown.
+
+        Returns:
+            np.ndarray: one value per run.
+        """
+        if vdu_id not in self._values:
+            raise RuntimeError(f"The VDU {vdu_id} was not simulated.")
+        if metric not in self.METRICS:
+            raise RuntimeError(f"Unknown metric {metric}.")
+        return np.asarray(self._values[vdu_id][metric])
+
+    def percentiles(
+        self, metric: str, q: Sequence[float] = (5, 50, 95)
+    ) -> Dict[str, np.ndarray]:
+        """Get percentiles of a metric across runs for every VDU.
+
+        Args:
+            metric (str): one of METRICS.
+            q (Sequence[float], optional): percentiles to compute. Defaults to (5, 50, 95).
+
+        Returns:
+            Dict[str, np.ndarray]: the percentiles by VDU id.
+        """
+        return {
+            vdu_id: np.percentile(self.values(vdu_id, metric), q)
+            for vdu_id in self._values
+        }
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.runs} runs",
+            f"{'VDU':<24}{'cpu p5':>9}{'cpu p50':>9}{'cpu p95':>9}{'mem p50':>9}{'resp p50':>10}{'resp p95':>10}{'p99 p95':>10}",
+        ]
+        if self.runs == 0:
+            return lines[0]
+        cpu = self.percentiles("cpu_utilization")
+        memory = self.percentiles("memory_utilization", (50,))
+        response = self.percentiles("mean_response_time", (50, 95))
+        tail = self.percentiles("latency_p99", (95,))
+        for vdu_id in self._values:
+            lines.append(
+                f"{vdu_id:<24}{cpu[vdu_id][0]:>9.1%}{cpu[vdu_id][1]:>9.1%}{cpu[vdu_id][2]:>9.1%}"
+                f"{memory[vdu_id][0]:>9.1%}{response[vdu_id][0]:>9.3f}s{response[vdu_id][1]:>9.3f}s"
+                f"{tail[vdu_id][0]:>9.3f}s"
+            )
+        return "\n".join(lines)
+
+
+# VNF, workload, horizon and models of the runs of a worker process, shipped once by the pool initializer.
+_worker_setup = None
+
+
+def _init_worker(
+    vnf: VNF,
+    workload: Workload,
+    until: float,
+    network: NetworkModel,
+    sample_interval: float,
+    scaling: ScalingModel,
+):
+    global _worker_setup
+    _worker_setup = (vnf, workload, until, network, sample_interval, scaling)
+
+
+def _run_seed(seed: int) -> SimulationReport:
+    """Run one simulation in a worker process."""
+    vnf, workload, until, network, sample_interval, scaling = _worker_setup
+    return Simulation(vnf, workload, seed, network, sample_interval, scaling).run(until)
+
+
+def run_many(
+    vnf: VNF,
+    workload: Workload,
+    until: float,
+    seeds: Iterable[int],
+    workers: int = None,
+    summary: MonteCarloSummary = None,
+    network: NetworkModel = None,
+    sample_interval: float = None,
+    scaling: ScalingModel = None,
+) -> Iterator[SimulationReport]:
+    """Run independent simulations of a VNF, one per seed, in a process pool.
+
+    The VNF and the workload are sent once to every worker, each run then only
+    carries its seed, so the runs scale with the number of cores. A run is
+    fully determined by its seed, whichever worker executes it. Reports are
+    yielded in completion order and at most a few seeds per worker are in
+    flight, so ``seeds`` can be a lazy iterable.
+
+    Args:
+        vnf (VNF): the VNF.
+        workload (Workload): the request load.
+        until (float): simulated time of every run in seconds.
+        seeds (Iterable[int]): one random seed per run.
+        workers (int, optional): number of worker processes, 1 runs in this process. Defaults to the number of CPUs.
+        summary (MonteCarloSummary, optional): summary to update with every run. Defaults to None.
+        network (NetworkModel, optional): link and interface bandwidths. Defaults to NetworkModel().
+        sample_interval (float, optional): interval between two queue length samples in seconds. Defaults to None, not sampled.
+        scaling (ScalingModel, optional): instance lifecycle of the automatic scaling. Defaults to None, a single instance per VDU.
+
+    Yields:
+        SimulationReport: one report per seed.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise RuntimeError("The number of workers must be at least 1.")
+    if summary is None:
+        summary = MonteCarloSummary()
+
+    if workers == 1:
+        for seed in seeds:
+            report = Simulation(vnf, workload, seed, network, sample_interval, scaling).run(until)
+            summary._record(report)
+            yield report
+        return
+
+    max_in_flight = workers * 4
+    seeds = iter(seeds)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(vnf, workload, until, network, sample_interval, scaling),
+    ) as executor:
+        pending = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    seed = next(seeds)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(_run_seed, seed))
+            if len(pending) == 0:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                report = future.result()
+                summary._record(report)
+                yield report
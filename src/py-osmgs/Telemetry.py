@@ -0,0 +1,474 @@
+import csv
+from itertools import islice
+from math import ceil, pi
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Union
+
+import numpy as np
+
+from VDU import CPU_UTIL, MEM_UTIL_AVE, Telemetries
+from VNF import VNF
+
+# metrics reported as a percentage, the others are counters that are only bounded below.
+PERCENT_METRICS = (CPU_UTIL, MEM_UTIL_AVE)
+
+# samples per chunk when streaming, a day of 1 second samples.
+DEFAULT_CHUNK_SIZE = 86400
+
+
+class _Source:
+    """Stateful producer of the consecutive samples of one metric stream."""
+
+    def __init__(self, seed: np.random.SeedSequence, interval: float, noise: float) -> None:
+        self._noise_rng = np.random.default_rng(seed.spawn(1)[0])
+        self._interval: float = interval
+        self._noise: float = noise
+        self._position: int = 0
+
+    def _shape(self, times: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def next(self, n: int) -> np.ndarray:
+        times = (self._position + np.arange(n)) * self._interval
+        self._position += n
+        values = self._shape(times)
+        if self._noise > 0:
+            values = values + self._noise_rng.normal(0.0, self._noise, n)
+        return values
+
+    def close(self):
+        pass
+
+
+class Pattern:
+    """Base class of the telemetry patterns.
+
+    A pattern only describes the signal, every stream it is used for gets its
+    own random state, so one pattern can drive many VDUs.
+    """
+
+    def __init__(self, noise: float = 0.0) -> None:
+        self._noise: float = noise
+
+    @property
+    def noise(self):
+        """Get standard deviation of the gaussian noise added to every sample."""
+        return self._noise
+
+    def _source(self, seed: np.random.SeedSequence, interval: float) -> _Source:
+        raise NotImplementedError
+
+
+class _DiurnalSource(_Source):
+    def __init__(self, pattern: "Diurnal", seed: np.random.SeedSequence, interval: float) -> None:
+        super().__init__(seed, interval, pattern.noise)
+        self._pattern = pattern
+
+    def _shape(self, times: np.ndarray) -> np.ndarray:
+        pattern = self._pattern
+        return pattern.mean + pattern.amplitude * np.cos(
+            2 * pi * (times - pattern.peak) / pattern.period
+        )
+
+
+class Diurnal(Pattern):
+    """Sinusoidal daily cycle."""
+
+    def __init__(
+        self,
+        mean: float,
+        amplitude: float,
+        period: float = 86400.0,
+        peak: float = 50400.0,
+        noise: float = 0.0,
+    ) -> None:
+        """Create a diurnal pattern.
+
+        Args:
+            mean (float): mean value.
+            amplitude (float): deviation from the mean at the peak and at the trough.
+            period (float, optional): cycle length in seconds. Defaults to a day.
+            peak (float, optional): time of the peak within the cycle in seconds. Defaults to 14:00.
+            noise (float, optional): standard deviation of the gaussian noise. Defaults to 0.0.
+        """
+        super().__init__(noise)
+        self._mean: float = mean
+        self._amplitude: float = amplitude
+        self._period: float = period
+        self._peak: float = peak
+
+    @property
+    def mean(self):
+        """Get mean value."""
+        return self._mean
+
+    @property
+    def amplitude(self):
+        """Get amplitude."""
+        return self._amplitude
+
+    @property
+    def period(self):
+        """Get cycle length in seconds."""
+        return self._period
+
+    @property
+    def peak(self):
+        """Get time of the peak within the cycle in seconds."""
+        return self._peak
+
+    def _source(self, seed: np.random.SeedSequence, interval: float) -> _Source:
+        return _DiurnalSource(self, seed, interval)
+
+
+class _BurstySource(_Source):
+    def __init__(self, pattern: "Bursty", seed: np.random.SeedSequence, interval: float) -> None:
+        super().__init__(seed, interval, pattern.noise)
+        self._pattern = pattern
+        self._burst_rng = np.random.default_rng(seed.spawn(1)[0])
+        # bursts drawn so far that may still overlap upcoming samples, (start, end).
+        self._bursts: List[tuple] = list()
+        self._next_start: float = self._burst_rng.exponential(1.0 / pattern.rate)
+
+    def _shape(self, times: np.ndarray) -> np.ndarray:
+        pattern = self._pattern
+        values = np.full(len(times), float(pattern.base))
+        if len(times) == 0:
+            return values
+        first = times[0]
+        last = times[-1]
+        while self._next_start <= last:
+            duration = self._burst_rng.exponential(pattern.duration)
+            self._bursts.append((self._next_start, self._next_start + duration))
+            self._next_start += self._burst_rng.exponential(1.0 / pattern.rate)
+        interval = self._interval
+        for start, end in self._bursts:
+            begin = max(0, int(ceil((start - first) / interval)))
+            stop = min(len(times), int(ceil((end - first) / interval)))
+            if begin < stop:
+                values[begin:stop] += pattern.burst
+        self._bursts = [burst for burst in self._bursts if burst[1] > last + interval]
+        return values
+
+
+class Bursty(Pattern):
+    """Steady baseline with bursts arriving as a Poisson process."""
+
+    def __init__(
+        self,
+        base: float,
+        burst: float,
+        rate: float,
+        duration: float,
+        noise: float = 0.0,
+    ) -> None:
+        """Create a bursty pattern.
+
+        Args:
+            base (float): baseline value.
+            burst (float): value added during a burst, overlapping bursts add up.
+            rate (float): mean number of bursts per second.
+            duration (float): mean burst duration in seconds, exponentially distributed.
+            noise (float, optional): standard deviation of the gaussian noise. Defaults to 0.0.
+        """
+        super().__init__(noise)
+        if rate <= 0 or duration <= 0:
+            raise RuntimeError("The burst rate and duration must be positive.")
+        self._base: float = base
+        self._burst: float = burst
+        self._rate: float = rate
+        self._duration: float = duration
+
+    @property
+    def base(self):
+        """Get baseline value."""
+        return self._base
+
+    @property
+    def burst(self):
+        """Get value added during a burst."""
+        return self._burst
+
+    @property
+    def rate(self):
+        """Get mean number of bursts per second."""
+        return self._rate
+
+    @property
+    def duration(self):
+        """Get mean burst duration in seconds."""
+        return self._duration
+
+    def _source(self, seed: np.random.SeedSequence, interval: float) -> _Source:
+        return _BurstySource(self, seed, interval)
+
+
+class _StepSource(_Source):
+    def __init__(self, pattern: "Step", seed: np.random.SeedSequence, interval: float) -> None:
+        super().__init__(seed, interval, pattern.noise)
+        self._levels = np.asarray(pattern.levels, dtype=float)
+        self._times = np.asarray(pattern.times, dtype=float)
+
+    def _shape(self, times: np.ndarray) -> np.ndarray:
+        return self._levels[np.searchsorted(self._times, times, side="right")]
+
+
+class Step(Pattern):
+    """Piecewise constant level changes."""
+
+    def __init__(self, levels: Sequence[float], times: Sequence[float], noise: float = 0.0) -> None:
+        """Create a step pattern.
+
+        Args:
+            levels (Sequence[float]): the levels, levels[0] until times[0], levels[i] from times[i - 1].
+            times (Sequence[float]): the increasing times of the changes in seconds.
+            noise (float, optional): standard deviation of the gaussian noise. Defaults to 0.0.
+
+        Raises:
+            RuntimeError: raise if there is not exactly one more level than times.
+        """
+        super().__init__(noise)
+        if len(levels) != len(times) + 1:
+            raise RuntimeError("A step pattern needs exactly one more level than change times.")
+        self._levels: List[float] = list(levels)
+        self._times: List[float] = list(times)
+
+    @property
+    def levels(self):
+        """Get the levels."""
+        return self._levels
+
+    @property
+    def times(self):
+        """Get the times of the changes in seconds."""
+        return self._times
+
+    def _source(self, seed: np.random.SeedSequence, interval: float) -> _Source:
+        return _StepSource(self, seed, interval)
+
+
+class _ReplaySource(_Source):
+    def __init__(self, pattern: "Replay", seed: np.random.SeedSequence, interval: float) -> None:
+        super().__init__(seed, interval, pattern.noise)
+        self._pattern = pattern
+        self._file = None
+        self._reader = None
+        self._last: float = None
+        self._open()
+
+    def _open(self):
+        self.close()
+        self._file = open(self._pattern.path, "r", newline="")
+        if isinstance(self._pattern.column, str):
+            reader = csv.DictReader(self._file)
+            column = self._pattern.column
+            if reader.fieldnames is None or column not in reader.fieldnames:
+                raise RuntimeError(f"No column {column} in {self._pattern.path}.")
+            self._reader = (row[column] for row in reader)
+        else:
+            column = self._pattern.column
+            self._reader = (row[column] for row in csv.reader(self._file))
+
+    def _shape(self, times: np.ndarray) -> np.ndarray:
+        values = np.empty(len(times))
+        filled = 0
+        while filled < len(times):
+            rows = list(islice(self._reader, len(times) - filled))
+            if len(rows) != 0:
+                values[filled : filled + len(rows)] = np.asarray(rows, dtype=float)
+                filled += len(rows)
+                self._last = values[filled - 1]
+                continue
+            if self._last is None:
+                raise RuntimeError(f"No values to replay in {self._pattern.path}.")
+            if self._pattern.loop:
+                self._open()
+                continue
+            values[filled:] = self._last
+            break
+        return values * self._pattern.scale
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Replay(Pattern):
+    """Values read from a CSV column, one row per sample."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        column: Union[str, int],
+        loop: bool = True,
+        scale: float = 1.0,
+        noise: float = 0.0,
+    ) -> None:
+        """Create a replay pattern.
+
+        Args:
+            path (Union[str, Path]): CSV file path.
+            column (Union[str, int]): column name, read with the header row, or column index of a file without header.
+            loop (bool, optional): start over at the end of the file, otherwise hold the last value. Defaults to True.
+            scale (float, optional): factor applied to every value. Defaults to 1.0.
+            noise (float, optional): standard deviation of the gaussian noise. Defaults to 0.0.
+        """
+        super().__init__(noise)
+        self._path: str = str(path)
+        self._column: Union[str, int] = column
+        self._loop: bool = loop
+        self._scale: float = scale
+
+    @property
+    def path(self):
+        """Get CSV file path."""
+        return self._path
+
+    @property
+    def column(self):
+        """Get column name or index."""
+        return self._column
+
+    @property
+    def loop(self):
+        """Check if the replay starts over at the end of the file."""
+        return self._loop
+
+    @property
+    def scale(self):
+        """Get factor applied to every value."""
+        return self._scale
+
+    def _source(self, seed: np.random.SeedSequence, interval: float) -> _Source:
+        return _ReplaySource(self, seed, interval)
+
+
+class TelemetryGenerator:
+    """Synthetic metric streams, one per monitoring parameter id.
+
+    The output of a seeded generator does not depend on how it is chunked, a
+    week generated a day at a time equals the week generated at once.
+    """
+
+    def __init__(self, interval: float = 1.0, seed: int = None) -> None:
+        """Create a generator.
+
+        Args:
+            interval (float, optional): time between two samples in seconds. Defaults to 1.0.
+            seed (int, optional): random seed. Defaults to None.
+        """
+        if interval <= 0:
+            raise RuntimeError("The sampling interval must be positive.")
+        self._interval: float = interval
+        self._seed: int = seed
+        self._streams: Dict[str, tuple] = dict()
+
+    @property
+    def interval(self):
+        """Get time between two samples in seconds."""
+        return self._interval
+
+    @property
+    def telemetries_id(self):
+        """Get ids of the generated monitoring parameters."""
+        return list(self._streams)
+
+    def add(self, telemetry_id: str, pattern: Pattern, metric: str = None):
+        """Add a metric stream.
+
+        Args:
+            telemetry_id (str): monitoring parameter id, e.g. "Storage-node_disk_read_bytes".
+            pattern (Pattern): the pattern.
+            metric (str, optional): performance metric, percentages are capped at 100. Defaults to None.
+        """
+        self._streams[telemetry_id] = (pattern, metric)
+
+    def add_vnf(self, vnf: VNF, patterns: Dict[str, Pattern]):
+        """Add a stream for every VDU telemetry of a VNF whose metric has a pattern.
+
+        Args:
+            vnf (VNF): the VNF.
+            patterns (Dict[str, Pattern]): pattern by performance metric, e.g. {CPU_UTIL: Diurnal(50, 30)}.
+
+        Raises:
+            RuntimeError: raise if a pattern is given for an unknown metric.
+        """
+        for metric in patterns:
+            if metric not in Telemetries:
+                raise RuntimeError(f"Unknown performance metric {metric}.")
+        for vdu in vnf.vdus:
+            for telemetry in vdu.telemetries:
+                pattern = patterns.get(telemetry.performance_metric)
+                if pattern is not None:
+                    self.add(telemetry.id, pattern, telemetry.performance_metric)
+
+    def _sources(self) -> Dict[str, tuple]:
+        seeds = np.random.SeedSequence(self._seed).spawn(len(self._streams))
+        sources = dict()
+        for seed, (telemetry_id, (pattern, metric)) in zip(seeds, self._streams.items()):
+            maximum = 100.0 if metric in PERCENT_METRICS else None
+            sources[telemetry_id] = (pattern._source(seed, self._interval), maximum)
+        return sources
+
+    def num_samples(self, duration: float) -> int:
+        """Get number of samples covering a duration.
+
+        Args:
+            duration (float): duration in seconds.
+
+        Returns:
+            int: number of samples.
+        """
+        return int(ceil(duration / self._interval))
+
+    def chunks(
+        self, duration: float, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Generate the streams chunk by chunk, only one chunk is held in memory.
+
+        Args:
+            duration (float): duration in seconds.
+            chunk_size (int, optional): samples per chunk. Defaults to a day of 1 second samples.
+
+        Yields:
+            Dict[str, np.ndarray]: the next samples of every stream by monitoring parameter id.
+        """
+        if chunk_size < 1:
+            raise RuntimeError("The chunk size must be at least 1.")
+        remaining = self.num_samples(duration)
+        sources = self._sources()
+        try:
+            while remaining > 0:
+                n = min(chunk_size, remaining)
+                chunk = dict()
+                for telemetry_id, (source, maximum) in sources.items():
+                    chunk[telemetry_id] = np.clip(source.next(n), 0.0, maximum)
+                remaining -= n
+                yield chunk
+        finally:
+            for source, _ in sources.values():
+                source.close()
+
+    def generate(
+        self, duration: float, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Dict[str, np.ndarray]:
+        """Generate the full streams.
+
+        Args:
+            duration (float): duration in seconds.
+            chunk_size (int, optional): samples produced at a time. Defaults to a day of 1 second samples.
+
+        Returns:
+            Dict[str, np.ndarray]: every stream by monitoring parameter id, ready for replay_autoscaling.
+        """
+        num_samples = self.num_samples(duration)
+        traces = {telemetry_id: np.empty(num_samples) for telemetry_id in self._streams}
+        position = 0
+        for chunk in self.chunks(duration, chunk_size):
+            n = 0
+            for telemetry_id, values in chunk.items():
+                n = len(values)
+                traces[telemetry_id][position : position + n] = values
+            position += n
+        return traces
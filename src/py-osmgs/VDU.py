@@ -1,10 +1,14 @@
+import threading
+from collections.abc import Sequence
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
-from ipaddress import IPv4Address
-from typing import Dict, List, Tuple
+from functools import wraps
+from ipaddress import IPv4Address, ip_address
+from typing import Any, Callable, Dict, List, Tuple
 from bitmath import GiB
 
-from simpy import Container, Environment
+from simpy import Container, Environment, Resource
 
 # monitoring parameters
 CPU_UTIL = "cpu_utilization"
@@ -25,6 +29,28 @@ E1000 = "E1000"
 RTL8139 = "RTL8139"
 PCNET = "PCNET"
 
+# nominal bandwidth of an interface type in bit/s, emulated NICs are limited to
+# the speed of the hardware they mimic, virtio and passthrough to the host NIC.
+INTERFACE_BANDWIDTH = {
+    PARAVIRT: 10e9,
+    PCI_PT: 25e9,
+    SR_IOV: 25e9,
+    E1000: 1e9,
+    RTL8139: 100e6,
+    PCNET: 10e6,
+}
+
+# per-transfer latency added by an interface type in seconds, the cost of the
+# virtual switch and of the device emulation in the hypervisor.
+INTERFACE_LATENCY = {
+    PARAVIRT: 50e-6,
+    PCI_PT: 5e-6,
+    SR_IOV: 8e-6,
+    E1000: 150e-6,
+    RTL8139: 250e-6,
+    PCNET: 300e-6,
+}
+
 class VirtualMemory(Container):
     """Virtual Memory"""
 
@@ -49,9 +75,189 @@ class VirtualStorage(Container):
         self.size = GiB(size)
 
 
+class VirtualInterface(Resource):
+    """Virtual network interface, transfers go through it one at a time."""
+
+    def __init__(self, env: Environment, type: str, bandwidth: float = None, latency: float = None):
+        super().__init__(env, capacity=1)
+        self.type = type
+        self.bandwidth = bandwidth if bandwidth is not None else INTERFACE_BANDWIDTH.get(type, INTERFACE_BANDWIDTH[PARAVIRT])
+        self.latency = latency if latency is not None else INTERFACE_LATENCY.get(type, INTERFACE_LATENCY[PARAVIRT])
+
+
+class VirtualLink(Resource):
+    """Internal virtual link, a medium shared by all the interfaces connected to it."""
+
+    def __init__(self, env: Environment, bandwidth: float):
+        super().__init__(env, capacity=1)
+        self.bandwidth = bandwidth
+
+
+def yaml_extras(entity: "OsmEntity") -> dict:
+    """Return the pass-through attributes of an entity for yaml dumping.
+
+    Keys named with an underscore are skipped, only the remaining descriptor
+    keys kept by load/configure are copied.
+
+    Args:
+        entity (OsmEntity): the entity.
+
+    Returns:
+        dict: a copy of the pass-through attributes.
+    """
+    extras = dict()
+    if entity._extras is None:
+        return extras
+    for key, value in entity._extras.items():
+        if "_" in key or key == "interface":
+            continue
+        extras[key] = deepcopy(value)
+    return extras
+
+
+class ReadOnlyList(Sequence):
+    """Read-only view of an entity list, the entity methods are the only way to change it."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list) -> None:
+        self._items: list = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._items
+
+    def __eq__(self, __o: object) -> bool:
+        if isinstance(__o, ReadOnlyList):
+            return self._items == __o._items
+        if isinstance(__o, (list, tuple)):
+            return self._items == list(__o)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self._items)
+
+
+# depth of the uncached() blocks of every thread
+_uncached = threading.local()
+
+
+@contextmanager
+def uncached():
+    """Build yaml representations without keeping them in the entity caches.
+
+    Representations already cached are still used. The descriptor writer
+    streams in such a block, so that writing a VNF does not leave its whole
+    representation behind.
+    """
+    _uncached.depth = getattr(_uncached, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _uncached.depth -= 1
+
+
+def cached_repr(yaml_repr: Callable[["OsmEntity"], dict]) -> Callable[["OsmEntity"], dict]:
+    """Keep the dictionary built by a yaml_repr method until the entity changes.
+
+    The cached dictionary is shared with the representation of the parent
+    entity, it must not be modified.
+
+    Args:
+        yaml_repr (Callable[[OsmEntity], dict]): the yaml_repr method.
+
+    Returns:
+        Callable[[OsmEntity], dict]: the cached yaml_repr method.
+    """
+
+    @wraps(yaml_repr)
+    def cached(self: "OsmEntity") -> dict:
+        cache = self._cache
+        if cache is None:
+            cache = yaml_repr(self)
+            if not getattr(_uncached, "depth", 0):
+                self._cache = cache
+        return cache
+
+    return cached
+
+
 class OsmEntity:
+    # entities are slotted to keep loaded catalogs small, descriptor keys without
+    # a dedicated attribute go to the _extras side-dict, created on first use.
+    # _cache holds the last yaml representation and _parent the entity whose
+    # representation contains it, so that a change only rebuilds its own subtree.
+    __slots__ = ("_configured", "_extras", "_cache", "_parent")
+
     def __init__(self) -> None:
         self._configured: bool = False
+        self._extras: Dict[str, Any] = None
+        self._cache: dict = None
+        self._parent: OsmEntity = None
+
+    def _invalidate(self):
+        """Drop the cached yaml representation of the entity and of the entities containing it."""
+        entity = self
+        # an entity without a cache is not part of any cached representation either.
+        while entity is not None and entity._cache is not None:
+            entity._cache = None
+            entity = entity._parent
+
+    def _child_repr(self, child: "OsmEntity") -> dict:
+        """Get the yaml representation of a child entity, a change of the child invalidates this entity."""
+        child._parent = self
+        return child.yaml_repr()
+
+    def __getstate__(self):
+        # the cache and the parent link are rebuilt on the next yaml_repr, pickling
+        # an entity does not drag its parent along.
+        state = dict()
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state["_cache"] = None
+        state["_parent"] = None
+        return None, state
+
+    def __setstate__(self, state):
+        # defined so that unpickling does not look it up through __getattr__ for every entity.
+        _, slots = state
+        for name, value in slots.items():
+            setattr(self, name, value)
+
+    def _set_extra(self, key: str, value: Any):
+        """Keep a pass-through descriptor key.
+
+        Args:
+            key (str): descriptor key.
+            value (Any): value.
+        """
+        if self._extras is None:
+            self._extras = dict()
+        self._extras[key] = value
+
+    def __getattr__(self, name: str):
+        # only reached when no slot or property matches, i.e. for pass-through keys.
+        try:
+            extras = object.__getattribute__(self, "_extras")
+        except AttributeError:
+            extras = None
+        if extras is not None and name in extras:
+            return extras[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     @property
     def configured(self):
@@ -105,11 +311,13 @@ class OsmEntity:
 class VirtualComputeDesc(OsmEntity):
     """Virtual Compute Description"""
 
+    __slots__ = ("_id", "_number_virtual_cpu", "_size_virtual_memory")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
         self._number_virtual_cpu: int = None
-        self._size_virtual_memory: GiB = None
+        self._size_virtual_memory: float = None
 
     def load(self, vcd: Dict):
         """Load Virtual Compute Description.
@@ -130,9 +338,9 @@ class VirtualComputeDesc(OsmEntity):
             elif key == "virtual-cpu":
                 self._number_virtual_cpu = value["num-virtual-cpu"]
             elif key == "virtual-memory":
-                self._size_virtual_memory = GiB(value["size"])
+                self._size_virtual_memory = float(value["size"])
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
         self._configured = True
 
     def configure(self, id: str, num_vcpu: int, size_mem: float, **kwargs):
@@ -144,13 +352,14 @@ class VirtualComputeDesc(OsmEntity):
 
         self._id = id
         self._number_virtual_cpu = num_vcpu
-        self._size_virtual_memory = GiB(size_mem)
+        self._size_virtual_memory = float(size_mem)
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
@@ -160,7 +369,7 @@ class VirtualComputeDesc(OsmEntity):
         yaml_repr = dict()
         yaml_repr["id"] = self.id
         yaml_repr["virtual-cpu"] = {"num-virtual-cpu": self.number_virtual_cpu}
-        yaml_repr["virtual-memory"] = {"size": self.size_virtual_memory.value}
+        yaml_repr["virtual-memory"] = {"size": self._size_virtual_memory}
 
         return yaml_repr
 
@@ -171,8 +380,16 @@ class VirtualComputeDesc(OsmEntity):
 
     @property
     def size_virtual_memory(self):
-        """Get size of virtual memory."""
-        return self._size_virtual_memory
+        """Get size of virtual memory, None if it is not set."""
+        # kept as a plain float, bitmath objects carry a full instance dict each.
+        if self._size_virtual_memory is None:
+            return None
+        return GiB(self._size_virtual_memory)
+
+    @property
+    def memory_gib(self):
+        """Get size of virtual memory in GiB as a float, 0.0 if it is not set."""
+        return self._size_virtual_memory or 0.0
 
     @property
     def id(self):
@@ -184,10 +401,12 @@ class VirtualComputeDesc(OsmEntity):
 class VirtualStorageDesc(OsmEntity):
     """Virtual Storage Description"""
 
+    __slots__ = ("_id", "_size_virtual_storage")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
-        self._size_virtual_storage: GiB = None
+        self._size_virtual_storage: float = None
 
     def load(self, vsd: Dict):
 
@@ -200,9 +419,9 @@ class VirtualStorageDesc(OsmEntity):
             if key == "id":
                 self._id = value
             elif key == "size-of-storage":
-                self._size_virtual_storage = GiB(value)
+                self._size_virtual_storage = float(value)
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -214,13 +433,14 @@ class VirtualStorageDesc(OsmEntity):
             )
 
         self._id = id
-        self._size_virtual_storage = GiB(size_storage)
+        self._size_virtual_storage = float(size_storage)
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
@@ -229,7 +449,7 @@ class VirtualStorageDesc(OsmEntity):
         """
         yaml_repr = dict()
         yaml_repr["id"] = self.id
-        yaml_repr["size-of-storage"] = self.size_virtual_storage.value
+        yaml_repr["size-of-storage"] = self._size_virtual_storage
 
         return yaml_repr
 
@@ -240,13 +460,22 @@ class VirtualStorageDesc(OsmEntity):
 
     @property
     def size_virtual_storage(self):
-        """Get size of virtual storage."""
-        return self._size_virtual_storage
+        """Get size of virtual storage, None if it is not set."""
+        if self._size_virtual_storage is None:
+            return None
+        return GiB(self._size_virtual_storage)
+
+    @property
+    def storage_gib(self):
+        """Get size of virtual storage in GiB as a float, 0.0 if it is not set."""
+        return self._size_virtual_storage or 0.0
 
 
 class VDUInterface(OsmEntity):
     """VDU Interface"""
 
+    __slots__ = ("_id", "_vnf_internal_cp", "_name", "_position", "_ip_address", "_type")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -280,10 +509,10 @@ class VDUInterface(OsmEntity):
                 if "position" in value[0]:
                     self._position = value[0]["position"]
                 if "ip-address" in value[0]:
-                    self._ip_address = value[0]["ip-address"]
+                    self._ip_address = ip_address(value[0]["ip-address"])
                 self._type = value[0]["virtual-interface"]["type"]
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -325,7 +554,7 @@ class VDUInterface(OsmEntity):
             self._vnf_internal_cp = vnf_internal_cp
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
@@ -377,17 +606,14 @@ class VDUInterface(OsmEntity):
         else:
             return False
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
         yaml_repr["id"] = self._id
         if self.vnf_internal_cp is not None:
             yaml_repr["int-virtual-link-desc"] = self.vnf_internal_cp
@@ -409,6 +635,8 @@ class VDUInterface(OsmEntity):
 class MonitoringParameter(OsmEntity):
     """Monitoring Parameters"""
 
+    __slots__ = ("_id", "_name", "_performance_metric")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -436,7 +664,7 @@ class MonitoringParameter(OsmEntity):
             elif key == "performance-metric":
                 self._performance_metric = value
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -464,21 +692,18 @@ class MonitoringParameter(OsmEntity):
             self._name = self._id
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["id"] = self.id
         yaml_repr["name"] = self.name
@@ -505,6 +730,24 @@ class MonitoringParameter(OsmEntity):
 class VDU(OsmEntity):
     """VDU"""
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_image",
+        "_cloud_init_file",
+        "_vcd",
+        "_vsd",
+        "_interfaces",
+        "_telementries",
+        "_interface_index",
+        "_telemetry_index",
+        "_initialized",
+        "virtual_cpu",
+        "virtual_memory",
+        "Virtual_storage",
+        "virtual_interfaces",
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -515,11 +758,14 @@ class VDU(OsmEntity):
         self._vsd: List[str] = list()
         self._interfaces: List[VDUInterface] = list()
         self._telementries: List[MonitoringParameter] = list()
+        self._interface_index: Dict[str, VDUInterface] = dict()
+        self._telemetry_index: Dict[str, MonitoringParameter] = dict()
 
         self._initialized: bool = False
         self.virtual_cpu: VirtualCpu = None
         self.virtual_memory: VirtualMemory = None
         self.Virtual_storage: List[VirtualStorage] = list()
+        self.virtual_interfaces: Dict[str, VirtualInterface] = dict()
 
     @property
     def id(self):
@@ -529,7 +775,7 @@ class VDU(OsmEntity):
     @property
     def image(self):
         """Get image."""
-        return self._image
+        return ReadOnlyList(self._image)
 
     @property
     def vcd(self):
@@ -539,7 +785,7 @@ class VDU(OsmEntity):
     @property
     def vsd(self):
         """Return Virtual Computer Descritption Id."""
-        return self._vsd
+        return ReadOnlyList(self._vsd)
 
     @property
     def initialized(self):
@@ -549,20 +795,17 @@ class VDU(OsmEntity):
     @property
     def telemetries(self):
         """Get telementry."""
-        return self._telementries
+        return ReadOnlyList(self._telementries)
 
     @property
     def telemetries_id(self):
         """Get a list o telemetries ids."""
-        telemetries_id = list()
-        for telemetry in self.telemetries:
-            telemetries_id.append(telemetry.id)
-        return telemetries_id
+        return list(self._telemetry_index)
 
     @property
     def interfaces(self):
         """Get internal connection points."""
-        return self._interfaces
+        return ReadOnlyList(self._interfaces)
 
     @property
     def cloud_init_file(self):
@@ -572,10 +815,73 @@ class VDU(OsmEntity):
     @property
     def Interfaces_id(self):
         """Get a list of internal connection points' ids."""
-        vdu_cp_list = list()
-        for int_cp in self.interfaces:
-            vdu_cp_list.append(int_cp.id)
-        return vdu_cp_list
+        return list(self._interface_index)
+
+    def __getstate__(self):
+        # simulation resources are bound to a simpy environment, they are left out
+        # so that a simulated VDU can still be pickled, e.g. to a worker process.
+        _, state = super().__getstate__()
+        state["_initialized"] = False
+        state["virtual_cpu"] = None
+        state["virtual_memory"] = None
+        state["Virtual_storage"] = list()
+        state["virtual_interfaces"] = dict()
+        return None, state
+
+    def initialize(
+        self,
+        env: Environment,
+        vcd: VirtualComputeDesc,
+        vsd: List[VirtualStorageDesc],
+        interface_bandwidth: Dict[str, float] = None,
+    ):
+        """Instantiate the virtual resources of the VDU in a simulation environment.
+
+        Args:
+            env (Environment): simpy environment.
+            vcd (VirtualComputeDesc): virtual compute description of the VDU.
+            vsd (List[VirtualStorageDesc]): virtual storage descriptions of the VDU.
+            interface_bandwidth (Dict[str, float], optional): bandwidth in bit/s by interface type. Defaults to INTERFACE_BANDWIDTH.
+
+        A VDU without virtual memory gets no memory container and its zero-size
+        disks are left out, simpy containers need a positive capacity.
+        """
+        if interface_bandwidth is None:
+            interface_bandwidth = dict()
+        self.virtual_cpu = VirtualCpu(env, vcd.number_virtual_cpu)
+        self.virtual_memory = VirtualMemory(env, vcd.memory_gib) if vcd.memory_gib > 0 else None
+        self.Virtual_storage = [
+            VirtualStorage(env, storage.storage_gib) for storage in vsd if storage.storage_gib > 0
+        ]
+        self.virtual_interfaces = {
+            interface.id: VirtualInterface(
+                env, interface.type, interface_bandwidth.get(interface.type)
+            )
+            for interface in self._interfaces
+        }
+        self._initialized = True
+
+    def get_interface(self, id: str):
+        """Get an interface by id.
+
+        Args:
+            id (str): interface id.
+
+        Returns:
+            VDUInterface: the interface, None if it does not exist.
+        """
+        return self._interface_index.get(id)
+
+    def get_telemetry(self, id: str):
+        """Get a telemetry by id.
+
+        Args:
+            id (str): telemetry id.
+
+        Returns:
+            MonitoringParameter: the telemetry, None if it does not exist.
+        """
+        return self._telemetry_index.get(id)
 
     def load(self, vdu_desc: Dict) -> None:
         """Initialize VDU from a VDU description.
@@ -608,13 +914,15 @@ class VDU(OsmEntity):
                     internal_cp = VDUInterface()
                     internal_cp.load(internal_cp_decription)
                     self._interfaces.append(internal_cp)
+                    self._interface_index[internal_cp.id] = internal_cp
             elif key == "monitoring-parameter":
                 for mon_param in value:
                     metric = MonitoringParameter()
                     metric.load(mon_param)
                     self._telementries.append(metric)
+                    self._telemetry_index[metric.id] = metric
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -643,9 +951,9 @@ class VDU(OsmEntity):
             raise RuntimeWarning("The VDU has already been configured.")
 
         self._id = id
-        self._image = image
+        self._image = list(image)
         self._vcd = virtual_compute_desc
-        self._vsd = virtual_storage_desc
+        self._vsd = list(virtual_storage_desc)
 
         if name is not None:
             self._name = name
@@ -654,7 +962,7 @@ class VDU(OsmEntity):
             self._cloud_init_file = cloud_init_file
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
     def add_telementry(self, id:str, metric:str):
         """Add a new telementry to collect.
@@ -665,6 +973,8 @@ class VDU(OsmEntity):
         new_metric = MonitoringParameter()
         new_metric.configure(id=id, performance_metric=metric)
         self._telementries.append(new_metric)
+        self._telemetry_index[new_metric.id] = new_metric
+        self._invalidate()
 
     def remove_telementry(self, telementry_metric: str):
         """Remove a telementry by its metric.
@@ -672,9 +982,27 @@ class VDU(OsmEntity):
         Args:
             telementry_id (str): the telementry metric.
         """
-        for metric in self._telementries:
+        for metric in list(self._telementries):
             if metric.performance_metric == telementry_metric:
                 self._telementries.remove(metric)
+                self._telemetry_index.pop(metric.id, None)
+                self._invalidate()
+
+    def remove_telemetry_by_id(self, id: str):
+        """Remove a telemetry by its id.
+
+        Args:
+            id (str): the telemetry id.
+
+        Returns:
+            bool: True if the telemetry was removed.
+        """
+        metric = self._telemetry_index.pop(id, None)
+        if metric is None:
+            return False
+        self._telementries.remove(metric)
+        self._invalidate()
+        return True
 
     def addInterface(
         self,
@@ -716,6 +1044,8 @@ class VDU(OsmEntity):
             )
 
         self._interfaces.append(new_interface)
+        self._interface_index[new_interface.id] = new_interface
+        self._invalidate()
 
     def remove_Interface(self,id:str):
         """remove a interface from VDU by id.
@@ -723,34 +1053,34 @@ class VDU(OsmEntity):
         Args:
             id (str): Interface id.
         """
-        for interface in self._interfaces:
-            if interface.id == id:
-                self._interfaces.remove(interface)
-
+        interface = self._interface_index.pop(id, None)
+        if interface is not None:
+            self._interfaces = [
+                other for other in self._interfaces if other is not interface
+            ]
+            self._invalidate()
+
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
         yaml_repr["id"] = self.id
         if self.cloud_init_file is not None:
             yaml_repr["cloud-init-file"] = self.cloud_init_file
-        yaml_repr["sw-image-desc"] = self.image[0]
-        if len(self.image) > 1:
-            yaml_repr["alternative-sw-image-desc"] = self.image[1:-1]
+        yaml_repr["sw-image-desc"] = self._image[0]
+        if len(self._image) > 1:
+            yaml_repr["alternative-sw-image-desc"] = self._image[1:-1]
         yaml_repr["int-cpd"] = list()
         for internal_cp in self.interfaces:
-            yaml_repr["int-cpd"].append(internal_cp.yaml_repr())
+            yaml_repr["int-cpd"].append(self._child_repr(internal_cp))
         yaml_repr["virtual-compute-desc"] = self.vcd
-        yaml_repr["virtual-storage-desc"] = self.vsd
+        yaml_repr["virtual-storage-desc"] = list(self._vsd)
         if len(self.telemetries)!=0:
             yaml_repr["monitoring-parameter"] = list()
             for metric in self.telemetries:
-                yaml_repr["monitoring-parameter"].append(metric.yaml_repr())
+                yaml_repr["monitoring-parameter"].append(self._child_repr(metric))
         return yaml_repr
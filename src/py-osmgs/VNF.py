@@ -1,19 +1,46 @@
-from copy import deepcopy
-from ipaddress import IPv4Address, IPv4Network, ip_address, ip_network
+from ipaddress import ip_address
 from itertools import count
 from pathlib import Path
 import re
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+import warnings
 from bitmath import GiB
 
 
 from pyvis.network import Network
-from VDU import VDU, OsmEntity, Telemetries, VirtualComputeDesc, VirtualStorageDesc
+from Addressing import Address, AddressPlan, AddressPool
+from Addressing import Network as IPNetwork
+from VDU import (
+    VDU,
+    VDUInterface,
+    OsmEntity,
+    ReadOnlyList,
+    Telemetries,
+    VirtualComputeDesc,
+    VirtualStorageDesc,
+    cached_repr,
+    yaml_extras,
+)
+
+
+def repr_list(function: Callable[[Any], Any], entities: Iterable) -> list:
+    """Build the list of an entity list in a yaml representation, the default of yaml_layout.
+
+    Args:
+        function (Callable[[Any], Any]): representation of one entity.
+        entities (Iterable): the entities.
+
+    Returns:
+        list: the representations.
+    """
+    return [function(entity) for entity in entities]
 
 
 class ImageDescription(OsmEntity):
     """Image description"""
 
+    __slots__ = ("_id", "_name", "_image", "_vim_type")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -44,7 +71,7 @@ class ImageDescription(OsmEntity):
             elif key == "vim-type":
                 self._vim_type = value
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -75,21 +102,18 @@ class ImageDescription(OsmEntity):
             self._vim_type = vim_type
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["id"] = self._id
         yaml_repr["name"] = self._name
@@ -123,6 +147,8 @@ class ImageDescription(OsmEntity):
 class ExternalConnectionPoint(OsmEntity):
     """External Connection Point"""
 
+    __slots__ = ("_id", "_vdu_interface", "_vdu_id")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -145,7 +171,7 @@ class ExternalConnectionPoint(OsmEntity):
                 self._vdu_interface = value["cpd"]
                 self._vdu_id = value["vdu-id"]
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -172,21 +198,18 @@ class ExternalConnectionPoint(OsmEntity):
         self._configured = True
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["id"] = self.id
         if (self.vdu_id is not None) and (self.vdu_interface is not None):
@@ -210,6 +233,8 @@ class ExternalConnectionPoint(OsmEntity):
 
 
 class InternalConnectionPoint(OsmEntity):
+    __slots__ = ("_id",)
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -225,7 +250,7 @@ class InternalConnectionPoint(OsmEntity):
             if key == "id":
                 self._id = value
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -238,21 +263,18 @@ class InternalConnectionPoint(OsmEntity):
         self._id = id
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["id"] = self.id
 
@@ -265,6 +287,15 @@ class InternalConnectionPoint(OsmEntity):
 
 
 class ScalingCriteria(OsmEntity):
+    __slots__ = (
+        "_name",
+        "_scale_in_relational_operation",
+        "_scale_in_threshold",
+        "_scale_out_relational_operation",
+        "_scale_out_threshold",
+        "_vnf_monitoring_param_ref",
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self._name: str = None
@@ -290,10 +321,10 @@ class ScalingCriteria(OsmEntity):
                 self._scale_out_relational_operation = value
             elif key == "scale-out-threshold":
                 self._scale_out_threshold = value
-            elif key == "vnf_cpu_util":
+            elif key == "vnf-monitoring-param-ref":
                 self._vnf_monitoring_param_ref = value
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -337,21 +368,18 @@ class ScalingCriteria(OsmEntity):
             self._scale_out_threshold = scale_out_threshold
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["name"] = self.name
         if self.scale_in_relational_operation is not None:
@@ -400,13 +428,25 @@ class ScalingCriteria(OsmEntity):
 
 
 class ScalingPolicy(OsmEntity):
+    __slots__ = (
+        "_cooldown_time",
+        "_name",
+        "_scaling_criteria",
+        "_threshold_time",
+        "_scaling_type",
+        "_scale_out_operation_type",
+        "_scale_in_operation_type",
+    )
+
     def __init__(self) -> None:
+        super().__init__()
         self._cooldown_time: int = None
         self._name: str = None
         self._scaling_criteria: List[ScalingCriteria] = list()
         self._threshold_time: int = None
         self._scaling_type: str = None
-        self._configured: bool = False
+        self._scale_out_operation_type: str = None
+        self._scale_in_operation_type: str = None
 
     def load(self, scaling_policy_description: dict):
         """Load configuration from a description file.
@@ -435,8 +475,12 @@ class ScalingPolicy(OsmEntity):
                 self._scaling_type = value
             elif key == "threshold-time":
                 self._threshold_time = value
+            elif key == "scale-out-operation-type":
+                self._scale_out_operation_type = value
+            elif key == "scale-in-operation-type":
+                self._scale_in_operation_type = value
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
     def configure(
         self,
@@ -445,6 +489,8 @@ class ScalingPolicy(OsmEntity):
         threshold_time: int,
         scale_in_out_threshold_param_ref: List[Tuple[int, int, str]],
         scaling_type: str = "automatic",
+        scale_out_operation_type: str = None,
+        scale_in_operation_type: str = None,
         **kwargs,
     ):
         """Config the scaling policy.
@@ -455,6 +501,8 @@ class ScalingPolicy(OsmEntity):
             threshold_time (int): threshold time.
             scale_in_out_threshold_param_ref (List[Tuple[int, int, str]]): (scale in Threshold, scale out Threshold, monitoring parameter)
             scaling_type (str, optional): scaling type. Defaults to "automatic".
+            scale_out_operation_type (str, optional): how the scale out criteria combine, "AND" or "OR". Defaults to None, OR.
+            scale_in_operation_type (str, optional): how the scale in criteria combine, "AND" or "OR". Defaults to None, OR.
 
         Raises:
             RuntimeWarning: raise if it is already configured.
@@ -466,6 +514,8 @@ class ScalingPolicy(OsmEntity):
         self._cooldown_time = cooldown_time
         self._threshold_time = threshold_time
         self._scaling_type = scaling_type
+        self._scale_out_operation_type = scale_out_operation_type
+        self._scale_in_operation_type = scale_in_operation_type
 
         for thresholds_param in scale_in_out_threshold_param_ref:
             try:
@@ -481,30 +531,31 @@ class ScalingPolicy(OsmEntity):
                 print(f"Fail to configure scaling criteria {thresholds_param}, {e}")
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["cooldown-time"] = self.cooldown_time
         yaml_repr["name"] = self.name
         yaml_repr["scaling-type"] = self.scaling_type
         yaml_repr["threshold-time"] = self.threshold_time
+        if self.scale_out_operation_type is not None:
+            yaml_repr["scale-out-operation-type"] = self.scale_out_operation_type
+        if self.scale_in_operation_type is not None:
+            yaml_repr["scale-in-operation-type"] = self.scale_in_operation_type
 
         yaml_repr["scaling-criteria"] = list()
         for scaling_criteria in self.scaling_criteria:
-            yaml_repr["scaling-criteria"].append(scaling_criteria.yaml_repr())
+            yaml_repr["scaling-criteria"].append(self._child_repr(scaling_criteria))
 
         return yaml_repr
 
@@ -528,13 +579,25 @@ class ScalingPolicy(OsmEntity):
         """Get threshold time."""
         return self._threshold_time
 
+    @property
+    def scale_out_operation_type(self):
+        """Get how the scale out criteria combine, None for OR."""
+        return self._scale_out_operation_type
+
+    @property
+    def scale_in_operation_type(self):
+        """Get how the scale in criteria combine, None for OR."""
+        return self._scale_in_operation_type
+
     @property
     def scaling_criteria(self):
         """get scaling criteria."""
-        return self._scaling_criteria
+        return ReadOnlyList(self._scaling_criteria)
 
 
 class Deltas(OsmEntity):
+    __slots__ = ("_id", "_vdu_delta")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -563,7 +626,7 @@ class Deltas(OsmEntity):
                     number_of_instances = vdu_delta["number-of-instances"]
                     self._vdu_delta.append((vdu_id, number_of_instances))
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -583,24 +646,21 @@ class Deltas(OsmEntity):
             )
 
         self._id = id
-        self._vdu_delta = vdu_delta
+        self._vdu_delta = list(vdu_delta)
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["id"] = self.id
         yaml_repr["vdu-delta"] = list()
@@ -618,17 +678,26 @@ class Deltas(OsmEntity):
     @property
     def vdu_delta(self):
         """Get VDU deltas."""
-        return self._vdu_delta
+        return ReadOnlyList(self._vdu_delta)
 
 
-class ScalingAspect:
+class ScalingAspect(OsmEntity):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_aspect_delta_details",
+        "_max_scale_level",
+        "_scaling_policy",
+        "_scale_level",
+    )
+
     def __init__(self) -> None:
+        super().__init__()
         self._id: str = None
         self._name: str = None
         self._aspect_delta_details: List[Deltas] = list()
         self._max_scale_level: int = None
         self._scaling_policy: List[ScalingPolicy] = list()
-        self._configured: bool = False
 
         self._scale_level: int = 0
 
@@ -664,7 +733,7 @@ class ScalingAspect:
                     s_p.load(scaling_policy)
                     self._scaling_policy.append(s_p)
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
     def configure(
         self,
@@ -698,44 +767,38 @@ class ScalingAspect:
             self._name = name
         self._max_scale_level = max_scale_level
 
-        self._aspect_delta_details = vdu_deltas
+        if vdu_deltas is not None:
+            self._aspect_delta_details = list(vdu_deltas)
 
-        self._scaling_policy = scaling_policies
+        if scaling_policies is not None:
+            self._scaling_policy = list(scaling_policies)
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["id"] = self.id
         yaml_repr["name"] = self.name
         yaml_repr["max-scale-level"] = self.max_scale_level
         yaml_repr["aspect-delta-details"] = {"deltas": list()}
         for deltas in self.aspect_delta_details:
-            yaml_repr["aspect-delta-details"]["deltas"].append(deltas.yaml_repr())
+            yaml_repr["aspect-delta-details"]["deltas"].append(self._child_repr(deltas))
         yaml_repr["scaling-policy"] = list()
         for policy in self.scaling_policy:
-            yaml_repr["scaling-policy"].append(policy.yaml_repr())
+            yaml_repr["scaling-policy"].append(self._child_repr(policy))
 
         return yaml_repr
 
-    @property
-    def configured(self):
-        """Check if configured."""
-        return self._configured
-
     @property
     def id(self):
         """Get id."""
@@ -754,26 +817,38 @@ class ScalingAspect:
     @property
     def aspect_delta_details(self):
         """Get aspect delta details."""
-        return self._aspect_delta_details
+        return ReadOnlyList(self._aspect_delta_details)
 
     @property
     def scaling_policy(self):
         """Get scaling policy."""
-        return self._scaling_policy
+        return ReadOnlyList(self._scaling_policy)
 
 
 class VirtualLinkProfile(OsmEntity):
     """Internal Virtual Link"""
 
+    __slots__ = (
+        "_id",
+        "_cidr",
+        "_descriptiion",
+        "_dhcp_enabled",
+        "_gateway_ip",
+        "_ip_version",
+        "_name",
+        "_address_pool",
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
-        self._cidr: IPv4Network = None
+        self._cidr: IPNetwork = None
         self._descriptiion: str = None
         self._dhcp_enabled: bool = False
-        self._gateway_ip: IPv4Address = None
+        self._gateway_ip: Address = None
         self._ip_version: str = None
         self._name: str = None
+        self._address_pool: AddressPool = None
 
     def load(self, vl_profile: Dict):
         """Load Virtual Link Profile from a description.
@@ -788,26 +863,31 @@ class VirtualLinkProfile(OsmEntity):
         if self.configured:
             raise RuntimeWarning("This Virtual Link Profile is already configured.")
 
-        for key, value in vl_profile["flavour"]:
+        for key, value in vl_profile["flavour"].items():
             if key == "id":
                 self._id = value
             elif key == "virtual-link-protocol-data":
-                self._cidr = IPv4Network(value["l3-protocol-data"]["cidr"])
-                self._descriptiion = value["l3-protocol-data"]["description"]
-                self._dhcp_enabled = value["l3-protocol-data"]["dhcp-enabled"]
-                self._gateway_ip = IPv4Address(value["l3-protocol-data"]["gateway-ip"])
-                self._ip_version = value["l3-protocol-data"]["ip-version"]
-                self._name = value["l3-protocol-data"]["name"]
+                l3_protocol_data = value["l3-protocol-data"]
+                plan = AddressPlan(l3_protocol_data["cidr"])
+                self._cidr = plan.network
+                self._descriptiion = l3_protocol_data.get("description")
+                self._dhcp_enabled = l3_protocol_data.get("dhcp-enabled", False)
+                if "gateway-ip" in l3_protocol_data:
+                    self._gateway_ip = ip_address(l3_protocol_data["gateway-ip"])
+                else:
+                    self._gateway_ip = plan.gateway
+                self._ip_version = l3_protocol_data.get("ip-version", plan.ip_version)
+                self._name = l3_protocol_data.get("name", self._id)
 
         self._configured = True
 
     def configure(
         self,
         id: str,
-        cidr: IPv4Network,
-        gateway_ip: IPv4Address,
-        dhcp_enabled: bool,
-        ip_version: str,
+        cidr: IPNetwork,
+        gateway_ip: Address = None,
+        dhcp_enabled: bool = True,
+        ip_version: str = None,
         desciption: str = None,
         name: str = None,
         **kwargs,
@@ -816,22 +896,33 @@ class VirtualLinkProfile(OsmEntity):
 
         Args:
             id (str): id.
-            cidr (str): cidr, x.x.x.x/y
-            gateway_ip (str): default gate way ip, x.x.x.x
-            dhcp_enabled (bool): true or false.
-            ip_version (str): limited to "ipv4".
+            cidr (str): cidr, x.x.x.x/y or an IPv6 prefix.
+            gateway_ip (str, optional): default gate way ip. Defaults to the first usable host.
+            dhcp_enabled (bool, optional): true or false. Defaults to True.
+            ip_version (str, optional): "ipv4" or "ipv6". Defaults to the version of the cidr.
             desciption (str, optional): description. Defaults to Unknown.
             name (str, optional): name. Defaults to id.
 
         Raises:
             RuntimeWarning: raise if it is already configured
+            RuntimeError: raise if the gateway ip is not a usable host of the cidr.
         """
         if self.configured:
             raise RuntimeWarning("This Virtual Link Profile is already configured.")
 
+        plan = AddressPlan(cidr)
+        if gateway_ip is None:
+            gateway_ip = plan.gateway
+        elif not plan.is_host(gateway_ip):
+            raise RuntimeError(
+                f"The gateway ip {gateway_ip} is not a usable host of {plan.network.compressed}."
+            )
+        if ip_version is None:
+            ip_version = plan.ip_version
+
         self._id = id
-        self._cidr = cidr
-        self._gateway_ip = gateway_ip
+        self._cidr = plan.network
+        self._gateway_ip = ip_address(gateway_ip)
         self._dhcp_enabled = dhcp_enabled
         self._ip_version = ip_version
         if desciption is not None:
@@ -844,21 +935,18 @@ class VirtualLinkProfile(OsmEntity):
             self._name = self._id
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
         yaml_repr["flavour"] = dict()
         yaml_repr["flavour"]["id"] = self.id
         yaml_repr["flavour"]["virtual-link-protocol-data"] = dict()
@@ -919,8 +1007,26 @@ class VirtualLinkProfile(OsmEntity):
         """Get ip version."""
         return self._ip_version
 
+    @property
+    def address_plan(self):
+        """Get the address plan of the cidr."""
+        return AddressPlan(self._cidr)
+
+    @property
+    def address_pool(self):
+        """Get the IP address allocator of the cidr, the gateway ip is reserved."""
+        if self._address_pool is None:
+            plan = self.address_plan
+            reserved = list()
+            if self._gateway_ip is not None and plan.is_host(self._gateway_ip):
+                reserved.append(self._gateway_ip)
+            self._address_pool = AddressPool(plan, reserved)
+        return self._address_pool
+
 
 class VduProfile(OsmEntity):
+    __slots__ = ("_id", "_min_number_instances", "_max_number_instances")
+
     def __init__(self) -> None:
         super().__init__()
         self._id = None
@@ -940,7 +1046,7 @@ class VduProfile(OsmEntity):
             elif key == "max-number-of-instances":
                 self._max_number_instances = value
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
         self._configured = True
 
@@ -963,21 +1069,18 @@ class VduProfile(OsmEntity):
         self._max_number_instances = max_num
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        yaml_repr = yaml_extras(self)
         yaml_repr["id"] = self.id
         yaml_repr["min-number-of-instances"] = self.min_number_instances
         if self.max_number_instances is not None:
@@ -1002,6 +1105,8 @@ class VduProfile(OsmEntity):
 
 
 class DF(OsmEntity):
+    __slots__ = ("_id", "_vdu_profile", "_scaling_aspect", "_virtual_link_profile")
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -1036,11 +1141,12 @@ class DF(OsmEntity):
                     scaling_aspect.load(scaling_aspect_descirption)
                     self._scaling_aspect.append(scaling_aspect)
             elif key == "virtual-link-profile":
-                vl_profile = VirtualLinkProfile()
-                vl_profile.load(value)
-                self._virtual_link_profile.append(vl_profile)
+                for vl_profile_description in value:
+                    vl_profile = VirtualLinkProfile()
+                    vl_profile.load(vl_profile_description)
+                    self._virtual_link_profile.append(vl_profile)
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
     def configure(
         self,
@@ -1090,7 +1196,7 @@ class DF(OsmEntity):
                 self._virtual_link_profile.append(vl_profile)
 
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            self._set_extra(key, value)
 
         self._configured = True
 
@@ -1119,39 +1225,47 @@ class DF(OsmEntity):
                         continue
             if aspect_is_valid:
                 self._scaling_aspect.append(scaling_aspect)
+                self._invalidate()
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = deepcopy(vdu_dict)
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0 or key == "interface":
-                yaml_repr.pop(key)
+        return self.yaml_layout(repr_list)
+
+    def yaml_layout(self, sequence: Callable[[Callable[[Any], Any], List], Iterable]) -> dict:
+        """Build the dictionary for yaml dumping with the entity lists made by a given function.
+
+        This is the only layout of a df, yaml_repr builds its lists eagerly and
+        the descriptor writer lazily.
+
+        Args:
+            sequence (Callable[[Callable[[Any], Any], List], Iterable]): makes the list of an entity list from the representation of one entity, like repr_list.
+
+        Returns:
+            dict: for yaml dumping.
+        """
+        yaml_repr = yaml_extras(self)
 
         yaml_repr["id"] = self.id
-        yaml_repr["instantiation-level"] = list()
-        yaml_repr["instantiation-level"].append(
-            {"id": "default-instantiation-level", "vdu-level": list()}
-        )
+        yaml_repr["instantiation-level"] = [
+            {
+                "id": "default-instantiation-level",
+                "vdu-level": sequence(
+                    lambda vdu: {"number-of-instances": vdu.min_number_instances, "vdu-id": vdu.id},
+                    self.vdu_profile,
+                ),
+            }
+        ]
         if len(self.scaling_aspects) != 0:
-            yaml_repr["scaling-aspect"] = list()
-            for scaling_aspect in self.scaling_aspects:
-                yaml_repr["scaling-aspect"].append(scaling_aspect.yaml_repr())
-        yaml_repr["vdu-profile"] = list()
-        for vdu in self.vdu_profile:
-            yaml_repr["instantiation-level"][0]["vdu-level"].append(
-                {"number-of-instances": vdu.min_number_instances, "vdu-id": vdu.id}
-            )
-            yaml_repr["vdu-profile"].append(vdu.yaml_repr())
+            yaml_repr["scaling-aspect"] = sequence(self._child_repr, self.scaling_aspects)
+        yaml_repr["vdu-profile"] = sequence(self._child_repr, self.vdu_profile)
 
         if len(self.virtual_link_profile) != 0:
-            yaml_repr["virtual-link-profile"] = list()
-            for vl in self.virtual_link_profile:
-                yaml_repr["virtual-link-profile"].append(vl.yaml_repr())
+            yaml_repr["virtual-link-profile"] = sequence(self._child_repr, self.virtual_link_profile)
 
         return yaml_repr
 
@@ -1163,22 +1277,44 @@ class DF(OsmEntity):
     @property
     def vdu_profile(self):
         """Get VDU profile."""
-        return self._vdu_profile
+        return ReadOnlyList(self._vdu_profile)
 
     @property
     def virtual_link_profile(self):
         """Get Virtual Link Profile."""
-        return self._virtual_link_profile
+        return ReadOnlyList(self._virtual_link_profile)
 
     @property
     def scaling_aspects(self):
         """Get scaling aspects."""
-        return self._scaling_aspect
+        return ReadOnlyList(self._scaling_aspect)
 
 
 class VNF(OsmEntity):
     """VNF"""
 
+    __slots__ = (
+        "_id",
+        "_description",
+        "_product_name",
+        "_version",
+        "_df",
+        "_ext_cps",
+        "_int_cps",
+        "_mgmt_cp",
+        "_vdus",
+        "_images",
+        "_virtual_compute_desc",
+        "_virtual_storage_desc",
+        "_vdu_index",
+        "_ext_cp_index",
+        "_int_cp_index",
+        "_telemetry_index",
+        "_vl_profile_index",
+        "_unpooled_IPs",
+        "_visualization",
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self._id: str = None
@@ -1196,12 +1332,20 @@ class VNF(OsmEntity):
         self._virtual_compute_desc: List[VirtualComputeDesc] = list()
         self._virtual_storage_desc: List[VirtualStorageDesc] = list()
 
+        self._vdu_index: Dict[str, VDU] = dict()
+        self._ext_cp_index: Dict[str, ExternalConnectionPoint] = dict()
+        self._int_cp_index: Dict[str, InternalConnectionPoint] = dict()
+        self._telemetry_index: Dict[str, VDU] = dict()
+        self._vl_profile_index: Dict[str, VirtualLinkProfile] = dict()
+        # (vdu id, interface id) of the loaded interface IPs left out of their pool.
+        self._unpooled_IPs: Set[Tuple[str, str]] = set()
+
         self._visualization: Network = None
 
     @property
     def ext_cps(self):
         """Get external connection points."""
-        return self._ext_cps
+        return ReadOnlyList(self._ext_cps)
 
     @property
     def mgmt_cp(self):
@@ -1211,7 +1355,7 @@ class VNF(OsmEntity):
     @property
     def images(self):
         """Get images."""
-        return self._images
+        return ReadOnlyList(self._images)
 
     @property
     def version(self):
@@ -1221,7 +1365,7 @@ class VNF(OsmEntity):
     @property
     def vdus(self):
         """Get VDU."""
-        return self._vdus
+        return ReadOnlyList(self._vdus)
 
     @property
     def product_name(self):
@@ -1231,12 +1375,12 @@ class VNF(OsmEntity):
     @property
     def int_cps(self):
         """Get internal connection points."""
-        return self._int_cps
+        return ReadOnlyList(self._int_cps)
 
     @property
     def df(self):
         """Get df."""
-        return self._df
+        return ReadOnlyList(self._df)
 
     @property
     def id(self):
@@ -1246,27 +1390,20 @@ class VNF(OsmEntity):
     @property
     def virtual_compute_descriptions(self):
         """Get virtual compute descriptions."""
-        return self._virtual_compute_desc
+        return ReadOnlyList(self._virtual_compute_desc)
 
     @property
     def virtual_storage_descriptions(self):
         """Get virtual storage descriptions."""
-        return self._virtual_storage_desc
+        return ReadOnlyList(self._virtual_storage_desc)
 
     @property
     def ext_cps_id(self) -> List[str]:
-
-        ext_cp_id_list = list()
-        for ext_cp in self.ext_cps:
-            ext_cp_id_list.append(ext_cp.id)
-        return ext_cp_id_list
+        return list(self._ext_cp_index)
 
     @property
     def int_cps_id(self) -> List[str]:
-        int_cp_id_list = list()
-        for int_cp in self.int_cps:
-            int_cp_id_list.append(int_cp.id)
-        return int_cp_id_list
+        return list(self._int_cp_index)
 
     @property
     def vdu_interfaces_id(self) -> List[str]:
@@ -1278,18 +1415,11 @@ class VNF(OsmEntity):
 
     @property
     def vdus_id(self) -> List[str]:
-        vdu_id_list = list()
-        for vdu in self.vdus:
-            vdu_id_list.append(vdu.id)
-        return vdu_id_list
+        return list(self._vdu_index)
 
     @property
     def vdus_telemetries(self) -> List[str]:
-        telemetries = list()
-        for vdu in self.vdus:
-            for metric in vdu.telemetries:
-                telemetries.append(metric.id)
-        return telemetries
+        return list(self._telemetry_index)
 
     @property
     def images_id(self):
@@ -1298,6 +1428,145 @@ class VNF(OsmEntity):
             image_list.append(image.id)
         return image_list
 
+    def get_VDU(self, vdu_id: str):
+        """Get a VDU by id.
+
+        Args:
+            vdu_id (str): id of the VDU.
+
+        Returns:
+            VDU: the VDU, None if it does not belong to this VNF.
+        """
+        return self._vdu_index.get(vdu_id)
+
+    def get_ExternalConnectionPoint(self, ext_cp_id: str):
+        """Get an external connection point by id.
+
+        Args:
+            ext_cp_id (str): id of the external connection point.
+
+        Returns:
+            ExternalConnectionPoint: the external connection point, None if it does not exist.
+        """
+        return self._ext_cp_index.get(ext_cp_id)
+
+    def get_InternalConnectionPoint(self, int_cp_id: str):
+        """Get an internal connection point by id.
+
+        Args:
+            int_cp_id (str): id of the internal connection point.
+
+        Returns:
+            InternalConnectionPoint: the internal connection point, None if it does not exist.
+        """
+        return self._int_cp_index.get(int_cp_id)
+
+    def get_vdu_interface(self, vdu_id: str, interface_id: str):
+        """Get a VDU interface by VDU id and interface id.
+
+        Args:
+            vdu_id (str): id of the VDU.
+            interface_id (str): id of the interface.
+
+        Returns:
+            VDUInterface: the interface, None if the VDU or the interface does not exist.
+        """
+        vdu = self._vdu_index.get(vdu_id)
+        if vdu is None:
+            return None
+        return vdu.get_interface(interface_id)
+
+    def get_vdu_telemetry(self, telemetry_id: str):
+        """Get a VDU telemetry by id.
+
+        Args:
+            telemetry_id (str): id of the telemetry.
+
+        Returns:
+            MonitoringParameter: the telemetry, None if it does not exist.
+        """
+        vdu = self._telemetry_index.get(telemetry_id)
+        if vdu is None:
+            return None
+        return vdu.get_telemetry(telemetry_id)
+
+    def get_telemetry_VDU(self, telemetry_id: str):
+        """Get the VDU collecting a telemetry.
+
+        Args:
+            telemetry_id (str): id of the telemetry.
+
+        Returns:
+            VDU: the VDU, None if the telemetry does not exist.
+        """
+        return self._telemetry_index.get(telemetry_id)
+
+    def get_virtual_link_profile(self, vl_profile_id: str):
+        """Get a virtual link profile by id.
+
+        Args:
+            vl_profile_id (str): id of the virtual link profile.
+
+        Returns:
+            VirtualLinkProfile: the virtual link profile, None if it does not exist.
+        """
+        return self._vl_profile_index.get(vl_profile_id)
+
+    def _index_VDU(self, vdu: VDU):
+        """Register a VDU and its telemetries in the id indexes."""
+        self._vdu_index[vdu.id] = vdu
+        for telemetry in vdu.telemetries:
+            self._telemetry_index[telemetry.id] = vdu
+
+    def _interface_address_pool(self, interface: VDUInterface):
+        """Get the address pool of the virtual link an interface is connected to, None if it has no profile."""
+        if interface.vnf_internal_cp is None:
+            return None
+        vl_profile = self._vl_profile_index.get(interface.vnf_internal_cp)
+        if vl_profile is None:
+            return None
+        return vl_profile.address_pool
+
+    def _reserve_interface_IPs(self, int_cp_id: str = None, strict: bool = True):
+        """Mark the IPs already assigned to VDU interfaces as allocated in their virtual link pools.
+
+        Args:
+            int_cp_id (str, optional): only the interfaces on this internal connection point. Defaults to all.
+            strict (bool, optional): raise on a conflicting IP, otherwise warn and leave it out of the pool. Defaults to True.
+
+        Raises:
+            RuntimeError: raise if strict and two interfaces share an IP or an IP is outside its virtual link.
+        """
+        for vdu in self._vdus:
+            for interface in vdu.interfaces:
+                if interface.ip_address is None:
+                    continue
+                if int_cp_id is not None and interface.vnf_internal_cp != int_cp_id:
+                    continue
+                address_pool = self._interface_address_pool(interface)
+                if address_pool is None:
+                    continue
+                try:
+                    address_pool.allocate(interface.ip_address)
+                except RuntimeError as error:
+                    if strict:
+                        raise
+                    warnings.warn(
+                        f"The IP address {interface.ip_address.compressed} of interface {interface.id} "
+                        f"of VDU {vdu.id} is not reserved: {error}",
+                        RuntimeWarning,
+                    )
+                    self._unpooled_IPs.add((vdu.id, interface.id))
+
+    def _release_interface_IP(self, vdu_id: str, interface: VDUInterface):
+        """Give the IP of a VDU interface back to its virtual link pool, unless it was left out on load."""
+        if (vdu_id, interface.id) in self._unpooled_IPs:
+            self._unpooled_IPs.discard((vdu_id, interface.id))
+            return
+        address_pool = self._interface_address_pool(interface)
+        if address_pool is not None and interface.ip_address is not None:
+            address_pool.release(interface.ip_address)
+
     def load(self, vnf_desc: Dict):
 
         if self.configured:
@@ -1316,16 +1585,20 @@ class VNF(OsmEntity):
                 df = DF()
                 df.load(value[0])
                 self._df.append(df)
+                for vl_profile in df.virtual_link_profile:
+                    self._vl_profile_index[vl_profile.id] = vl_profile
             elif key == "ext-cpd":
                 for ext_cp in value:
                     new_ext_cp = ExternalConnectionPoint()
                     new_ext_cp.load(ext_cp)
                     self._ext_cps.append(new_ext_cp)
+                    self._ext_cp_index[new_ext_cp.id] = new_ext_cp
             elif key == "int-virtual-link-desc":
                 for int_cpd in value:
                     new_int_cp = InternalConnectionPoint()
                     new_int_cp.load(int_cpd)
                     self._int_cps.append(new_int_cp)
+                    self._int_cp_index[new_int_cp.id] = new_int_cp
             elif key == "mgmt-cp":
                 self._mgmt_cp = value
             elif key == "vdu":
@@ -1333,6 +1606,7 @@ class VNF(OsmEntity):
                     new_vdu = VDU()
                     new_vdu.load(vdu)
                     self._vdus.append(new_vdu)
+                    self._index_VDU(new_vdu)
             elif key == "virtual-compute-desc":
                 for vcd in value:
                     new_vcd = VirtualComputeDesc()
@@ -1349,8 +1623,11 @@ class VNF(OsmEntity):
                     new_image.load(image)
                     self._images.append(new_image)
             else:
-                setattr(self, key, value)
+                self._set_extra(key, value)
 
+        # descriptors written by other tools may repeat an IP or place it outside
+        # its virtual link, they still load.
+        self._reserve_interface_IPs(strict=False)
         self._configured = True
 
     def visualization(self, detailed: bool = False):
@@ -1361,9 +1638,9 @@ class VNF(OsmEntity):
         if len(self.int_cps) != 0:
             for i, int_cp in enumerate(self.int_cps):
                 title = "No Configuration."
-                for vl_profile in self.df[0].virtual_link_profile:
-                    if vl_profile.id == int_cp.id:
-                        title = f"gateway: {vl_profile.gateway_ip}, network: {vl_profile.cidr}, DHCP-{vl_profile.dhcp_enabled}"
+                vl_profile = self.get_virtual_link_profile(int_cp.id)
+                if vl_profile is not None:
+                    title = f"gateway: {vl_profile.gateway_ip}, network: {vl_profile.cidr}, DHCP-{vl_profile.dhcp_enabled}"
                 visualization.add_node(
                     n_id=int_cp.id,
                     shape="image",
@@ -1469,10 +1746,12 @@ class VNF(OsmEntity):
             mgmt_cp.configure(id=mgmt_id)
 
         self._ext_cps.append(mgmt_cp)
+        self._ext_cp_index[mgmt_cp.id] = mgmt_cp
         self._mgmt_cp = mgmt_cp.id
 
         self._df = [DF()]
         self._df[0]._id = "default-df"
+        self._invalidate()
 
     def add_Image(
         self, id: str, image_filepath: str, name: str = None, vim_type: str = None
@@ -1493,6 +1772,7 @@ class VNF(OsmEntity):
             )
 
         self._images.append(image)
+        self._invalidate()
 
     def remove_image(self, image_id:str):
         """Remove the image description from the VNF.
@@ -1507,8 +1787,8 @@ class VNF(OsmEntity):
     ):
 
         if vdu_id is not None:
-            vdu_id_list = self.vdus_id
-            if vdu_id_list.count(vdu_id) == 0:
+            vdu = self.get_VDU(vdu_id)
+            if vdu is None:
                 raise RuntimeError("The given VDU does not belong to this VNF!")
             else:
                 if vdu_cp is None:
@@ -1516,13 +1796,10 @@ class VNF(OsmEntity):
                         f"A VDU connection point on VDU {vdu_id} must be given."
                     )
                 else:
-                    for vdu in self.vdus:
-                        if vdu.id == vdu_id:
-                            vdu_cp_list = vdu.Interfaces_id
-                            if vdu_cp_list.count(vdu_cp) == 0:
-                                raise RuntimeError(
-                                    f"The given VDU connection point {vdu_cp} does not exist on VDU {vdu_id}"
-                                )
+                    if vdu.get_interface(vdu_cp) is None:
+                        raise RuntimeError(
+                            f"The given VDU connection point {vdu_cp} does not exist on VDU {vdu_id}"
+                        )
 
         new_ext_cp = ExternalConnectionPoint()
         if id is None:
@@ -1532,13 +1809,14 @@ class VNF(OsmEntity):
         else:
             new_ext_cp.configure(id=id, vdu=vdu_id, vdu_connection_point=vdu_cp)
 
-        ext_cp_list = self.ext_cps_id
-        if ext_cp_list.count(new_ext_cp.id) != 0:
+        if new_ext_cp.id in self._ext_cp_index:
             raise RuntimeError(
                 f"The external connection point {new_ext_cp.id} already exists."
             )
         else:
             self._ext_cps.append(new_ext_cp)
+            self._ext_cp_index[new_ext_cp.id] = new_ext_cp
+            self._invalidate()
             return True
 
     def remove_ExternalConnectionPoint(self, ext_cp_id: str):
@@ -1547,23 +1825,16 @@ class VNF(OsmEntity):
         Args:
             ext_cp_id (str): id of the external connection point.
         """
-        if self.ext_cps_id.count(ext_cp_id)==0:
+        ext_cp = self._ext_cp_index.pop(ext_cp_id, None)
+        if ext_cp is None:
             raise RuntimeError(f"The external connection point {ext_cp_id} does not belong to VNF {self.id}.")
 
-        for ext_cp in self._ext_cps:
-            if ext_cp.id == ext_cp_id:
-                for vdu in self.vdus:
-                    if vdu.id == ext_cp.vdu_id:
-                        for interface in vdu._interfaces:
-                            if interface.id == ext_cp.vdu_interface:
-                                vdu._interfaces.remove(interface)
-                                break
-                        break
-                self._ext_cps.remove(ext_cp)
-                break
-            else:
-                continue
-        
+        vdu = self.get_VDU(ext_cp.vdu_id)
+        if vdu is not None:
+            vdu.remove_Interface(ext_cp.vdu_interface)
+        self._ext_cps.remove(ext_cp)
+        self._invalidate()
+
         return True
 
     def add_InternalConnectionPoint(
@@ -1576,42 +1847,54 @@ class VNF(OsmEntity):
 
         if ip is not None:
             if network is not None:
-                ip: IPv4Address = ip_address(ip)
-                network: IPv4Network = ip_network(network)
+                ip: Address = ip_address(ip)
+                plan = AddressPlan(network)
                 new_int_vl = VirtualLinkProfile()
                 new_int_vl.configure(
                     id=id,
-                    cidr=network,
-                    gateway_ip=list(network.hosts())[0],
+                    cidr=plan.network,
+                    gateway_ip=plan.gateway,
                     dhcp_enabled=dhcp_enabled,
-                    ip_version="ipv4",
+                    ip_version=plan.ip_version,
                 )
-                new_int_cp = InternalConnectionPoint()
-                new_int_cp.configure(id=id)
-                self._int_cps.append(new_int_cp)
+                if new_int_vl.id in self._vl_profile_index:
+                    raise RuntimeError(
+                        f"The internal connection point {new_int_vl.id} already exists."
+                    )
+                # an existing internal connection point without a profile gets configured.
+                if new_int_vl.id not in self._int_cp_index:
+                    new_int_cp = InternalConnectionPoint()
+                    new_int_cp.configure(id=id)
+                    self._int_cps.append(new_int_cp)
+                    self._int_cp_index[new_int_cp.id] = new_int_cp
                 self._df[0]._virtual_link_profile.append(new_int_vl)
+                self._df[0]._invalidate()
+                self._vl_profile_index[new_int_vl.id] = new_int_vl
+                self._reserve_interface_IPs(new_int_vl.id)
             else:
                 raise RuntimeError(f"A network must be indicated for ip address {ip}")
         else:
             if id is None:
                 new_int_cp = InternalConnectionPoint()
                 new_int_cp.configure(id=f"int_{len(self._int_cps)}")
-                if self.int_cps_id.count(new_int_cp.id) != 0:
+                if new_int_cp.id in self._int_cp_index:
                     raise RuntimeError(
                         f"The internal connection point {new_int_cp.id} already exists."
                     )
                 else:
                     self._int_cps.append(new_int_cp)
+                    self._int_cp_index[new_int_cp.id] = new_int_cp
                 return True
             else:
                 new_int_cp = InternalConnectionPoint()
                 new_int_cp.configure(id=id)
-                if self.int_cps_id.count(new_int_cp.id) != 0:
+                if new_int_cp.id in self._int_cp_index:
                     raise RuntimeError(
                         f"The internal connection point {new_int_cp.id} already exists."
                     )
                 else:
                     self._int_cps.append(new_int_cp)
+                    self._int_cp_index[new_int_cp.id] = new_int_cp
                 return True
 
     def remove_InternalConnectionPoint(self, int_cp_id: str):
@@ -1621,23 +1904,22 @@ class VNF(OsmEntity):
             int_cp_id (str): id of the internal connection point.
         """
 
-        int_cp_list = self.int_cps_id
-        if int_cp_list.count(int_cp_id) == 0:
-            raise RuntimeError(f"Cannnot found {int_cp} in VNF {self.id}")
+        int_cp = self._int_cp_index.pop(int_cp_id, None)
+        if int_cp is None:
+            raise RuntimeError(f"Cannnot found {int_cp_id} in VNF {self.id}")
 
-        for int_cp in self._int_cps:
-            if int_cp.id == int_cp_id:
-                self._int_cps.remove(int_cp)
-                break
+        self._int_cps.remove(int_cp)
 
-        for int_cp_profile in self.df[0]._virtual_link_profile:
-            if int_cp_profile.id == int_cp_id:
-                self.df[0]._virtual_link_profile.remove(int_cp_profile)
+        int_cp_profile = self._vl_profile_index.pop(int_cp_id, None)
+        if int_cp_profile is not None:
+            self.df[0]._virtual_link_profile.remove(int_cp_profile)
+            self.df[0]._invalidate()
 
         for vdu in self._vdus:
-            for interface in vdu._interfaces:
+            for interface in list(vdu.interfaces):
                 if interface.vnf_internal_cp == int_cp_id:
-                    vdu._interfaces.remove(interface)
+                    self._unpooled_IPs.discard((vdu.id, interface.id))
+                    vdu.remove_Interface(interface.id)
 
         return True
 
@@ -1660,6 +1942,9 @@ class VNF(OsmEntity):
                 f"The VDU {id} is not connected to any connection points."
             )
 
+        if id in self._vdu_index:
+            raise RuntimeError(f"The VDU {id} already exists in VNF {self.id}.")
+
         new_vcd = VirtualComputeDesc()
         new_vcd.configure(id=f"{id}-compute", num_vcpu=num_vcpu, size_mem=size_memory)
 
@@ -1681,44 +1966,43 @@ class VNF(OsmEntity):
         )
 
         if ext_cps is not None:
-            ext_cp_list = self.ext_cps_id
             for ext_cp in ext_cps:
-                if ext_cp_list.count(ext_cp) == 0:
+                if ext_cp not in self._ext_cp_index:
                     raise RuntimeError(f"Cannot found {ext_cp} in VNF {self.id}")
 
         if int_cps is not None:
-            int_cp_list = self.int_cps_id
             for int_cp in int_cps:
-                if int_cp_list.count(int_cp) == 0:
+                if int_cp not in self._int_cp_index:
                     raise RuntimeError(f"Cannnot found {int_cp} in VNF {self.id}")
 
         if ext_cps is not None:
             for ext_cp in ext_cps:
-                for cp in self.ext_cps:
-                    if cp.id == ext_cp:
-                        if cp._vdu_id is None:
-                            cp._vdu_id = id
-                            new_vdu.addInterface()
-                            cp._vdu_interface = new_vdu.interfaces[-1].id
-                        else:
-                            raise RuntimeError(
-                                f"Another VDU {cp.vdu_id} has already connected to External Connection Point {cp.id}."
-                            )
+                cp = self._ext_cp_index[ext_cp]
+                if cp._vdu_id is None:
+                    cp._vdu_id = id
+                    new_vdu.addInterface()
+                    cp._vdu_interface = new_vdu.interfaces[-1].id
+                    cp._invalidate()
+                else:
+                    raise RuntimeError(
+                        f"Another VDU {cp.vdu_id} has already connected to External Connection Point {cp.id}."
+                    )
 
         if int_cps is not None:
             for int_cp in int_cps:
-                for cp in self.int_cps:
-                    if int_cp == cp.id:
-                        new_vdu.addInterface(vnf_internal_cp=cp.id)
+                new_vdu.addInterface(vnf_internal_cp=self._int_cp_index[int_cp].id)
 
         self._virtual_compute_desc.append(new_vcd)
         for new_vsd in vsd_list:
             self._virtual_storage_desc.append(new_vsd)
 
         self._vdus.append(new_vdu)
+        self._index_VDU(new_vdu)
         new_vdu_profile = VduProfile()
         new_vdu_profile.configure(id=new_vdu.id, min_num=1, max_num=max_num)
-        self.df[0].vdu_profile.append(new_vdu_profile)
+        self._df[0]._vdu_profile.append(new_vdu_profile)
+        self.df[0]._invalidate()
+        self._invalidate()
 
     def remove_VDU(self, vdu_id: str):
         """Remove the VDU, along with any scaling aspects that envolves it.
@@ -1727,21 +2011,26 @@ class VNF(OsmEntity):
             vdu_id (str): id of the VDU.
         """
 
-        vdu_list = self.vdus_id
-        if vdu_list.count(vdu_id) == 0:
+        vdu = self._vdu_index.pop(vdu_id, None)
+        if vdu is None:
             raise RuntimeError(f"The {vdu_id} does not belong to this VNF.")
 
-        vdu_telemetries = list()
-        for vdu in self._vdus:
-            if vdu.id == vdu_id:
-                vdu_telemetries = vdu.telemetries_id
-                self._vdus.remove(vdu)
+        for interface in vdu.interfaces:
+            self._release_interface_IP(vdu.id, interface)
+
+        vdu_telemetries = vdu.telemetries_id
+        for telemetry_id in vdu_telemetries:
+            if self._telemetry_index.get(telemetry_id) is vdu:
+                del self._telemetry_index[telemetry_id]
+        self._vdus.remove(vdu)
+        self._invalidate()
 
         for vdu_profile in self.df[0]._vdu_profile:
             if vdu_profile.id == vdu_id:
                 self.df[0]._vdu_profile.remove(vdu_profile)
+                self.df[0]._invalidate()
 
-        for scaling_aspect in self.df[0].scaling_aspects:
+        for scaling_aspect in list(self.df[0].scaling_aspects):
             need_removal = False
             for delta in scaling_aspect.aspect_delta_details:
                 for vdu_delta in delta.vdu_delta:
@@ -1755,45 +2044,46 @@ class VNF(OsmEntity):
                         break
             if need_removal:
                 self.df[0]._scaling_aspect.remove(scaling_aspect)
+                self.df[0]._invalidate()
 
     def assign_IP_vdu_interface(
-        self, vdu_id: str, interface_id: str, ip_address: IPv4Address
+        self, vdu_id: str, interface_id: str, ip_address: Address
     ):
         """Assign IP to a VDU's interface
 
         Args:
             vdu_id (str): VDU id.
             interface_id (str): Interface id.
-            ip_address (IPv4Address): IPv4 address.
+            ip_address (Address): IP address.
+
+        Raises:
+            RuntimeError: raise if the IP is outside the virtual link or already assigned to another interface.
         """
-        vdu_list = self.vdus_id
-        if vdu_list.count(vdu_id) == 0:
+        vdu = self.get_VDU(vdu_id)
+        if vdu is None:
             raise RuntimeError(f"The {vdu_id} does not belong to this VNF.")
 
-        for vdu in self._vdus:
-            if vdu.id == vdu_id:
-                for interface in vdu._interfaces:
-                    if interface.id == interface_id:
-                        if interface.vnf_internal_cp is not None:
-                            for vl_profile in self.df[0].virtual_link_profile:
-                                if vl_profile.id == interface.vnf_internal_cp:
-                                    if ip_address in vl_profile.cidr:
-                                        interface._ip_address = ip_address
-                                    else:
-                                        raise RuntimeError(
-                                            f"The IP address {ip_address.compressed} is not within {vl_profile.cidr.compressed}"
-                                        )
-                                    break
-                                else:
-                                    continue
-                        else:
-                            interface.ip_address = ip_address
-                        break
-                    else:
-                        continue
-                break
-            else:
-                continue
+        interface = vdu.get_interface(interface_id)
+        if interface is None:
+            return
+
+        if interface.vnf_internal_cp is not None:
+            vl_profile = self.get_virtual_link_profile(interface.vnf_internal_cp)
+            if vl_profile is not None:
+                if ip_address in vl_profile.cidr:
+                    if interface.ip_address == ip_address:
+                        return
+                    vl_profile.address_pool.allocate(ip_address)
+                    self._release_interface_IP(vdu_id, interface)
+                    interface._ip_address = ip_address
+                    interface._invalidate()
+                else:
+                    raise RuntimeError(
+                        f"The IP address {ip_address.compressed} is not within {vl_profile.cidr.compressed}"
+                    )
+        else:
+            interface._ip_address = ip_address
+            interface._invalidate()
 
     def unassign_IP_vdu_interface(self, vdu_id: str, interface_id: str):
         """Unassign the IP from a VDU's interface.
@@ -1802,19 +2092,80 @@ class VNF(OsmEntity):
             vdu_id (str): id of the VDU.
             interface_id (str): id of the interface.
         """
-        vdu_list = self.vdus_id
-        if vdu_list.count(vdu_id) == 0:
+        vdu = self.get_VDU(vdu_id)
+        if vdu is None:
             raise RuntimeError(f"The {vdu_id} does not belong to this VNF.")
 
-        for vdu in self._vdus:
-            if vdu.id == vdu_id:
-                for interface in vdu._interfaces:
-                    if interface.id == interface_id:
-                        interface._ip_address = None
-                        return True
+        interface = vdu.get_interface(interface_id)
+        if interface is not None:
+            self._release_interface_IP(vdu_id, interface)
+            interface._ip_address = None
+            interface._invalidate()
+            return True
 
         return False
 
+    def allocate_IP_vdu_interface(self, vdu_id: str, interface_id: str) -> Address:
+        """Assign the next free IP of its virtual link to a VDU's interface.
+
+        Args:
+            vdu_id (str): VDU id.
+            interface_id (str): Interface id.
+
+        Raises:
+            RuntimeError: raise if the interface is not on a virtual link with a profile or the link has no free IP.
+
+        Returns:
+            Address: the IP of the interface.
+        """
+        vdu = self.get_VDU(vdu_id)
+        if vdu is None:
+            raise RuntimeError(f"The {vdu_id} does not belong to this VNF.")
+
+        interface = vdu.get_interface(interface_id)
+        if interface is None:
+            raise RuntimeError(f"The {interface_id} does not belong to VDU {vdu_id}.")
+
+        address_pool = self._interface_address_pool(interface)
+        if address_pool is None:
+            raise RuntimeError(
+                f"The interface {interface_id} is not connected to a virtual link with a profile."
+            )
+        if interface.ip_address is None:
+            interface._ip_address = address_pool.allocate()
+            interface._invalidate()
+        return interface.ip_address
+
+    def allocate_IP_virtual_link(self, int_cp_id: str) -> List[Tuple[str, str, Address]]:
+        """Assign free IPs to every VDU interface on a virtual link that has none.
+
+        Args:
+            int_cp_id (str): id of the internal connection point.
+
+        Raises:
+            RuntimeError: raise if the link has no profile or not enough free IPs, nothing is assigned then.
+
+        Returns:
+            List[Tuple[str, str, Address]]: (VDU id, interface id, IP) of the newly assigned interfaces.
+        """
+        vl_profile = self.get_virtual_link_profile(int_cp_id)
+        if vl_profile is None:
+            raise RuntimeError(f"The internal connection point {int_cp_id} has no virtual link profile.")
+
+        pending = [
+            (vdu, interface)
+            for vdu in self._vdus
+            for interface in vdu.interfaces
+            if interface.vnf_internal_cp == int_cp_id and interface.ip_address is None
+        ]
+        addresses = vl_profile.address_pool.allocate_many(len(pending))
+        allocations = list()
+        for (vdu, interface), address in zip(pending, addresses):
+            interface._ip_address = address
+            interface._invalidate()
+            allocations.append((vdu.id, interface.id, address))
+        return allocations
+
     def add_vdu_telemetry(self, vdu_id: str, metrics: List[str]):
         """Add Telemetry to a VDU.
 
@@ -1822,22 +2173,17 @@ class VNF(OsmEntity):
             vdu_id (str): VDU id.
             metrics (List[str]): List of metrics.
         """
-        vdu_list = self.vdus_id
-        if vdu_list.count(vdu_id) == 0:
+        vdu = self.get_VDU(vdu_id)
+        if vdu is None:
             raise RuntimeError(f"The {vdu_id} does not belong to this VNF.")
 
-        for vdu in self.vdus:
-            if vdu.id == vdu_id:
-                for metric in metrics:
-                    if Telemetries.count(metric) == 0:
-                        raise RuntimeError(f"The metric {metric} is not available.")
-                    else:
-                        vdu.add_telementry(id=f"{vdu.id}_{metric}", metric=metric)
-                return True
+        for metric in metrics:
+            if Telemetries.count(metric) == 0:
+                raise RuntimeError(f"The metric {metric} is not available.")
             else:
-                continue
-
-        return False
+                vdu.add_telementry(id=f"{vdu.id}_{metric}", metric=metric)
+                self._telemetry_index[f"{vdu.id}_{metric}"] = vdu
+        return True
 
     def remove_vdu_telemetry(self, vdu_id: str, metrics: List[str]):
         """Remove vdu telemetry.
@@ -1846,21 +2192,16 @@ class VNF(OsmEntity):
             vdu_id (str): id of the vdu.
             metrics (List[str]): list of the telemetries.
         """
-        vdu_list = self.vdus_id
-        if vdu_list.count(vdu_id) == 0:
+        vdu = self.get_VDU(vdu_id)
+        if vdu is None:
             raise RuntimeError(f"The {vdu_id} does not belong to this VNF.")
 
-        for vdu in self.vdus:
-            if vdu.id == vdu_id:
-                for metric in metrics:
-                    for telemetry in vdu._telementries:
-                        if telemetry.id == f"{vdu.id}_{metric}":
-                            vdu._telementries.remove(telemetry)
-                return True
-            else:
-                continue
-
-        return False
+        for metric in metrics:
+            telemetry_id = f"{vdu.id}_{metric}"
+            if vdu.remove_telemetry_by_id(telemetry_id):
+                if self._telemetry_index.get(telemetry_id) is vdu:
+                    del self._telemetry_index[telemetry_id]
+        return True
 
     def addScalingAspect(
         self,
@@ -1881,11 +2222,7 @@ class VNF(OsmEntity):
                     f"The scaling apsect {id} already exists in VNF {self.id}."
                 )
 
-        telemetris_list = list()
-        for vdu in self.vdus:
-            for telemetry in vdu.telemetries:
-                telemetris_list.append(telemetry.id)
-        if telemetris_list.count(selected_telemetry) == 0:
+        if selected_telemetry not in self._telemetry_index:
             raise RuntimeError(f"The telemetry {selected_telemetry} can not be found.")
 
         new_aspectDelta = Deltas()
@@ -1920,49 +2257,59 @@ class VNF(OsmEntity):
         for scaling_aspect in self.df[0]._scaling_aspect:
             if scaling_aspect.id == scaling_aspect_id:
                 self.df[0]._scaling_aspect.remove(scaling_aspect)
+                self.df[0]._invalidate()
                 return True
 
         raise RuntimeError(f"The scaling aspect {scaling_aspect_id} can not be found.")
 
+    @cached_repr
     def yaml_repr(self) -> dict:
         """return a dictionary for yaml dumping.
 
+        Every entity keeps its part of the dictionary until it is changed
+        through the VNF and VDU methods, so after a change only the changed
+        entities and the entities containing them are built again. The
+        dictionary is shared with these caches and must not be modified.
+
         Returns:
             dict: for yaml dumping.
         """
-        vdu_dict = self.__dict__
-        yaml_repr = {"vnfd": deepcopy(vdu_dict)}
-        for key, value in vdu_dict.items():
-            if key.count("_") != 0:
-                yaml_repr["vnfd"].pop(key)
+        return self.yaml_layout()
 
-        yaml_repr["vnfd"]["id"] = self.id
-        yaml_repr["vnfd"]["mgmt-cp"] = self.mgmt_cp
-        yaml_repr["vnfd"]["product-name"] = self.product_name
-        yaml_repr["vnfd"]["version"] = self.version
+    def yaml_layout(self, sequence: Callable[[Callable[[Any], Any], List], Iterable] = None) -> dict:
+        """Build the dictionary for yaml dumping with the entity lists made by a given function.
 
-        yaml_repr["vnfd"]["df"] = list()
-        for df in self.df:
-            yaml_repr["vnfd"]["df"].append(df.yaml_repr())
+        This is the only layout of a VNF, yaml_repr builds its lists eagerly
+        from the cached entities and the descriptor writer lazily.
 
-        yaml_repr["vnfd"]["ext-cpd"] = list()
-        for ext_cp in self.ext_cps:
-            yaml_repr["vnfd"]["ext-cpd"].append(ext_cp.yaml_repr())
+        Args:
+            sequence (Callable[[Callable[[Any], Any], List], Iterable], optional): makes the list of an entity list from the representation of one entity, the df is then laid out with it too. Defaults to repr_list over the cached entities.
 
-        yaml_repr["vnfd"]["sw-image-desc"] = list()
-        for image in self.images:
-            yaml_repr["vnfd"]["sw-image-desc"].append(image.yaml_repr())
+        Returns:
+            dict: for yaml dumping.
+        """
+        if sequence is None:
+            sequence = repr_list
+            df_repr = self._child_repr
+        else:
+            df_repr = lambda df: df.yaml_layout(sequence)
 
-        yaml_repr["vnfd"]["vdu"] = list()
-        for vdu in self.vdus:
-            yaml_repr["vnfd"]["vdu"].append(vdu.yaml_repr())
+        yaml_repr = {"vnfd": yaml_extras(self)}
 
-        yaml_repr["vnfd"]["virtual-compute-desc"] = list()
-        for vcd in self.virtual_compute_descriptions:
-            yaml_repr["vnfd"]["virtual-compute-desc"].append(vcd.yaml_repr())
+        yaml_repr["vnfd"]["id"] = self.id
+        yaml_repr["vnfd"]["mgmt-cp"] = self.mgmt_cp
+        yaml_repr["vnfd"]["product-name"] = self.product_name
+        yaml_repr["vnfd"]["version"] = self.version
 
-        yaml_repr["vnfd"]["virtual-storage-desc"] = list()
-        for vsd in self.virtual_storage_descriptions:
-            yaml_repr["vnfd"]["virtual-storage-desc"].append(vsd.yaml_repr())
+        yaml_repr["vnfd"]["df"] = sequence(df_repr, self.df)
+        yaml_repr["vnfd"]["ext-cpd"] = sequence(self._child_repr, self.ext_cps)
+        yaml_repr["vnfd"]["sw-image-desc"] = sequence(self._child_repr, self.images)
+        yaml_repr["vnfd"]["vdu"] = sequence(self._child_repr, self.vdus)
+        yaml_repr["vnfd"]["virtual-compute-desc"] = sequence(
+            self._child_repr, self.virtual_compute_descriptions
+        )
+        yaml_repr["vnfd"]["virtual-storage-desc"] = sequence(
+            self._child_repr, self.virtual_storage_descriptions
+        )
 
         return yaml_repr
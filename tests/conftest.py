@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# the modules of the package are imported by their own names, as App.py does.
+sys.path.insert(0, str(ROOT / "src" / "py-osmgs"))
+
+# sample descriptors shipped with the repository
+SAMPLE_DESCRIPTORS = sorted(ROOT.glob("hackfest_*vnfd.yaml"))
@@ -4,18 +4,12 @@ sys.path.insert(0, "src\py-osmgs")
 
 from ipaddress import IPv4Address
 from bitmath import GiB
-from nested_lookup import nested_lookup
-import yaml
+from Descriptor import read_vnfd, write_vnfd
 from VDU import DISK_RBYTES
-from VNF import VNF
 
 # example - load a decriptor file
-new_vnf = VNF()
-with open("hackfest_multivdu_vnfd.yaml", "r") as description_file:
-    vnf_description = yaml.load(description_file, yaml.Loader)
-    description = nested_lookup(key="vnfd", document=vnf_description)[0]
-    new_vnf.load(description)
-    new_vnf.visualization()
+new_vnf = read_vnfd("hackfest_multivdu_vnfd.yaml")
+new_vnf.visualization()
 
 #new_vnf.addImage(id="ubuntu20.04", image_filepath="./ISO/ubuntu20.04")
 
@@ -82,8 +76,7 @@ new_vnf.addScalingAspect(
 )
 
 # save the new descriptor and generate a html visualization.
-with open(f"{new_vnf.id}_vnfd.yaml", "w") as yaml_file:
-    yaml.dump(data=new_vnf.yaml_repr(),stream=yaml_file)
+write_vnfd(new_vnf, f"{new_vnf.id}_vnfd.yaml")
 new_vnf.visualization()
 
 
@@ -0,0 +1,122 @@
+from ipaddress import ip_address
+
+import pytest
+
+from Addressing import AddressPool
+from Generator import SyntheticSpec, generate_vnf
+from VNF import VNF
+
+
+def _ranges(pool):
+    return list(zip(pool._starts, pool._ends))
+
+
+def test_allocate_lowest_and_specific():
+    pool = AddressPool("10.0.0.0/29", reserved=["10.0.0.1"])
+    assert pool.available == 5
+    assert pool.allocate() == ip_address("10.0.0.2")
+    assert pool.allocate("10.0.0.5") == ip_address("10.0.0.5")
+    assert pool.allocate() == ip_address("10.0.0.3")
+    assert pool.is_allocated("10.0.0.5")
+    assert not pool.is_allocated("10.0.0.4")
+    with pytest.raises(RuntimeError):
+        pool.allocate("10.0.0.5")
+    with pytest.raises(RuntimeError):
+        pool.allocate("10.0.1.1")
+
+
+@pytest.mark.parametrize(
+    "allocated, released, ranges",
+    [
+        # the range below is extended
+        (["10.0.0.3", "10.0.0.4"], "10.0.0.3", [(2, 3), (5, 254)]),
+        # the range above is extended
+        (["10.0.0.2", "10.0.0.3"], "10.0.0.3", [(3, 254)]),
+        # both ranges are merged
+        (["10.0.0.5"], "10.0.0.5", [(2, 254)]),
+        # a new range is inserted
+        (["10.0.0.4", "10.0.0.5", "10.0.0.6"], "10.0.0.5", [(2, 3), (5, 5), (7, 254)]),
+    ],
+)
+def test_release_merges_ranges(allocated, released, ranges):
+    pool = AddressPool("10.0.0.0/24", reserved=["10.0.0.1"])
+    for address in allocated:
+        pool.allocate(address)
+    available = pool.available
+    pool.release(released)
+    base = int(ip_address("10.0.0.0"))
+    assert [(start - base, end - base) for start, end in _ranges(pool)] == ranges
+    assert pool.available == available + 1
+    assert pool.allocate(released) == ip_address(released)
+
+
+def test_release_restores_single_range():
+    pool = AddressPool("10.0.0.0/26")
+    addresses = pool.allocate_many(pool.available)
+    for address in addresses[1::2] + addresses[::2]:
+        pool.release(address)
+    assert _ranges(pool) == [(int(addresses[0]), int(addresses[-1]))]
+
+
+def test_release_errors():
+    pool = AddressPool("10.0.0.0/29", reserved=["10.0.0.1"])
+    with pytest.raises(RuntimeError):
+        pool.release("10.0.0.2")
+    with pytest.raises(RuntimeError):
+        pool.release("10.0.0.1")
+
+
+def test_exhaustion():
+    pool = AddressPool("10.0.0.0/30")
+    assert pool.allocate_many(2) == [ip_address("10.0.0.1"), ip_address("10.0.0.2")]
+    with pytest.raises(RuntimeError):
+        pool.allocate()
+    pool.release("10.0.0.2")
+    assert pool.allocate() == ip_address("10.0.0.2")
+
+
+def test_allocate_many_is_atomic():
+    pool = AddressPool("10.0.0.0/29")
+    pool.allocate("10.0.0.3")
+    with pytest.raises(RuntimeError):
+        pool.allocate_many(pool.available + 1)
+    assert pool.available == 5
+    assert pool.allocate_many(5) == [ip_address(f"10.0.0.{i}") for i in (1, 2, 4, 5, 6)]
+
+
+def _description_with_IPs(ips):
+    vnf = generate_vnf(SyntheticSpec(num_vdus=2, num_links=1, num_scaling_aspects=0), seed=1)
+    description = vnf.yaml_repr()["vnfd"]
+    interfaces = [
+        cpd for vdu in description["vdu"] for cpd in vdu["int-cpd"] if "int-virtual-link-desc" in cpd
+    ]
+    for cpd, ip in zip(interfaces, ips):
+        cpd["virtual-network-interface-requirement"][0]["ip-address"] = ip
+    return description
+
+
+@pytest.mark.parametrize("conflict", ["10.0.0.10", "192.168.0.10"])
+def test_load_tolerates_conflicting_IP(conflict):
+    description = _description_with_IPs(["10.0.0.10", conflict])
+    vnf = VNF()
+    with pytest.warns(RuntimeWarning, match="vdu-0_int_2"):
+        vnf.load(description)
+    pool = vnf.get_virtual_link_profile("vl-0").address_pool
+    assert pool.is_allocated("10.0.0.10")
+    assert vnf.get_VDU("vdu-0").get_interface("vdu-0_int_2").ip_address == ip_address(conflict)
+
+    # the skipped IP is not given back to the pool, the first interface keeps it.
+    vnf.unassign_IP_vdu_interface("vdu-0", "vdu-0_int_2")
+    assert pool.is_allocated("10.0.0.10")
+    vnf.unassign_IP_vdu_interface("vdu-0", "vdu-0_int_1")
+    assert not pool.is_allocated("10.0.0.10")
+
+
+def test_load_reserves_interface_IPs():
+    description = _description_with_IPs(["10.0.0.10", "10.0.0.11"])
+    vnf = VNF()
+    vnf.load(description)
+    pool = vnf.get_virtual_link_profile("vl-0").address_pool
+    assert pool.is_allocated("10.0.0.10") and pool.is_allocated("10.0.0.11")
+    vnf.remove_VDU("vdu-0")
+    assert not pool.is_allocated("10.0.0.10") and not pool.is_allocated("10.0.0.11")
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from conftest import ROOT
+from Autoscaling import SCALE_OUT, replay_autoscaling, sweep_scaling_thresholds
+from Descriptor import read_vnfd
+
+VDU_ID = "Storage-node"
+TELEMETRY = "Storage-node_disk_read_bytes"
+
+
+def _replay(trace, scale_in, scale_out, threshold_time, cooldown_time, max_scale_level, scale, interval):
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    for aspect in list(vnf.df[0].scaling_aspects):
+        vnf.remove_scaling_aspect(aspect.id)
+    vnf.addScalingAspect(
+        id="sweep",
+        max_scale_level=max_scale_level,
+        vdu_to_scale=VDU_ID,
+        selected_telemetry=TELEMETRY,
+        scale_in_threshold=scale_in,
+        scale_out_threshold=scale_out,
+        cooldown_time=cooldown_time,
+        threshold_time=threshold_time,
+        scale=scale,
+    )
+    return replay_autoscaling(vnf, {TELEMETRY: trace}, interval=interval)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_sweep_matches_replay(seed):
+    rng = np.random.default_rng(seed)
+    traces = np.clip(np.cumsum(rng.normal(0, 6, (3, 400)), axis=1) + 50, 0, 100)
+    thresholds = np.arange(10, 95, 5)
+    scale_ins = sorted(rng.choice(thresholds[:8], 2, replace=False).tolist())
+    scale_outs = sorted(rng.choice(thresholds[8:], 2, replace=False).tolist())
+    threshold_times = sorted(rng.choice(np.arange(0, 12, 2), 2, replace=False).tolist())
+    cooldown_times = sorted(rng.choice(np.arange(0, 40, 4), 2, replace=False).tolist())
+    max_scale_level = int(rng.integers(1, 5))
+    scale = int(rng.integers(1, 3))
+    interval = float(rng.choice([1.0, 2.0]))
+
+    sweep = sweep_scaling_thresholds(
+        traces,
+        scale_ins,
+        scale_outs,
+        threshold_times,
+        cooldown_times,
+        interval=interval,
+        max_scale_level=max_scale_level,
+        scale=scale,
+    )
+    assert len(sweep) == 16
+    for combination in range(len(sweep)):
+        parameters = (
+            int(sweep.scale_in_threshold[combination]),
+            int(sweep.scale_out_threshold[combination]),
+            int(sweep.threshold_time[combination]),
+            int(sweep.cooldown_time[combination]),
+        )
+        for index, trace in enumerate(traces):
+            timeline = _replay(trace, *parameters, max_scale_level, scale, interval)
+            instances = timeline.instances(VDU_ID)
+            scale_outs = sum(1 for event in timeline.events if event.direction == SCALE_OUT)
+            assert sweep.scale_outs[index, combination] == scale_outs, parameters
+            assert sweep.scale_ins[index, combination] == len(timeline.events) - scale_outs, parameters
+            assert sweep.peak_instances[index, combination] == instances.max()
+            assert sweep.instance_hours[index, combination] == pytest.approx(instances.sum() * interval / 3600)
+            assert sweep.time_over_threshold[index, combination] == (trace > parameters[1]).sum() * interval
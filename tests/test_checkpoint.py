@@ -0,0 +1,105 @@
+import pytest
+
+from conftest import ROOT
+from Descriptor import read_vnfd
+from Simulation import GAMMA, Chain, RequestProfile, ScalingModel, Simulation, Workload
+
+END = 500.0
+
+
+def _vnf():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    # scale the storage node on its CPU, often enough to have instances booting at the checkpoints.
+    storage_node = vnf.get_VDU("Storage-node")
+    storage_node.get_telemetry("Storage-node_disk_read_bytes")._performance_metric = "cpu_utilization"
+    aspect = vnf.df[0].scaling_aspects[0]
+    aspect._max_scale_level = 3
+    policy = aspect.scaling_policy[0]
+    policy._cooldown_time = 60
+    criteria = policy.scaling_criteria[0]
+    criteria._scale_out_threshold = 80
+    criteria._scale_in_threshold = 30
+    return vnf
+
+
+def _workload():
+    workload = Workload(RequestProfile(0.5, 0.4, cpu=1, memory=0.5, network=2e5))
+    workload.add(
+        "Storage-node",
+        RequestProfile(arrival_rate=7.2, service_time=1.0, cpu=1, storage=1, distribution=GAMMA, cv=1.5),
+    )
+    workload.add_chain(Chain("c", 40, ["mgmtVM", "dataVM"], ext_cp="vnf-mgmt-ext"))
+    return workload
+
+
+def _simulation(seed=5):
+    return Simulation(_vnf(), _workload(), seed=seed, scaling=ScalingModel(default_boot_time=30, host_cpu=22))
+
+
+def _key(report):
+    key = [report.until]
+    for vdu_id, vdu in report.vdus.items():
+        key.append(
+            (
+                vdu_id,
+                vdu.cpu_utilization,
+                vdu.memory_utilization,
+                vdu.network_utilization,
+                vdu.arrived,
+                vdu.completed,
+                vdu.mean_response_time,
+                tuple(vdu.latency),
+                tuple(vdu.queue_length),
+                vdu.scale_outs,
+                vdu.scale_ins,
+                vdu.mean_instances,
+            )
+        )
+    for chain_id, chain in report.chains.items():
+        key.append((chain_id, chain.arrived, chain.completed, tuple(chain.latency)))
+    key.append([(event.time, event.direction, event.scale_level) for event in report.scaling_events])
+    return key
+
+
+@pytest.fixture(scope="module")
+def uninterrupted():
+    return _key(_simulation().run(END))
+
+
+@pytest.mark.parametrize("checkpoint_time", [13.37, 250.3])
+def test_restore_runs_on_as_uninterrupted(tmp_path, uninterrupted, checkpoint_time):
+    simulation = _simulation()
+    simulation.run(checkpoint_time)
+    path = tmp_path / "simulation.ckpt"
+    simulation.checkpoint(str(path))
+    assert _key(simulation.run(END)) == uninterrupted
+    assert _key(Simulation.restore(str(path)).run(END)) == uninterrupted
+
+
+def test_chained_checkpoints(tmp_path, uninterrupted):
+    simulation = _simulation()
+    path = str(tmp_path / "simulation.ckpt")
+    for step in range(1, 8):
+        simulation.run(END * step / 8)
+        simulation.checkpoint(path)
+        simulation = Simulation.restore(path)
+    assert _key(simulation.run(END)) == uninterrupted
+
+
+def test_what_if_fork(tmp_path, uninterrupted):
+    simulation = _simulation()
+    at_checkpoint = simulation.run(250.3)
+    path = str(tmp_path / "simulation.ckpt")
+    simulation.checkpoint(path)
+
+    forked = _key(Simulation.restore(path, seed=9).run(END))
+    assert forked == _key(Simulation.restore(path, seed=9).run(END))
+    assert forked != uninterrupted
+
+    heavier = Workload(RequestProfile(0.5, 0.4, cpu=1, memory=0.5, network=2e5))
+    heavier.add("Storage-node", RequestProfile(arrival_rate=12.0, service_time=1.0, cpu=1, storage=1))
+    report = Simulation.restore(path, workload=heavier).run(END)
+    # the chain keeps its counters but gets no new arrivals, the storage node gets the heavier load.
+    assert report.chains["c"].arrived == at_checkpoint.chains["c"].arrived
+    storage_arrivals = report.vdus["Storage-node"].arrived - at_checkpoint.vdus["Storage-node"].arrived
+    assert storage_arrivals > 12.0 * (END - 250.3) * 0.9
@@ -0,0 +1,174 @@
+import io
+
+import pytest
+from bitmath import GiB
+
+from conftest import ROOT, SAMPLE_DESCRIPTORS
+from Descriptor import (
+    find_descriptor_root,
+    find_nsd_root,
+    find_vnfd_root,
+    read_vnfd,
+    read_vnfd_description,
+    stream_vnfd,
+    write_vnfd,
+    yaml_dump,
+    yaml_load,
+)
+from Generator import SyntheticSpec, generate_vnf
+
+
+@pytest.mark.parametrize("path", SAMPLE_DESCRIPTORS, ids=lambda path: path.name)
+def test_stream_matches_yaml_repr(path):
+    vnf = read_vnfd(path)
+    stream = io.StringIO()
+    stream_vnfd(vnf, stream)
+    assert stream.getvalue() == yaml_dump(vnf.yaml_repr())
+
+
+def test_stream_matches_yaml_repr_after_mutations():
+    vnf = generate_vnf(SyntheticSpec(num_vdus=20, num_scaling_aspects=2), seed=1)
+    vnf.add_ExternalConnectionPoint(id="ext", vdu_id="vdu-1", vdu_cp="vdu-1_int_0")
+    vnf.remove_VDU("vdu-2")
+    stream = io.StringIO()
+    stream_vnfd(vnf, stream)
+    assert stream.getvalue() == yaml_dump(vnf.yaml_repr())
+
+
+def test_write_then_read_round_trip(tmp_path):
+    vnf = read_vnfd(SAMPLE_DESCRIPTORS[0])
+    path = tmp_path / "vnfd.yaml"
+    write_vnfd(vnf, path)
+    assert yaml_load(path.read_text()) == yaml_load(yaml_dump(vnf.yaml_repr()))
+
+
+def test_scaling_policy_operation_types():
+    from VNF import ScalingPolicy
+
+    description = {
+        "name": "policy",
+        "scaling-type": "automatic",
+        "scale-out-operation-type": "AND",
+        "scaling-criteria": [{"name": "cpu", "vnf-monitoring-param-ref": "cpu"}],
+    }
+    policy = ScalingPolicy()
+    policy.load(description)
+    assert policy.scale_out_operation_type == "AND"
+    assert policy.scale_in_operation_type is None
+    assert policy.yaml_repr()["scale-out-operation-type"] == "AND"
+    assert "scale-in-operation-type" not in policy.yaml_repr()
+
+    configured = ScalingPolicy()
+    configured.configure("policy", 60, 10, [(20, 80, "cpu")], scale_in_operation_type="AND")
+    assert configured.scale_in_operation_type == "AND"
+    assert configured.yaml_repr()["scale-in-operation-type"] == "AND"
+
+
+def test_size_accessors():
+    from VDU import VirtualComputeDesc, VirtualStorageDesc
+
+    vcd = VirtualComputeDesc()
+    vcd.load({"id": "compute", "virtual-cpu": {"num-virtual-cpu": 2}})
+    assert vcd.memory_gib == 0.0
+    assert vcd.size_virtual_memory is None
+    vcd = VirtualComputeDesc()
+    vcd.configure("compute", 2, 4)
+    assert vcd.memory_gib == 4.0 and isinstance(vcd.memory_gib, float)
+    assert vcd.size_virtual_memory == GiB(4)
+
+    vsd = VirtualStorageDesc()
+    vsd.load({"id": "storage"})
+    assert vsd.storage_gib == 0.0
+    assert vsd.size_virtual_storage is None
+    vsd = VirtualStorageDesc()
+    vsd.configure("storage", 10)
+    assert vsd.storage_gib == 10.0 and isinstance(vsd.storage_gib, float)
+    assert vsd.size_virtual_storage == GiB(10)
+
+
+def test_profile_for_an_existing_internal_connection_point(tmp_path):
+    # the example script loads a descriptor whose internal link has no profile yet, then adds one.
+    vnf = read_vnfd(ROOT / "hackfest_multivdu_vnfd.yaml")
+    assert vnf.int_cps_id == ["internal"] and len(vnf.df[0].virtual_link_profile) == 0
+    vnf.add_InternalConnectionPoint(id="internal", ip="192.168.0.1", network="192.168.0.0/24")
+    assert vnf.int_cps_id == ["internal"]
+    profiles = vnf.df[0].virtual_link_profile
+    assert [profile.id for profile in profiles] == ["internal"]
+    assert str(profiles[0].cidr) == "192.168.0.0/24"
+
+    vnf.add_VDU(
+        id="Compute-node",
+        num_vcpu=4,
+        size_memory=16,
+        size_storage=[64],
+        image=["ubuntu20.04"],
+        int_cps=["internal"],
+    )
+    path = tmp_path / "vnfd.yaml"
+    write_vnfd(vnf, path)
+    copy = read_vnfd(path)
+    assert [profile.id for profile in copy.df[0].virtual_link_profile] == ["internal"]
+    assert "Compute-node" in copy.vdus_id
+
+    # a second profile for the same point is still refused.
+    for loaded in (vnf, read_vnfd(ROOT / "hackfest_multivdu-vnf_vnfd.yaml")):
+        with pytest.raises(RuntimeError, match="already exists"):
+            loaded.add_InternalConnectionPoint(id="internal", ip="192.168.1.1", network="192.168.1.0/24")
+
+
+VNFD = {"id": "vnf", "vdu": []}
+NSD = {"id": "ns", "vnfd-id": ["vnf"]}
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"vnfd": VNFD},
+        {"etsi-nfv-vnfd:vnfd": VNFD},
+        {"vnfd": [VNFD, {"id": "other"}]},
+        {"vnfd-catalog": {"vnfd": [VNFD]}},
+        {"vnfd:vnfd-catalog": {"vnfd:vnfd": [VNFD]}},
+        {"vnfd": {"vnfd": [VNFD]}},
+        {"metadata": {"version": 1}, "wrapper": {"etsi-nfv-vnfd:vnfd": VNFD}},
+    ],
+)
+def test_find_vnfd_root(document):
+    assert find_vnfd_root(document) == VNFD
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"nsd": {"nsd": [NSD]}},
+        {"nsd:nsd-catalog": {"nsd": [NSD]}},
+        {"etsi-nfv-nsd:nsd": NSD},
+    ],
+)
+def test_find_nsd_root(document):
+    assert find_nsd_root(document) == NSD
+    with pytest.raises(RuntimeError, match="No vnfd descriptor can be found."):
+        find_vnfd_root(document)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        None,
+        [{"vnfd": VNFD}],
+        {"vnfd": []},
+        {"vnfd": "vnf"},
+        {"vnfd-id": VNFD},
+        # deeper than the search goes.
+        {"a": {"b": {"c": {"vnfd": VNFD}}}},
+    ],
+)
+def test_descriptor_root_not_found(document):
+    with pytest.raises(RuntimeError, match="No vnfd descriptor can be found."):
+        find_descriptor_root(document, "vnfd")
+
+
+def test_read_without_descriptor(tmp_path):
+    path = tmp_path / "nsd.yaml"
+    path.write_text(yaml_dump({"nsd": {"nsd": [NSD]}}))
+    with pytest.raises(RuntimeError, match="No VNF descriptor found in"):
+        read_vnfd_description(path)
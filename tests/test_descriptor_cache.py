@@ -0,0 +1,120 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+from conftest import SAMPLE_DESCRIPTORS
+from Catalog import load_catalog
+from Descriptor import read_vnfd, yaml_dump
+from DescriptorCache import CACHE_MAGIC, MODEL_MODULES, DescriptorCache
+
+
+def _dump(vnf):
+    return yaml_dump(vnf.yaml_repr())
+
+
+def _entry(cache, path):
+    return cache._entry_path(cache.key(path.read_bytes()))
+
+
+def test_key_depends_on_content_only(tmp_path):
+    sample = SAMPLE_DESCRIPTORS[0]
+    copy = tmp_path / "copy.yaml"
+    shutil.copy(sample, copy)
+    first = DescriptorCache(tmp_path / "a")
+    second = DescriptorCache(tmp_path / "b")
+    assert first.key(sample.read_bytes()) == second.key(copy.read_bytes())
+    assert len(first.key(b"")) == 64
+    assert first.key(sample.read_bytes()) != first.key(sample.read_bytes() + b"\n")
+
+    first.load(sample)
+    assert _dump(first.load(copy)) == _dump(read_vnfd(str(sample)))
+    assert (first.hits, first.misses) == (1, 1)
+
+
+def test_loads_are_independent(tmp_path):
+    cache = DescriptorCache(tmp_path)
+    sample = SAMPLE_DESCRIPTORS[0]
+    vnf = cache.load(sample)
+    vnf.remove_VDU(vnf.vdus[0].id)
+    assert _dump(cache.load(sample)) == _dump(read_vnfd(str(sample)))
+
+
+@pytest.mark.parametrize("content", [b"", CACHE_MAGIC + b"\x80\x05truncated", b"not a cache entry"])
+def test_corrupt_entry_is_loaded_again(tmp_path, content):
+    cache = DescriptorCache(tmp_path)
+    sample = SAMPLE_DESCRIPTORS[0]
+    cache.load(sample)
+    _entry(cache, sample).write_bytes(content)
+
+    assert _dump(cache.load(sample)) == _dump(read_vnfd(str(sample)))
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert _entry(cache, sample).read_bytes().startswith(CACHE_MAGIC)
+    cache.load(sample)
+    assert cache.hits == 1
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = DescriptorCache(tmp_path)
+    for sample in SAMPLE_DESCRIPTORS:
+        cache.load(sample)
+    entries = [_entry(cache, sample) for sample in SAMPLE_DESCRIPTORS]
+    sizes = [entry.stat().st_size for entry in entries]
+    # the second sample was used last, the first one least recently.
+    for entry, last_use in zip(entries, (1000, 3000, 2000)):
+        os.utime(entry, (last_use, last_use))
+
+    cache.evict(sizes[1] + sizes[2])
+    assert [entry.exists() for entry in entries] == [False, True, True]
+    cache.evict(sizes[1])
+    assert [entry.exists() for entry in entries] == [False, True, False]
+    assert cache.evictions == 2
+    # a hit marks the entry as used.
+    cache.load(SAMPLE_DESCRIPTORS[1])
+    assert cache.hits == 1
+
+
+def test_store_keeps_the_size_bound(tmp_path):
+    sizes = list()
+    for sample in SAMPLE_DESCRIPTORS:
+        probe = DescriptorCache(tmp_path / "probe")
+        probe.load(sample)
+        sizes.append(_entry(probe, sample).stat().st_size)
+
+    cache = DescriptorCache(tmp_path / "bounded", max_bytes=sum(sizes) - 1)
+    for sample in SAMPLE_DESCRIPTORS * 2:
+        cache.load(sample)
+        assert cache.size <= cache.max_bytes
+    assert cache.evictions > 0
+
+
+def test_parallel_catalog_counts(tmp_path):
+    cache = DescriptorCache(tmp_path)
+    results = list(load_catalog(SAMPLE_DESCRIPTORS, workers=2, cache=cache))
+    assert all(result.error is None for result in results)
+    assert cache.counts == (0, len(SAMPLE_DESCRIPTORS), 0)
+
+    list(load_catalog(SAMPLE_DESCRIPTORS, workers=2, cache=cache))
+    assert cache.counts == (len(SAMPLE_DESCRIPTORS), len(SAMPLE_DESCRIPTORS), 0)
+
+    list(load_catalog(SAMPLE_DESCRIPTORS, workers=1, cache=cache))
+    assert cache.hits == 2 * len(SAMPLE_DESCRIPTORS)
+
+
+def test_read_vnfd_through_the_cache(tmp_path):
+    cache = DescriptorCache(tmp_path)
+    sample = SAMPLE_DESCRIPTORS[0]
+    first = read_vnfd(sample, cache=cache)
+    second = read_vnfd(str(sample), cache=cache)
+    assert first is not second
+    assert _dump(second) == _dump(read_vnfd(str(sample)))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    with pytest.raises(RuntimeError, match="new VNF"):
+        read_vnfd(sample, first, cache)
+
+
+def test_fingerprint_covers_the_parser():
+    assert "Descriptor" in MODEL_MODULES
+    assert all(sys.modules[name].__file__ for name in MODEL_MODULES)
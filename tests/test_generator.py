@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from Catalog import CatalogReport, load_catalog
+from Descriptor import read_vnfd, write_vnfd
+from Generator import SyntheticSpec, generate_catalog
+
+SPEC = SyntheticSpec(num_vdus=6, num_links=2, num_interfaces=2, num_scaling_aspects=2)
+
+
+def _tree(directory):
+    return {
+        str(path.relative_to(directory)): path.read_bytes()
+        for path in sorted(directory.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_catalog_does_not_depend_on_the_workers(tmp_path):
+    trees = dict()
+    for workers in (1, 2):
+        directory = tmp_path / f"workers-{workers}"
+        paths = list(generate_catalog(SPEC, 8, directory, seed=3, workers=workers))
+        assert sorted(paths) == sorted(str(path) for path in directory.glob("*/*_vnfd.yaml"))
+        trees[workers] = _tree(directory)
+    assert len(trees[1]) == 8
+    assert trees[1] == trees[2]
+
+    # another seed writes other descriptors under the same names.
+    list(generate_catalog(SPEC, 8, tmp_path / "other", seed=4))
+    other = _tree(tmp_path / "other")
+    assert other.keys() == trees[1].keys() and other != trees[1]
+
+
+def test_catalog_round_trips(tmp_path):
+    paths = list(generate_catalog(SPEC, 4, tmp_path / "catalog", prefix="vnf"))
+    for path in paths:
+        vnf = read_vnfd(path)
+        assert vnf.id == Path(path).parent.name and len(vnf.vdus) == SPEC.num_vdus
+        copy = tmp_path / "copy.yaml"
+        write_vnfd(vnf, copy)
+        assert copy.read_bytes() == Path(path).read_bytes()
+
+
+def test_catalog_feeds_load_catalog(tmp_path):
+    report = CatalogReport()
+    results = list(load_catalog(generate_catalog(SPEC, 6, tmp_path, workers=2), workers=2, report=report))
+    assert len(results) == 6 and all(result.ok for result in results)
+    assert sorted(result.vnf.id for result in results) == [f"synthetic-{index:06d}" for index in range(6)]
+    assert report.loaded == 6 and report.failed == 0
+
+    with pytest.raises(RuntimeError):
+        list(generate_catalog(SPEC, 1, tmp_path, workers=0))
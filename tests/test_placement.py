@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from conftest import ROOT, SAMPLE_DESCRIPTORS
+from Autoscaling import replay_autoscaling
+from Descriptor import read_vnfd
+from Placement import (
+    BEST_FIT,
+    FIRST_FIT_DECREASING,
+    SPREAD,
+    Host,
+    Placement,
+    VduInstance,
+    hosts_needed,
+    place_vnfs,
+    replay_placement,
+    vnf_instances,
+)
+
+
+def _instance(index, cpu=1, memory=1.0, storage=1.0):
+    return VduInstance("vnf", "vdu", index, cpu, memory, storage)
+
+
+def test_exact_fit_is_accepted():
+    placement = Placement([Host("host", 4, 1.0, 10)])
+    for index, memory in enumerate((0.3, 0.6, 0.1)):
+        assert placement.place(_instance(index, memory=memory)) == "host"
+    assert placement.report().utilization[0, 1] == pytest.approx(1.0)
+    assert placement.place(_instance(3, memory=1e-3)) is None
+
+
+def test_remove_gives_the_exact_capacity_back():
+    placement = Placement([Host("host", 4, 1.0, 10)])
+    for _ in range(100):
+        for index, memory in enumerate((0.3, 0.6, 0.1)):
+            placement.place(_instance(index, memory=memory))
+        for index in (1, 0, 2):
+            placement.remove(("vnf", "vdu", index))
+    report = placement.report()
+    assert report.active_hosts == 0
+    assert not report.used.any()
+
+
+@pytest.mark.parametrize(
+    "strategy, hosts",
+    [
+        (FIRST_FIT_DECREASING, ["a", "a", "a"]),
+        (BEST_FIT, ["b", "b", "b"]),
+        (SPREAD, ["a", "b", "a"]),
+    ],
+)
+def test_strategies(strategy, hosts):
+    placement = Placement([Host("a", 8, 8, 8), Host("b", 7, 7, 7)], strategy)
+    assert [placement.place(_instance(index, 2, 2, 2)) for index in range(3)] == hosts
+
+
+def test_first_fit_decreasing_places_the_largest_first():
+    placement = Placement([Host("a", 4, 4, 4), Host("b", 4, 4, 4)])
+    small = [_instance(index, 1, 1, 1) for index in range(4)]
+    large = _instance(9, 4, 4, 4)
+    assert placement.place_many(small + [large]) == ["b", "b", "b", "b", "a"]
+    assert placement.rejected == []
+
+
+def test_place_vnfs_and_hosts_needed():
+    vnfs = [read_vnfd(str(path)) for path in SAMPLE_DESCRIPTORS] * 2
+    instances = sum(len(vnf_instances(vnf)) for vnf in vnfs)
+    report = place_vnfs(vnfs, [Host(f"host-{index}", 32, 128, 1000) for index in range(10)])
+    assert len(report.assignments) == instances and report.rejected == []
+    assert (report.used <= report.capacity).all()
+
+    count, report = hosts_needed(vnfs, 32, 128, 1000)
+    assert report.rejected == [] and len(report.assignments) == instances
+    fewer = place_vnfs(vnfs, [Host(f"host-{index}", 32, 128, 1000) for index in range(count - 1)])
+    assert len(fewer.rejected) > 0
+
+    with pytest.raises(RuntimeError):
+        hosts_needed(vnfs, 2, 128, 1000)
+
+
+def test_replay_placement_follows_autoscaling():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    for aspect in list(vnf.df[0].scaling_aspects):
+        vnf.remove_scaling_aspect(aspect.id)
+    vnf.addScalingAspect("aspect", 3, "Storage-node", "Storage-node_disk_read_bytes", 20, 80, 0, 0, 1)
+    trace = np.concatenate([np.full(5, 50), np.full(5, 90), np.full(5, 10)])
+    timeline = replay_autoscaling(vnf, {"Storage-node_disk_read_bytes": trace})
+    # one host holds the initial instances, every scale out needs a new host.
+    hosts = [Host("base", 16, 64, 500)] + [Host(f"extra-{index}", 4, 16, 64) for index in range(2)]
+    placement = replay_placement(vnf, timeline, hosts)
+
+    instances = timeline.instances("Storage-node")
+    assert instances.max() == 4
+    assert list(placement.times) == [0.0] + [event.time for event in timeline.events]
+    assert placement.active_hosts.max() == 3
+    # the third scale out fits nowhere, the scale ins remove it first and bring the pool back.
+    assert placement.rejected.max() == 1
+    assert placement.active_hosts[-1] == 1
+    assert placement.report.rejected[0].vdu_id == "Storage-node"
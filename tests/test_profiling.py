@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+import Profiling
+from Generator import SyntheticSpec, generate_vnf
+from VNF import VNF
+
+
+def test_threads_are_all_counted():
+    vnfs = [generate_vnf(SyntheticSpec(num_vdus=5), seed=seed) for seed in range(8)]
+    calls = 200
+
+    def work(vnf):
+        for _ in range(calls):
+            vnf.add_vdu_telemetry("vdu-0", ["disk_read_ops"])
+            vnf.remove_vdu_telemetry("vdu-0", ["disk_read_ops"])
+
+    with Profiling.profiling(trace=True) as profiler:
+        threads = [threading.Thread(target=work, args=(vnf,)) for vnf in vnfs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    timers = profiler.timers
+    assert timers["VNF.add_vdu_telemetry"][1] == calls * len(vnfs)
+    assert timers["VNF.remove_vdu_telemetry"][1] == calls * len(vnfs)
+    traced = sum(1 for event in profiler.events if event[0] == "VNF.add_vdu_telemetry")
+    assert traced == calls * len(vnfs)
+
+
+def test_second_enable_is_refused():
+    original = VNF.load
+    profiler = Profiling.enable()
+    try:
+        with pytest.raises(RuntimeError):
+            Profiling.enable()
+        with pytest.raises(RuntimeError):
+            with Profiling.profiling():
+                pass
+        # the refused sessions left the first one running.
+        assert Profiling.active() is profiler
+        VNF().load({"id": "empty"})
+        assert profiler.timers["VNF.load"][1] == 1
+    finally:
+        assert Profiling.disable() is profiler
+    assert VNF.load is original
+    assert Profiling.active() is None
+    assert Profiling.disable() is None
+
+
+def test_block_leaves_a_later_session_alone():
+    with Profiling.profiling() as first:
+        assert Profiling.disable() is first
+        second = Profiling.enable()
+    try:
+        assert Profiling.active() is second
+    finally:
+        Profiling.disable()
@@ -0,0 +1,280 @@
+from math import log
+
+import numpy as np
+import pytest
+
+from conftest import ROOT, SAMPLE_DESCRIPTORS
+from Descriptor import read_vnfd, read_vnfd_description
+from Simulation import (
+    DEFAULT_LINK_BANDWIDTH,
+    ANALYTIC,
+    DETERMINISTIC,
+    LATENCY_PERCENTILES,
+    SIMULATED,
+    Chain,
+    MonteCarloSummary,
+    NetworkModel,
+    STOPPED,
+    Period,
+    RequestProfile,
+    ScalingModel,
+    Workload,
+    _check_simpy_version,
+    _erlang_c,
+    _response_percentiles,
+    fast_forward,
+    run_many,
+    simulate,
+    steady_state,
+)
+from VDU import INTERFACE_BANDWIDTH, INTERFACE_LATENCY, PARAVIRT, SR_IOV
+from VNF import VNF
+
+
+def _load(path, drop_memory=False, storage_size=None, interface_type=None):
+    description = read_vnfd_description(path)
+    for vdu in description.get("vdu", []):
+        for int_cpd in vdu.get("int-cpd", []):
+            for requirement in int_cpd.get("virtual-network-interface-requirement", []):
+                if interface_type is not None:
+                    requirement["virtual-interface"]["type"] = interface_type
+    for vcd in description.get("virtual-compute-desc", []):
+        if drop_memory:
+            vcd.pop("virtual-memory", None)
+    for vsd in description.get("virtual-storage-desc", []):
+        if storage_size is not None:
+            vsd["size-of-storage"] = storage_size
+    vnf = VNF()
+    vnf.load(description)
+    return vnf
+
+
+@pytest.mark.parametrize("path", SAMPLE_DESCRIPTORS, ids=lambda path: path.name)
+def test_simulate_without_memory_or_disk(path):
+    vnf = _load(path, drop_memory=True, storage_size=0)
+    report = simulate(vnf, Workload(RequestProfile(0.5, 0.2, cpu=1)), 200, seed=1)
+    assert all(vdu.completed > 0 for vdu in report.vdus.values())
+    assert all(vdu.memory_utilization == 0.0 for vdu in report.vdus.values())
+
+    # a request needing memory cannot be served by a VDU without any.
+    with pytest.raises(RuntimeError, match="does not fit in VDU"):
+        simulate(vnf, Workload(RequestProfile(0.5, 0.2, cpu=1, memory=0.5)), 200, seed=1)
+
+
+def test_simulate_leaves_the_vnf_alone():
+    vnf = _load(SAMPLE_DESCRIPTORS[0])
+    simulate(vnf, Workload(RequestProfile(0.5, 0.2, cpu=1)), 100, seed=1)
+    for vdu in vnf.vdus:
+        assert not vdu.initialized
+        assert vdu.virtual_cpu is None and vdu.virtual_interfaces == dict()
+
+
+@pytest.mark.parametrize("version", ["3.0.13", "4.2.0", "5.0"])
+def test_unsupported_simpy_is_refused(version):
+    with pytest.raises(RuntimeError, match="is not supported"):
+        _check_simpy_version(version)
+    for supported in ("4.0.1", "4.1.2"):
+        _check_simpy_version(supported)
+
+
+@pytest.mark.parametrize("servers, offered, p_wait", [(1, 0.5, 0.5), (2, 1.0, 1 / 3), (3, 2.0, 4 / 9)])
+def test_erlang_c(servers, offered, p_wait):
+    assert _erlang_c(servers, offered) == pytest.approx(p_wait)
+
+
+def test_response_percentiles():
+    # the response time of an M/M/1 queue is exponential with rate mu - lambda.
+    percentiles = _response_percentiles(1.0, False, 0.5, 0.5)
+    assert percentiles == pytest.approx([-log(1 - q / 100) / 0.5 for q in LATENCY_PERCENTILES])
+    # without waiting, the response time is the service time.
+    assert _response_percentiles(2.0, False, 0.0, 0.0) == pytest.approx(
+        [-2.0 * log(1 - q / 100) for q in LATENCY_PERCENTILES]
+    )
+    assert _response_percentiles(2.0, True, 0.0, 0.0) == pytest.approx([2.0] * len(LATENCY_PERCENTILES))
+
+
+def test_steady_state_matches_a_long_simulation():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    workload = Workload()
+    # 4 cpus and 16 GiB, an M/M/4 queue at 75% utilization.
+    workload.add("Compute-node", RequestProfile(3.0, 1.0, cpu=1, memory=2))
+    analytic = steady_state(vnf, workload).vdu("Compute-node")
+    simulated = simulate(vnf, workload, 20000, seed=1, sample_interval=None).vdu("Compute-node")
+
+    assert analytic.cpu_utilization == pytest.approx(0.75)
+    assert simulated.cpu_utilization == pytest.approx(analytic.cpu_utilization, rel=0.02)
+    assert simulated.mean_response_time == pytest.approx(analytic.mean_response_time, rel=0.05)
+    assert simulated.latency_p95 == pytest.approx(analytic.latency_p95, rel=0.05)
+    assert simulated.mean_queue_length == pytest.approx(analytic.mean_queue_length, rel=0.1)
+
+    workload.add("Compute-node", RequestProfile(4.0, 1.0, cpu=1))
+    with pytest.raises(RuntimeError, match="overloaded"):
+        steady_state(vnf, workload)
+
+
+def test_fast_forward_simulates_around_a_breach():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    for aspect in list(vnf.df[0].scaling_aspects):
+        vnf.remove_scaling_aspect(aspect.id)
+    vnf.add_vdu_telemetry("Storage-node", ["cpu_utilization"])
+    vnf.addScalingAspect("cpu", 3, "Storage-node", "Storage-node_cpu_utilization", 30, 80, 60, 0, 1)
+
+    def period(rate):
+        workload = Workload()
+        workload.add("Storage-node", RequestProfile(rate, 1.0, cpu=1))
+        return Period(3600, workload)
+
+    # 25% then 95% of the 4 cpus of a single instance, then 25% again.
+    report = fast_forward(
+        vnf, [period(1.0), period(3.8), period(1.0)], ScalingModel(default_boot_time=60), seed=1
+    )
+    segments = report.segments
+    assert report.until == 3 * 3600
+    assert report.analytic_time + report.simulated_time == 3 * 3600
+    assert [segment.start for segment in segments[1:]] == [segment.end for segment in segments[:-1]]
+
+    # the quiet first period is covered at once, the breach is simulated until it scaled out.
+    assert (segments[0].mode, segments[0].end) == (ANALYTIC, 3600)
+    assert (segments[1].mode, segments[1].start) == (SIMULATED, 3600)
+    after = [segment for segment in segments if segment.start > 3600 and segment.mode == ANALYTIC]
+    assert after[0].end == 7200 and after[0].instances["Storage-node"] > 1
+    # the scale in after the load drops is simulated too, the run ends quiet on one instance.
+    assert any(segment.mode == SIMULATED and segment.start >= 7200 for segment in segments)
+    assert segments[-1].mode == ANALYTIC and segments[-1].instances["Storage-node"] == 1
+
+
+def test_run_many_does_not_depend_on_the_workers():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    workload = Workload(RequestProfile(0.5, 0.4, cpu=1, memory=0.5))
+    seeds = list(range(6))
+    summaries = dict()
+    for workers in (1, 2):
+        summary = MonteCarloSummary()
+        reports = list(run_many(vnf, workload, 300, iter(seeds), workers=workers, summary=summary))
+        assert sorted(report.seed for report in reports) == seeds
+        summaries[workers] = summary
+    single, pooled = summaries[1], summaries[2]
+    assert single.runs == pooled.runs == len(seeds)
+    assert single.vdus_id == pooled.vdus_id
+
+    # runs are recorded in completion order, compared by seed they are identical.
+    for vdu_id in single.vdus_id:
+        for metric in MonteCarloSummary.METRICS:
+            by_seed = dict(zip(pooled.seeds, pooled.values(vdu_id, metric)))
+            assert single.values(vdu_id, metric).tolist() == [by_seed[seed] for seed in single.seeds]
+        assert single.percentiles("latency_p95")[vdu_id] == pytest.approx(
+            pooled.percentiles("latency_p95")[vdu_id]
+        )
+
+    # the percentiles are taken across the runs.
+    for vdu_id, percentiles in single.percentiles("cpu_utilization", (0, 50, 100)).items():
+        values = single.values(vdu_id, "cpu_utilization")
+        assert len(values) == len(seeds) and len(set(values)) > 1
+        assert percentiles.tolist() == [values.min(), np.median(values), values.max()]
+
+    with pytest.raises(RuntimeError, match="Unknown metric"):
+        single.values(single.vdus_id[0], "throughput")
+
+
+def test_deterministic_chain_latency():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    service_time, arrival_rate = 0.5, 0.4
+    demand = RequestProfile(1.0, service_time, cpu=1, distribution=DETERMINISTIC)
+    workload = Workload()
+    workload.add_chain(
+        Chain("c", arrival_rate, ["mgmtVM", "dataVM"], demands={"mgmtVM": demand, "dataVM": demand})
+    )
+    report = simulate(vnf, workload, 20000, seed=3, sample_interval=10)
+    first, second, chain = report.vdus["mgmtVM"], report.vdus["dataVM"], report.chains["c"]
+
+    # the single cpu of mgmtVM is an M/D/1 queue, Pollaczek-Khinchine gives its mean wait.
+    load = arrival_rate * service_time
+    wait = load * service_time / (2 * (1 - load))
+    assert first.mean_response_time == pytest.approx(service_time + wait, rel=0.05)
+    assert first.mean_queue_length == pytest.approx(arrival_rate * wait, rel=0.1)
+    # most requests find the queue empty, the tail waits.
+    assert first.latency_p50 == pytest.approx(service_time)
+    assert service_time < first.latency_p95 < first.latency_p99
+
+    # mgmtVM spaces its departures by a service time at least, dataVM never queues.
+    assert second.latency == pytest.approx([service_time] * len(LATENCY_PERCENTILES))
+    assert second.mean_queue_length == 0.0 and not second.queue_length.any()
+    assert len(first.queue_length) == len(second.queue_length) == 20000 / 10
+    assert first.queue_length.max() > 0
+
+    # a chained request spends the response time of mgmtVM, then a service time in dataVM.
+    assert chain.completed == second.completed
+    assert chain.latency == pytest.approx(first.latency + service_time)
+    assert chain.mean_response_time == pytest.approx(first.mean_response_time + service_time)
+
+
+def test_scale_out_boots_and_scale_in_drains():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    for aspect in list(vnf.df[0].scaling_aspects):
+        vnf.remove_scaling_aspect(aspect.id)
+    vnf.add_vdu_telemetry("Storage-node", ["cpu_utilization"])
+    vnf.addScalingAspect("cpu", 1, "Storage-node", "Storage-node_cpu_utilization", 60, 80, 30, 5, 1)
+    # 85% of the 4 cpus of one instance, 42.5% of two, the aspect scales out and in again and again.
+    workload = Workload()
+    workload.add("Storage-node", RequestProfile(3.4, 1.0, cpu=1, distribution=DETERMINISTIC))
+    scaling = ScalingModel(boot_times={"ubuntu20.04": 45}, default_boot_time=5)
+    report = simulate(vnf, workload, 1000, seed=2, scaling=scaling)
+
+    initial, *scaled = [lifecycle for lifecycle in report.instances if lifecycle.vdu_id == "Storage-node"]
+    assert (initial.requested, initial.running, initial.breach) == (0.0, 0.0, None)
+    vdu_report = report.vdus["Storage-node"]
+    assert len(scaled) == vdu_report.scale_outs > 2
+    for lifecycle in scaled:
+        # an instance serves from the end of its boot, the boot time of its image.
+        assert lifecycle.breach <= lifecycle.requested
+        assert lifecycle.running == lifecycle.requested + 45
+    assert vdu_report.scale_out_delay == pytest.approx(
+        np.mean([lifecycle.running - lifecycle.breach for lifecycle in scaled])
+    )
+
+    # a drained instance finishes the requests in flight, at most a service time, then stops.
+    drained = [lifecycle for lifecycle in scaled if lifecycle.state == STOPPED]
+    assert len(drained) == vdu_report.scale_ins > 2
+    assert all(0 <= lifecycle.stopped - lifecycle.draining <= 1.0 for lifecycle in drained)
+    assert any(lifecycle.stopped > lifecycle.draining for lifecycle in drained)
+    # no request is lost, the ones not completed are still served by the 4 cpus.
+    assert 0 <= vdu_report.arrived - vdu_report.completed <= 4
+
+
+def test_interface_type_sets_the_network_latency():
+    payload, service_time = 1e6, 0.01
+    workload = Workload(RequestProfile(0.5, service_time, cpu=1, network=payload, distribution=DETERMINISTIC))
+    reports = dict()
+    for interface_type in (PARAVIRT, SR_IOV):
+        vnf = _load(ROOT / "hackfest_multivdu-vnf_vnfd.yaml", interface_type=interface_type)
+        reports[interface_type] = simulate(vnf, workload, 2000, seed=1)
+        # alone on the link and the interface, a payload crosses both then waits the interface latency.
+        transfer = payload * 8 / DEFAULT_LINK_BANDWIDTH + payload * 8 / INTERFACE_BANDWIDTH[interface_type]
+        for vdu_report in reports[interface_type].vdus.values():
+            assert vdu_report.latency == pytest.approx(
+                [service_time + transfer + INTERFACE_LATENCY[interface_type]] * len(LATENCY_PERCENTILES)
+            )
+    for vdu_id, paravirt in reports[PARAVIRT].vdus.items():
+        sr_iov = reports[SR_IOV].vdus[vdu_id]
+        assert sr_iov.mean_response_time < paravirt.mean_response_time
+        assert sr_iov.network_utilization < paravirt.network_utilization
+        assert sr_iov.throughput == paravirt.throughput
+
+
+def test_shared_link_saturates():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    # the 5 VDUs share the internal link, 4 MB/s.
+    network = NetworkModel(link_bandwidth=32e6)
+    reports = dict()
+    for arrival_rate in (1, 5, 20):
+        workload = Workload(RequestProfile(arrival_rate, 0.01, cpu=1, network=1e5, distribution=DETERMINISTIC))
+        reports[arrival_rate] = simulate(vnf, workload, 200, seed=1, network=network)
+
+    light, loaded, saturated = (reports[rate].links["internal"] for rate in (1, 5, 20))
+    assert light.utilization == pytest.approx(5 * 1 * 1e5 * 8 / 32e6, rel=0.05)
+    assert light.utilization < loaded.utilization < 1
+    # 10 MB/s are offered, the link carries its bandwidth and the requests queue behind it.
+    assert saturated.utilization == pytest.approx(1.0, rel=1e-3)
+    assert saturated.throughput == pytest.approx(4e6, rel=0.01)
+    for vdu_id, vdu_report in reports[20].vdus.items():
+        assert vdu_report.mean_response_time > 100 * reports[1].vdus[vdu_id].mean_response_time
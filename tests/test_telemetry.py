@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from conftest import ROOT
+from Descriptor import read_vnfd
+from Telemetry import Bursty, Diurnal, Replay, Step, TelemetryGenerator
+from VDU import CPU_UTIL
+
+
+def _csv(path, text):
+    path.write_text(text)
+    return path
+
+
+def _generator(tmp_path):
+    generator = TelemetryGenerator(interval=2.0, seed=7)
+    generator.add("diurnal", Diurnal(50, 30, period=600, peak=100, noise=2), CPU_UTIL)
+    generator.add("bursty", Bursty(10, 40, rate=0.05, duration=15, noise=1))
+    generator.add("step", Step([5, 50, 20], [100, 700], noise=0.5))
+    trace = _csv(tmp_path / "trace.csv", "time,value\n" + "".join(f"{i},{i % 7}\n" for i in range(11)))
+    generator.add("replay", Replay(trace, "value", noise=0.1))
+    return generator
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 999])
+def test_output_does_not_depend_on_the_chunk_size(tmp_path, chunk_size):
+    whole = _generator(tmp_path).generate(2000, chunk_size=1000)
+    chunked = _generator(tmp_path).generate(2000, chunk_size=chunk_size)
+    assert list(chunked) == ["diurnal", "bursty", "step", "replay"]
+    for telemetry_id, values in whole.items():
+        assert len(values) == 1000
+        np.testing.assert_array_equal(chunked[telemetry_id], values)
+
+    chunks = list(_generator(tmp_path).chunks(2000, chunk_size))
+    assert len(chunks) == -(-1000 // chunk_size)
+    np.testing.assert_array_equal(np.concatenate([chunk["bursty"] for chunk in chunks]), whole["bursty"])
+
+
+def test_seed_makes_the_streams_reproducible(tmp_path):
+    first = _generator(tmp_path).generate(500)
+    second = _generator(tmp_path).generate(500)
+    for telemetry_id in first:
+        np.testing.assert_array_equal(first[telemetry_id], second[telemetry_id])
+    # the streams of one pattern are independent.
+    generator = TelemetryGenerator(seed=1)
+    pattern = Diurnal(50, 0, noise=5)
+    generator.add("a", pattern)
+    generator.add("b", pattern)
+    traces = generator.generate(100)
+    assert not np.array_equal(traces["a"], traces["b"])
+
+
+def test_replay_with_header(tmp_path):
+    path = _csv(tmp_path / "header.csv", "time,value\n0,1\n1,2\n2,3\n")
+    generator = TelemetryGenerator()
+    generator.add("loop", Replay(path, "value", scale=10))
+    generator.add("hold", Replay(path, "value", loop=False))
+    traces = generator.generate(7, chunk_size=2)
+    np.testing.assert_array_equal(traces["loop"], [10, 20, 30, 10, 20, 30, 10])
+    np.testing.assert_array_equal(traces["hold"], [1, 2, 3, 3, 3, 3, 3])
+
+    generator.add("missing", Replay(path, "other"))
+    with pytest.raises(RuntimeError, match="No column other"):
+        generator.generate(1)
+
+
+def test_replay_by_index(tmp_path):
+    path = _csv(tmp_path / "index.csv", "0,4\n1,5\n")
+    generator = TelemetryGenerator()
+    generator.add("loop", Replay(path, 1))
+    generator.add("hold", Replay(path, 0, loop=False))
+    traces = generator.generate(5)
+    np.testing.assert_array_equal(traces["loop"], [4, 5, 4, 5, 4])
+    np.testing.assert_array_equal(traces["hold"], [0, 1, 1, 1, 1])
+
+    generator.add("empty", Replay(_csv(tmp_path / "empty.csv", ""), 0))
+    with pytest.raises(RuntimeError, match="No values to replay"):
+        generator.generate(1)
+
+
+def test_percentages_are_clipped(tmp_path):
+    generator = TelemetryGenerator(seed=3)
+    pattern = Diurnal(80, 60, period=100, peak=7)
+    generator.add("percent", pattern, CPU_UTIL)
+    generator.add("counter", pattern, "disk_read_ops")
+    traces = generator.generate(1000)
+    assert traces["percent"].max() == 100.0 and traces["percent"].min() == 20.0
+    assert traces["counter"].max() > 100.0
+    # clipping leaves the samples within the range alone.
+    inside = (traces["counter"] > 0) & (traces["counter"] < 100)
+    np.testing.assert_array_equal(traces["percent"][inside], traces["counter"][inside])
+
+    # counters are only bounded below.
+    generator.add("negative", Step([-5, 500], [2]), "disk_read_ops")
+    np.testing.assert_array_equal(generator.generate(4)["negative"], [0, 0, 500, 500])
+
+
+def test_add_vnf():
+    vnf = read_vnfd(str(ROOT / "hackfest_multivdu-vnf_vnfd.yaml"))
+    generator = TelemetryGenerator()
+    with pytest.raises(RuntimeError, match="Unknown performance metric"):
+        generator.add_vnf(vnf, {"cpu_load": Diurnal(50, 30)})
+    assert generator.telemetries_id == []
+
+    generator.add_vnf(vnf, {"disk_read_bytes": Diurnal(50, 30)})
+    expected = [
+        telemetry.id
+        for vdu in vnf.vdus
+        for telemetry in vdu.telemetries
+        if telemetry.performance_metric == "disk_read_bytes"
+    ]
+    assert expected != [] and generator.telemetries_id == expected
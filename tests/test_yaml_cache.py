@@ -0,0 +1,125 @@
+import pickle
+import tracemalloc
+from ipaddress import ip_address
+
+import pytest
+
+from Descriptor import stream_vnfd, yaml_dump
+from Generator import SyntheticSpec, generate_vnf
+
+
+class _NullStream:
+    def write(self, data):
+        pass
+
+
+def _vnf(num_vdus=20):
+    return generate_vnf(SyntheticSpec(num_vdus=num_vdus, num_links=3, num_scaling_aspects=3), seed=1)
+
+
+def _fresh_dump(vnf):
+    # pickled entities drop their caches, the copy is represented from scratch.
+    return yaml_dump(pickle.loads(pickle.dumps(vnf)).yaml_repr())
+
+
+def _entities(vnf):
+    entities = list(vnf.df) + list(vnf.ext_cps) + list(vnf.images)
+    entities += list(vnf.virtual_compute_descriptions) + list(vnf.virtual_storage_descriptions)
+    for df in vnf.df:
+        entities += list(df.vdu_profile) + list(df.scaling_aspects) + list(df.virtual_link_profile)
+    for vdu in vnf.vdus:
+        entities += [vdu] + list(vdu.interfaces) + list(vdu.telemetries)
+    return entities
+
+
+MUTATIONS = {
+    "add_VDU": lambda vnf: vnf.add_VDU(
+        id="new", num_vcpu=1, size_memory=1, size_storage=[1], image=["ubuntu20.04"], int_cps=["vl-0"]
+    ),
+    "add_vdu_telemetry": lambda vnf: vnf.add_vdu_telemetry("vdu-1", ["disk_read_ops"]),
+    "remove_vdu_telemetry": lambda vnf: vnf.remove_vdu_telemetry("vdu-3", ["cpu_utilization"]),
+    "add_ExternalConnectionPoint": lambda vnf: vnf.add_ExternalConnectionPoint(
+        id="ext", vdu_id="vdu-2", vdu_cp="vdu-2_int_0"
+    ),
+    "assign_IP_vdu_interface": lambda vnf: vnf.assign_IP_vdu_interface(
+        "vdu-4", "vdu-4_int_0", ip_address("10.0.1.200")
+    ),
+    "allocate_IP_virtual_link": lambda vnf: vnf.allocate_IP_virtual_link("vl-2"),
+    "add_InternalConnectionPoint": lambda vnf: vnf.add_InternalConnectionPoint(
+        id="vl-9", ip="10.9.0.1", network="10.9.0.0/24"
+    ),
+    "remove_InternalConnectionPoint": lambda vnf: vnf.remove_InternalConnectionPoint("vl-1"),
+    "addScalingAspect": lambda vnf: vnf.addScalingAspect(
+        id="aspect-new",
+        max_scale_level=2,
+        vdu_to_scale="vdu-5",
+        selected_telemetry="vdu-5_cpu_utilization",
+        scale_in_threshold=10,
+        scale_out_threshold=50,
+        cooldown_time=60,
+        threshold_time=10,
+        scale=1,
+    ),
+    "remove_scaling_aspect": lambda vnf: vnf.remove_scaling_aspect("aspect-0"),
+    "add_Image": lambda vnf: vnf.add_Image(id="other", image_filepath="other"),
+    "remove_VDU": lambda vnf: vnf.remove_VDU("vdu-7"),
+}
+
+
+@pytest.mark.parametrize("mutation", MUTATIONS)
+def test_mutation_invalidates_cached_repr(mutation):
+    vnf = _vnf()
+    before = yaml_dump(vnf.yaml_repr())
+    MUTATIONS[mutation](vnf)
+    after = yaml_dump(vnf.yaml_repr())
+    assert after != before
+    assert after == _fresh_dump(vnf)
+
+
+def test_unchanged_entities_keep_their_cache():
+    vnf = _vnf()
+    vnf.yaml_repr()
+    untouched = vnf.get_VDU("vdu-9").yaml_repr()
+    vnf.unassign_IP_vdu_interface("vdu-4", "vdu-4_int_0")
+    vnf.assign_IP_vdu_interface("vdu-4", "vdu-4_int_0", ip_address("10.0.1.201"))
+    assert vnf.get_VDU("vdu-4")._cache is None
+    assert vnf._cache is None
+    vnf.yaml_repr()
+    assert vnf.get_VDU("vdu-9").yaml_repr() is untouched
+
+
+def test_public_lists_are_read_only():
+    vnf = _vnf()
+    vnf.yaml_repr()
+    with pytest.raises(AttributeError):
+        vnf.df[0].scaling_aspects.clear()
+    with pytest.raises(AttributeError):
+        vnf.vdus.append(None)
+    with pytest.raises(TypeError):
+        vnf.get_VDU("vdu-0").interfaces[0] = None
+    assert yaml_dump(vnf.yaml_repr()) == _fresh_dump(vnf)
+
+
+def test_configure_copies_the_given_lists():
+    vnf = _vnf()
+    image = ["ubuntu20.04"]
+    vnf.add_VDU(id="new", num_vcpu=1, size_memory=1, size_storage=[1], image=image, int_cps=["vl-0"])
+    vnf.yaml_repr()
+    image.append("changed")
+    assert list(vnf.get_VDU("new").image) == ["ubuntu20.04"]
+
+
+def test_stream_does_not_fill_the_caches():
+    vnf = _vnf(num_vdus=2000)
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        stream_vnfd(vnf, _NullStream())
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert all(entity._cache is None for entity in _entities(vnf))
+    assert vnf._cache is None
+    # a full representation of 2000 VDUs takes several MB.
+    assert peak - start < 512 * 1024
+    assert current - start < 64 * 1024